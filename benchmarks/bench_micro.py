@@ -0,0 +1,313 @@
+"""
+Micro-benchmarks dos caminhos críticos do domínio e do repositório.
+
+Mede MeetingRoom.is_period_available e from_db, RoomRepository.get, get_all e
+create_reservation, paginate e a emissão/validação de tokens sobre um SQLite
+em arquivo temporário populado pelo gerador sintético (N salas x M reservas,
+com semente fixa).
+
+O resultado é comparado com o arquivo de baseline: um caso cujo melhor tempo
+entre as repetições piora mais que a tolerância, mesmo depois de medido de
+novo, é reportado como regressão e o processo termina com código 1. Use --save
+para gravar o resultado atual como novo baseline.
+
+Uso:
+    PYTHONPATH=src python benchmarks/bench_micro.py
+    PYTHONPATH=src python benchmarks/bench_micro.py --save
+"""
+
+import argparse
+import asyncio
+import gc
+import inspect
+import json
+import platform
+import random
+import statistics
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+from datetime import timedelta
+from itertools import count, cycle
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+from uuid import uuid4
+
+from jose import jwt
+
+from config import DatabaseSettings
+from domain.entities import MeetingRoom
+from domain.models import ReservationCreate
+from domain.observers import ReservationSubject
+from infrastructure.pagination import paginate
+from infrastructure.repositories import RoomRepository
+from infrastructure.security.auth import ALGORITHM, SECRET_KEY, create_access_token
+from infrastructure.sqlite_backend import TunedDatabase
+from synthetic import SyntheticDataset, generate_dataset, seed_database
+
+DEFAULT_BASELINE = Path(__file__).with_name("baseline.json")
+
+# Função medida e quantas chamadas formam uma repetição
+Case = Tuple[Callable[[], object], int]
+
+
+def _summary(timings: List[float], number: int) -> Dict[str, float]:
+    per_op = [timing / number * 1e6 for timing in timings]
+    return {
+        "number": number,
+        "repeat": len(timings),
+        "best_us": round(min(per_op), 3),
+        "median_us": round(statistics.median(per_op), 3),
+    }
+
+
+@contextmanager
+def _gc_paused() -> Iterator[None]:
+    # Como no timeit: uma coleta do gc no meio da medição cobra do caso o
+    # custo de percorrer todo o heap, que depende do que veio antes dele
+    gc.collect()
+    gc.disable()
+    try:
+        yield
+    finally:
+        gc.enable()
+
+
+async def _time_case(func: Callable[[], object], number: int, asynchronous: bool):
+    started = time.perf_counter()
+    if asynchronous:
+        for _ in range(number):
+            await func()
+    else:
+        for _ in range(number):
+            func()
+    return time.perf_counter() - started
+
+
+async def measure(cases: Dict[str, Case], repeat: int) -> Dict:
+    """
+    Mede os casos em rodadas intercaladas: cada rodada executa todos os casos
+    uma vez. Assim as repetições de cada caso se espalham pela execução
+    inteira e o melhor tempo não depende de um trecho ruidoso da máquina
+    """
+    asynchronous = {}
+    for name, (func, _) in cases.items():
+        result = func()
+        asynchronous[name] = inspect.isawaitable(result)
+        if asynchronous[name]:
+            await result
+
+    timings: Dict[str, List[float]] = {name: [] for name in cases}
+    with _gc_paused():
+        for _ in range(repeat):
+            for name, (func, number) in cases.items():
+                timings[name].append(await _time_case(func, number, asynchronous[name]))
+    return {name: _summary(timings[name], cases[name][1]) for name in cases}
+
+
+def domain_cases(
+    dataset: SyntheticDataset, args: argparse.Namespace
+) -> Dict[str, Case]:
+    rng = random.Random(args.seed)
+    room_row = dataset.rooms[0]
+    room_db = type("RoomRow", (), room_row)
+    rows = dataset.reservations_of(room_row["id"])
+    room = MeetingRoom.from_db(room_db, rows)
+
+    first, last = rows[0]["start_time"], rows[-1]["end_time"]
+    span_minutes = int((last - first).total_seconds() // 60)
+    windows = cycle(
+        [
+            (start, start + timedelta(minutes=rng.choice((30, 60, 120))))
+            for start in (
+                first + timedelta(minutes=rng.randrange(span_minutes))
+                for _ in range(1024)
+            )
+        ]
+    )
+
+    rooms = [
+        MeetingRoom(row["name"], row["capacity"], row["location"])
+        for row in dataset.rooms
+    ]
+    token = create_access_token({"sub": "usuario0", "user_id": str(uuid4())})
+    scale = args.scale
+
+    return {
+        "meeting_room.is_period_available": (
+            lambda: room.is_period_available(*next(windows)),
+            int(20000 * scale),
+        ),
+        "meeting_room.from_db": (
+            lambda: MeetingRoom.from_db(room_db, rows),
+            int(50 * scale),
+        ),
+        "pagination.paginate": (
+            lambda: paginate(rooms, page=2, per_page=10),
+            int(2000 * scale),
+        ),
+        "auth.token_encode": (
+            lambda: create_access_token({"sub": "usuario0", "user_id": "1"}),
+            int(2000 * scale),
+        ),
+        "auth.token_decode": (
+            lambda: jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM]),
+            int(2000 * scale),
+        ),
+    }
+
+
+def repository_cases(
+    dataset: SyntheticDataset, args: argparse.Namespace, database: TunedDatabase
+) -> Dict[str, Case]:
+    repository = RoomRepository(database, reservation_subject=ReservationSubject())
+
+    room_ids = cycle([row["id"] for row in dataset.rooms])
+    target_room = dataset.rooms[0]["id"]
+    slots = count()
+    free_from = dataset.last_end_time() + timedelta(days=1)
+    user_id = dataset.users[0]["id"]
+
+    def next_reservation() -> ReservationCreate:
+        start_time = free_from + timedelta(hours=next(slots))
+        return ReservationCreate(
+            room_id=target_room,
+            start_time=start_time,
+            end_time=start_time + timedelta(minutes=30),
+        )
+
+    scale = args.scale
+    return {
+        "room_repository.get": (
+            lambda: repository.get(next(room_ids)),
+            int(50 * scale),
+        ),
+        "room_repository.get_all": (repository.get_all, max(int(3 * scale), 1)),
+        "room_repository.create_reservation": (
+            lambda: repository.create_reservation(next_reservation(), user_id),
+            int(50 * scale),
+        ),
+    }
+
+
+def compare(results: Dict, baseline: Dict, tolerance: float) -> Dict:
+    comparison = {}
+    for name, current in results.items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        # O melhor tempo é o menos sensível a ruído: interferências da máquina
+        # só somam tempo a uma repetição, nunca tiram
+        ratio = current["best_us"] / previous["best_us"]
+        comparison[name] = {
+            "baseline_us": previous["best_us"],
+            "current_us": current["best_us"],
+            "ratio": round(ratio, 3),
+            "regression": ratio > 1 + tolerance,
+        }
+    return comparison
+
+
+async def confirm_regressions(
+    cases: Dict[str, Case], results: Dict, baseline: Dict, args: argparse.Namespace
+) -> None:
+    """
+    Mede de novo os casos acima da tolerância, até args.confirm vezes, e
+    guarda o melhor tempo de todas as tentativas: uma regressão só é
+    reportada se sobreviver às novas medições
+    """
+    for _ in range(args.confirm):
+        suspects = [
+            name
+            for name, entry in compare(results, baseline, args.tolerance).items()
+            if entry["regression"]
+        ]
+        if not suspects:
+            return
+        retried = await measure({name: cases[name] for name in suspects}, args.repeat)
+        for name, summary in retried.items():
+            if summary["best_us"] < results[name]["best_us"]:
+                results[name] = summary
+
+
+def load_baseline(path: Path) -> Optional[Dict]:
+    if not path.exists():
+        return None
+    return json.loads(path.read_text())
+
+
+async def main(args: argparse.Namespace) -> int:
+    dataset = generate_dataset(args.rooms, args.reservations, seed=args.seed)
+
+    with tempfile.TemporaryDirectory() as directory:
+        database_url = f"sqlite:///{Path(directory) / 'bench.db'}"
+        seed_database(database_url, dataset)
+        database = TunedDatabase(
+            database_url, pool_size=4, pragmas=DatabaseSettings().pragmas()
+        )
+        await database.connect()
+        try:
+            cases = {
+                **domain_cases(dataset, args),
+                **repository_cases(dataset, args, database),
+            }
+            results = await measure(cases, args.repeat)
+            baseline = None if args.save else load_baseline(args.baseline)
+            if baseline is not None:
+                await confirm_regressions(cases, results, baseline, args)
+        finally:
+            await database.disconnect()
+
+    report = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "rooms": args.rooms,
+            "reservations_per_room": args.reservations,
+            "seed": args.seed,
+        },
+        "results": results,
+    }
+
+    regressions = []
+    if baseline is not None:
+        report["comparison"] = compare(results, baseline, args.tolerance)
+        regressions = [
+            name for name, entry in report["comparison"].items() if entry["regression"]
+        ]
+        report["regressions"] = regressions
+
+    if args.save:
+        args.baseline.write_text(json.dumps(report, indent=2) + "\n")
+
+    print(json.dumps(report, indent=2))
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--rooms", type=int, default=50)
+    parser.add_argument("--reservations", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--repeat", type=int, default=15)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Multiplicador das iterações"
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.5,
+        help="Piora relativa do melhor tempo aceita antes de acusar regressão",
+    )
+    parser.add_argument(
+        "--confirm",
+        type=int,
+        default=2,
+        help="Novas medições de um caso acima da tolerância antes de reportá-lo",
+    )
+    parser.add_argument(
+        "--save", action="store_true", help="Grava o resultado como novo baseline"
+    )
+    sys.exit(asyncio.run(main(parser.parse_args())))
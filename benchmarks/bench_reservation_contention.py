@@ -0,0 +1,115 @@
+"""
+Benchmark de contenção na criação de reservas.
+
+Compara a vazão de RoomRepository.create_reservation com um único lock global
+(1 shard) e com a tabela de locks por sala, disparando reservas concorrentes
+para uma mesma sala e para salas distintas.
+
+Em um único processo o event loop roda em um núcleo: quando o caminho da
+reserva é limitado por CPU, salas distintas só ganham do cenário de uma sala
+na parte de espera por E/S. A escala entre processos vem de mais workers.
+
+Uso:
+    PYTHONPATH=src python benchmarks/bench_reservation_contention.py --requests 200
+"""
+
+import argparse
+import asyncio
+import json
+import tempfile
+import time
+from datetime import datetime, timedelta
+from pathlib import Path
+from uuid import uuid4
+
+from sqlalchemy import create_engine
+
+from config import DatabaseSettings
+from domain.entities import MeetingRoom
+from domain.models import ReservationCreate
+from domain.observers import ReservationSubject
+from infrastructure.locks import ShardedLockTable
+from infrastructure.models import Base
+from infrastructure.repositories import RoomRepository
+from infrastructure.sqlite_backend import TunedDatabase
+
+
+async def run_scenario(
+    database_url: str, rooms: int, requests: int, concurrency: int, shards: int
+) -> dict:
+    settings = DatabaseSettings(url=database_url)
+    database = TunedDatabase(
+        database_url, pool_size=concurrency, pragmas=settings.pragmas()
+    )
+    await database.connect()
+    repository = RoomRepository(
+        database,
+        reservation_subject=ReservationSubject(),
+        room_locks=ShardedLockTable(shards),
+    )
+
+    room_ids = []
+    for index in range(rooms):
+        room = MeetingRoom(name=f"Sala {index}", capacity=10, location="Bench")
+        await repository.add(room)
+        room_ids.append(room.id)
+
+    base = datetime.now().replace(microsecond=0) + timedelta(days=1)
+    reservations = [
+        ReservationCreate(
+            room_id=room_ids[index % rooms],
+            start_time=base + timedelta(hours=index),
+            end_time=base + timedelta(hours=index, minutes=30),
+        )
+        for index in range(requests)
+    ]
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def book(reservation: ReservationCreate) -> None:
+        async with semaphore:
+            await repository.create_reservation(reservation, uuid4())
+
+    started = time.perf_counter()
+    await asyncio.gather(*(book(reservation) for reservation in reservations))
+    elapsed = time.perf_counter() - started
+
+    await database.disconnect()
+    return {
+        "rooms": rooms,
+        "shards": shards,
+        "requests": requests,
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 4),
+        "throughput_per_second": round(requests / elapsed, 1),
+    }
+
+
+async def main(args: argparse.Namespace) -> None:
+    results = []
+    with tempfile.TemporaryDirectory() as directory:
+        for rooms in (1, args.rooms):
+            for shards in (1, args.shards):
+                path = Path(directory) / f"bench_{rooms}_{shards}.db"
+                engine = create_engine(f"sqlite:///{path}")
+                Base.metadata.create_all(engine)
+                engine.dispose()
+                results.append(
+                    await run_scenario(
+                        f"sqlite:///{path}",
+                        rooms,
+                        args.requests,
+                        args.concurrency,
+                        shards,
+                    )
+                )
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--rooms", type=int, default=32)
+    parser.add_argument("--concurrency", type=int, default=32)
+    parser.add_argument("--shards", type=int, default=64)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,99 @@
+"""
+Benchmark de hidratação de salas com histórico grande de reservas.
+
+Compara o MeetingRoom.from_db atual (registros compactos com __slots__ e
+índice construído em lote) com a representação anterior, em que cada reserva
+virava um dict com dois UUIDs inserido um a um no índice. Mede o tempo e a
+memória alocada por reserva.
+
+Uso:
+    PYTHONPATH=src python benchmarks/bench_room_hydration.py --reservations 20000
+"""
+
+import argparse
+import json
+import time
+import tracemalloc
+from bisect import insort
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+from typing import Callable, List
+from uuid import UUID, uuid4
+
+from domain.entities import MeetingRoom
+
+
+def build_rows(count: int) -> List[dict]:
+    base = datetime(2030, 1, 1, 8)
+    return [
+        {
+            "id": str(uuid4()),
+            "user_id": str(uuid4()),
+            "start_time": base + timedelta(hours=index),
+            "end_time": base + timedelta(hours=index, minutes=30),
+        }
+        for index in range(count)
+    ]
+
+
+def legacy_hydrate(room_db, rows: List[dict]) -> list:
+    entries, ends = [], []
+    for sequence, res in enumerate(rows):
+        reservation = {
+            "id": UUID(res["id"]),
+            "user_id": UUID(res["user_id"]),
+            "start_time": res["start_time"],
+            "end_time": res["end_time"],
+        }
+        insort(entries, (reservation["start_time"], sequence, reservation))
+        insort(ends, reservation["end_time"])
+    return entries
+
+
+def measure(hydrate: Callable, room_db, rows: List[dict], repeat: int) -> dict:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        hydrate(room_db, rows)
+        timings.append(time.perf_counter() - started)
+
+    tracemalloc.start()
+    room = hydrate(room_db, rows)
+    retained, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del room
+
+    best = min(timings)
+    return {
+        "seconds": round(best, 4),
+        "microseconds_per_reservation": round(best / len(rows) * 1e6, 3),
+        "bytes_per_reservation": round(retained / len(rows), 1),
+    }
+
+
+def main(args: argparse.Namespace) -> None:
+    rows = build_rows(args.reservations)
+    room_db = SimpleNamespace(
+        id=str(uuid4()), name="Sala", capacity=10, location="Bench"
+    )
+
+    legacy = measure(legacy_hydrate, room_db, rows, args.repeat)
+    current = measure(MeetingRoom.from_db, room_db, rows, args.repeat)
+    print(
+        json.dumps(
+            {
+                "reservations": args.reservations,
+                "legacy_dict": legacy,
+                "slotted_record": current,
+                "speedup": round(legacy["seconds"] / current["seconds"], 2),
+            },
+            indent=2,
+        )
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--reservations", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    main(parser.parse_args())
@@ -0,0 +1,356 @@
+"""
+Teste de carga HTTP da API com percentis de latência por endpoint.
+
+Popula um SQLite temporário com o gerador sintético, sobe main:app com
+uvicorn e dispara uma mistura configurável de register/login/listagem de
+salas/disponibilidade/criação/cancelamento a partir de vários clientes httpx
+assíncronos concorrentes. Reporta em JSON a vazão e os percentis p50/p95/p99
+por endpoint, além das taxas de erro e de conflito (409).
+
+Uso:
+    PYTHONPATH=src python benchmarks/loadtest.py --clients 32 --duration 20
+    PYTHONPATH=src python benchmarks/loadtest.py --workers 4 \\
+        --mix list_rooms=40,availability=30,create=20,cancel=10 \\
+        --env SQLITE_SYNCHRONOUS=FULL
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import socket
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from datetime import timedelta
+from pathlib import Path
+from typing import Dict, List, Optional
+
+import httpx
+
+from infrastructure.security.auth import hash_password
+from synthetic import SyntheticDataset, generate_dataset, seed_database
+
+SRC_PATH = Path(__file__).resolve().parent.parent / "src"
+DEFAULT_MIX = "register=2,login=3,list_rooms=30,availability=35,create=20,cancel=10"
+PASSWORD = "senha-carga"
+
+
+def parse_mix(mix: str) -> Dict[str, int]:
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        if name not in OPERATIONS:
+            raise SystemExit(f"Operação desconhecida na mistura: {name}")
+        weights[name] = int(weight)
+    return weights
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+class Recorder:
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self.failures: Dict[str, int] = defaultdict(int)
+
+    def record(self, endpoint: str, elapsed: float, status: Optional[int]) -> None:
+        self.latencies[endpoint].append(elapsed)
+        if status is None:
+            self.failures[endpoint] += 1
+        else:
+            self.statuses[endpoint][status] += 1
+
+    def report(self, duration: float) -> Dict:
+        endpoints = {}
+        total = 0
+        for endpoint, latencies in sorted(self.latencies.items()):
+            count = len(latencies)
+            total += count
+            statuses = self.statuses[endpoint]
+            errors = self.failures[endpoint] + sum(
+                amount
+                for status, amount in statuses.items()
+                if status >= 400 and status != 409
+            )
+            endpoints[endpoint] = {
+                "requests": count,
+                "throughput_per_second": round(count / duration, 1),
+                "p50_ms": round(percentile(latencies, 0.50) * 1000, 2),
+                "p95_ms": round(percentile(latencies, 0.95) * 1000, 2),
+                "p99_ms": round(percentile(latencies, 0.99) * 1000, 2),
+                "error_rate": round(errors / count, 4),
+                "conflict_rate": round(statuses.get(409, 0) / count, 4),
+                "statuses": {
+                    str(status): amount for status, amount in statuses.items()
+                },
+            }
+        return {
+            "duration_seconds": round(duration, 2),
+            "requests": total,
+            "throughput_per_second": round(total / duration, 1),
+            "endpoints": endpoints,
+        }
+
+
+class LoadClient:
+    """Um cliente virtual: sessão httpx própria, token próprio e suas reservas"""
+
+    def __init__(
+        self,
+        index: int,
+        http: httpx.AsyncClient,
+        dataset: SyntheticDataset,
+        recorder: Recorder,
+        seed: int,
+    ):
+        self.index = index
+        self.http = http
+        self.dataset = dataset
+        self.recorder = recorder
+        self.rng = random.Random(seed + index)
+        self.username = dataset.users[index % len(dataset.users)]["username"]
+        self.headers: Dict[str, str] = {}
+        self.created: List[str] = []
+        self.registered = 0
+
+    async def request(self, endpoint: str, method: str, url: str, **kwargs):
+        started = time.perf_counter()
+        try:
+            response = await self.http.request(method, url, **kwargs)
+        except httpx.HTTPError:
+            self.recorder.record(endpoint, time.perf_counter() - started, None)
+            return None
+        self.recorder.record(
+            endpoint, time.perf_counter() - started, response.status_code
+        )
+        return response
+
+    async def register(self) -> None:
+        self.registered += 1
+        await self.request(
+            "register",
+            "POST",
+            "/auth/register",
+            json={
+                "username": f"carga{self.index}-{self.registered}",
+                "password": PASSWORD,
+            },
+        )
+
+    async def login(self) -> None:
+        response = await self.request(
+            "login",
+            "POST",
+            "/auth/token",
+            json={"username": self.username, "password": PASSWORD},
+        )
+        if response is not None and response.status_code == 200:
+            token = response.json()["access_token"]
+            self.headers = {"Authorization": f"Bearer {token}"}
+
+    async def list_rooms(self) -> None:
+        pages = max(len(self.dataset.rooms) // 20, 1)
+        await self.request(
+            "list_rooms",
+            "GET",
+            "/rooms/",
+            params={"page": self.rng.randint(1, pages), "per_page": 20},
+        )
+
+    async def availability(self) -> None:
+        start_time = self._random_slot(self.dataset.last_end_time())
+        await self.request(
+            "availability",
+            "GET",
+            f"/rooms/{self.rng.choice(self.dataset.rooms)['id']}/availability",
+            params={
+                "start_time": start_time.isoformat(),
+                "end_time": (start_time + timedelta(hours=1)).isoformat(),
+            },
+        )
+
+    async def create(self) -> None:
+        start_time = self._random_slot(self.dataset.last_end_time() + timedelta(days=1))
+        response = await self.request(
+            "create",
+            "POST",
+            "/reservation/",
+            headers=self.headers,
+            json={
+                "room_id": self.rng.choice(self.dataset.rooms)["id"],
+                "start_time": start_time.isoformat(),
+                "end_time": (start_time + timedelta(hours=1)).isoformat(),
+            },
+        )
+        if response is not None and response.status_code == 201:
+            self.created.append(response.json()["id"])
+
+    async def cancel(self) -> None:
+        if not self.created:
+            await self.create()
+            return
+        reservation_id = self.created.pop(self.rng.randrange(len(self.created)))
+        await self.request(
+            "cancel", "DELETE", f"/reservation/{reservation_id}", headers=self.headers
+        )
+
+    def _random_slot(self, until):
+        # Sorteia dentro de um mês, em passos de uma hora: gera conflitos reais
+        return until - timedelta(days=30) + timedelta(hours=self.rng.randrange(30 * 24))
+
+    async def run(self, weights: Dict[str, int], deadline: float) -> None:
+        await self.login()
+        names, values = list(weights), list(weights.values())
+        while time.perf_counter() < deadline:
+            operation = self.rng.choices(names, values)[0]
+            await getattr(self, operation)()
+
+
+OPERATIONS = ("register", "login", "list_rooms", "availability", "create", "cancel")
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def prepare_database(directory: Path, args: argparse.Namespace) -> SyntheticDataset:
+    dataset = generate_dataset(
+        args.rooms, args.reservations, users=args.users, seed=args.seed
+    )
+    hashed = hash_password(PASSWORD)
+    for user in dataset.users:
+        user["password"] = hashed
+    seed_database(f"sqlite:///{directory / 'carga.db'}", dataset)
+    return dataset
+
+
+def start_server(directory: Path, port: int, args: argparse.Namespace):
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(SRC_PATH),
+        "DATABASE_URL": f"sqlite:///{directory / 'carga.db'}",
+    }
+    for item in args.env:
+        name, _, value = item.partition("=")
+        env[name] = value
+
+    return subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "uvicorn",
+            "main:app",
+            "--host",
+            "127.0.0.1",
+            "--port",
+            str(port),
+            "--workers",
+            str(args.workers),
+            "--log-level",
+            "warning",
+            "--no-access-log",
+        ],
+        cwd=directory,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=None if args.verbose else subprocess.DEVNULL,
+    )
+
+
+async def wait_until_ready(base_url: str, timeout: float = 30.0) -> None:
+    deadline = time.perf_counter() + timeout
+    async with httpx.AsyncClient(base_url=base_url) as http:
+        while time.perf_counter() < deadline:
+            try:
+                if (
+                    await http.get("/rooms/", params={"per_page": 1})
+                ).status_code == 200:
+                    return
+            except httpx.HTTPError:
+                pass
+            await asyncio.sleep(0.2)
+    raise RuntimeError("Servidor não respondeu a tempo")
+
+
+async def drive(
+    base_url: str, dataset: SyntheticDataset, args: argparse.Namespace
+) -> Dict:
+    weights = parse_mix(args.mix)
+    recorder = Recorder()
+    limits = httpx.Limits(max_connections=1, max_keepalive_connections=1)
+
+    async def run_client(index: int) -> None:
+        async with httpx.AsyncClient(
+            base_url=base_url, limits=limits, timeout=args.timeout
+        ) as http:
+            client = LoadClient(index, http, dataset, recorder, args.seed)
+            await client.run(weights, deadline)
+
+    started = time.perf_counter()
+    deadline = started + args.duration
+    await asyncio.gather(*(run_client(index) for index in range(args.clients)))
+    return recorder.report(time.perf_counter() - started)
+
+
+async def main(args: argparse.Namespace) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        directory = Path(tmp)
+        dataset = prepare_database(directory, args)
+        port = free_port()
+        base_url = f"http://127.0.0.1:{port}"
+
+        server = start_server(directory, port, args)
+        try:
+            await wait_until_ready(base_url)
+            report = await drive(base_url, dataset, args)
+        finally:
+            server.terminate()
+            server.wait(timeout=30)
+
+    report["config"] = {
+        "clients": args.clients,
+        "workers": args.workers,
+        "rooms": args.rooms,
+        "reservations_per_room": args.reservations,
+        "users": args.users,
+        "seed": args.seed,
+        "mix": parse_mix(args.mix),
+        "env": args.env,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    print(output)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--clients", type=int, default=16)
+    parser.add_argument("--duration", type=float, default=15.0, help="Segundos")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--rooms", type=int, default=50)
+    parser.add_argument("--reservations", type=int, default=200)
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--mix", default=DEFAULT_MIX)
+    parser.add_argument("--timeout", type=float, default=30.0)
+    parser.add_argument(
+        "--env",
+        action="append",
+        default=[],
+        metavar="NOME=VALOR",
+        help="Variável de ambiente repassada ao servidor (pode repetir)",
+    )
+    parser.add_argument("--output", help="Grava o relatório JSON neste arquivo")
+    parser.add_argument("--verbose", action="store_true")
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,30 @@
+from fastapi import Request
+from infrastructure.metrics import ComponentStats
+from infrastructure.repositories import RoomRepository, UserRepository
+from infrastructure.response_cache import ResponseCache
+from infrastructure.security import PasswordHasher
+from infrastructure.versions import VersionTable
+
+
+def get_room_repository(request: Request) -> RoomRepository:
+    return request.app.state.room_repository
+
+
+def get_user_repository(request: Request) -> UserRepository:
+    return request.app.state.user_repository
+
+
+def get_versions(request: Request) -> VersionTable:
+    return request.app.state.versions
+
+
+def get_response_cache(request: Request) -> ResponseCache:
+    return request.app.state.response_cache
+
+
+def get_password_hasher(request: Request) -> PasswordHasher:
+    return request.app.state.password_hasher
+
+
+def get_component_stats(request: Request) -> ComponentStats:
+    return request.app.state.component_stats
@@ -3,6 +3,7 @@ from fastapi import APIRouter
 from .rooms_routes import router as rooms_router
 from .reservations_routes import router as reservations_router
 from .auth_routes import router as auth_router
+from .metrics_routes import router as metrics_router
 
 reservations_router.include_in_openapi = True
 reservations_router.swagger_extra = {
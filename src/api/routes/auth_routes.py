@@ -1,14 +1,10 @@
-from infrastructure.security import (
-    create_access_token,
-    verify_password,
-)
+from infrastructure.security import create_access_token, PasswordHasher
 from domain.models import UserCreate
-from infrastructure.database import database
-from fastapi import APIRouter, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, status
 from infrastructure.repositories import UserRepository
+from api.dependencies import get_password_hasher, get_user_repository
 
 router = APIRouter()
-user_repository = UserRepository(database=database)
 
 
 @router.post(
@@ -16,14 +12,20 @@ user_repository = UserRepository(database=database)
     summary="Gerar token de acesso",
     response_description="Token gerado com sucesso",
 )
-async def login(user: UserCreate) -> dict:
+async def login(
+    user: UserCreate,
+    user_repository: UserRepository = Depends(get_user_repository),
+    password_hasher: PasswordHasher = Depends(get_password_hasher),
+) -> dict:
     """
     Gera um token de acesso para o usuário com as credenciais fornecidas
     - **username**: Nome de usuário
     - **password**: Senha
     """
     credentials = await user_repository.get_by_username(user.username)
-    if not credentials or not verify_password(user.password, credentials.password):
+    if not credentials or not await password_hasher.verify(
+        user.password, credentials.password
+    ):
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Credenciais inválidas",
@@ -41,7 +43,10 @@ async def login(user: UserCreate) -> dict:
     summary="Registrar novo usuário",
     response_description="Usuário registrado com sucesso",
 )
-async def register(user: UserCreate) -> dict:
+async def register(
+    user: UserCreate,
+    user_repository: UserRepository = Depends(get_user_repository),
+) -> dict:
     """
     Registra um novo usuário com as credenciais fornecidas
     - **username**: Nome de usuário
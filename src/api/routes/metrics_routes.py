@@ -0,0 +1,17 @@
+from fastapi import APIRouter, Depends
+from fastapi.responses import PlainTextResponse
+from api.dependencies import get_component_stats
+from infrastructure.metrics import ComponentStats, registry
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics(
+    component_stats: ComponentStats = Depends(get_component_stats),
+) -> PlainTextResponse:
+    """Métricas da aplicação no formato texto do Prometheus"""
+    return PlainTextResponse(
+        registry.render(extra=(component_stats,)),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
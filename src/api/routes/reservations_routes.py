@@ -1,7 +1,9 @@
 from uuid import UUID
-from fastapi import APIRouter, HTTPException, status, Depends
+from datetime import datetime
+from fastapi import APIRouter, HTTPException, Query, status, Depends
 from domain.models import (
     ReservationCreate,
+    ReservationBulkCreate,
 )
 from domain.exceptions import (
     RoomNotFoundException,
@@ -9,11 +11,10 @@ from domain.exceptions import (
     ReservationConflictException,
 )
 from infrastructure.repositories import RoomRepository
-from infrastructure.database import database
 from infrastructure.security import get_current_user
+from api.dependencies import get_room_repository
 
 router = APIRouter()
-room_repository = RoomRepository(database=database)
 
 
 @router.post(
@@ -25,6 +26,7 @@ room_repository = RoomRepository(database=database)
 async def create_reservation(
     reservation: ReservationCreate,
     current_user: dict = Depends(get_current_user),
+    room_repository: RoomRepository = Depends(get_room_repository),
 ) -> dict:
     """
     Cria uma nova reserva de sala com as seguintes informações:
@@ -32,8 +34,16 @@ async def create_reservation(
     - **user_id**: ID do usuário
     - **start_time**: Data/hora de início
     - **end_time**: Data/hora de término
+    - **recurrence**: opcional; repete a reserva com **frequency** (daily,
+      weekly ou monthly), **interval**, **until** ou **count** e as datas em
+      **exceptions**. A série é criada inteira ou recusada com 409
     """
     try:
+        if reservation.recurrence is not None:
+            return await room_repository.create_reservation_series(
+                reservation, current_user["user_id"]
+            )
+
         reservation_id = await room_repository.create_reservation(
             reservation, current_user["user_id"]
         )
@@ -52,6 +62,35 @@ async def create_reservation(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.post(
+    "/bulk",
+    status_code=status.HTTP_200_OK,
+    summary="Criar reservas em lote",
+    response_description="Resultado do processamento de cada reserva do lote",
+)
+async def create_reservations_bulk(
+    payload: ReservationBulkCreate,
+    current_user: dict = Depends(get_current_user),
+    room_repository: RoomRepository = Depends(get_room_repository),
+) -> dict:
+    """
+    Cria várias reservas em uma única requisição
+    - **reservations**: lista de reservas com **room_id**, **start_time** e **end_time**
+
+    Cada item do resultado traz o **index** da reserva no lote e um **status**
+    equivalente ao da criação individual (201, 404 ou 409)
+    """
+    results = await room_repository.create_reservations_bulk(
+        payload.reservations, current_user["user_id"]
+    )
+    created = sum(1 for result in results if result["status"] == 201)
+    return {
+        "created": created,
+        "failed": len(results) - created,
+        "results": results,
+    }
+
+
 @router.delete(
     "/{reservation_id}",
     status_code=status.HTTP_204_NO_CONTENT,
@@ -61,6 +100,7 @@ async def create_reservation(
 async def delete_reservation(
     reservation_id: UUID,
     current_user: dict = Depends(get_current_user),
+    room_repository: RoomRepository = Depends(get_room_repository),
 ) -> None:
     """
     Cancela uma reserva existente ***(só pode cancelar suas próprias reservas)***
@@ -76,3 +116,56 @@ async def delete_reservation(
         await room_repository.delete_reservation(reservation_id)
     except ReservationNotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.get(
+    "/series/{series_id}",
+    status_code=status.HTTP_200_OK,
+    summary="Consultar reserva recorrente",
+    response_description="Regra da série e uma página das ocorrências",
+)
+async def get_reservation_series(
+    series_id: UUID,
+    after: datetime | None = Query(
+        None, description="Lista as ocorrências que começam depois deste horário"
+    ),
+    limit: int = Query(100, ge=1, le=500, description="Número máximo de ocorrências"),
+    current_user: dict = Depends(get_current_user),
+    room_repository: RoomRepository = Depends(get_room_repository),
+) -> dict:
+    """
+    Retorna a regra de recorrência e as ocorrências ativas da série, em
+    páginas: use **next_after** como **after** para a próxima página
+    """
+    try:
+        return await room_repository.get_series(series_id, after=after, limit=limit)
+    except ReservationNotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+
+@router.delete(
+    "/series/{series_id}",
+    status_code=status.HTTP_204_NO_CONTENT,
+    summary="Cancelar reserva recorrente",
+    response_description="Série cancelada com sucesso",
+)
+async def delete_reservation_series(
+    series_id: UUID,
+    current_user: dict = Depends(get_current_user),
+    room_repository: RoomRepository = Depends(get_room_repository),
+) -> None:
+    """
+    Cancela todas as ocorrências de uma série ***(só pode cancelar suas próprias
+    reservas)***
+    - **series_id**: ID da série
+    """
+    try:
+        series = await room_repository.get_series(series_id, limit=1)
+        if str(series["user_id"]) != current_user["user_id"]:
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN,
+                detail="Usuário não tem permissão para cancelar a reserva",
+            )
+        await room_repository.delete_series(series_id)
+    except ReservationNotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
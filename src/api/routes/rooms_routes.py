@@ -1,7 +1,8 @@
 from uuid import UUID
-from typing import List
-from datetime import datetime
-from fastapi import APIRouter, Query, HTTPException, status
+from typing import List, Literal
+from datetime import datetime, time, timedelta
+from fastapi import APIRouter, Depends, Query, HTTPException, Request, Response, status
+from fastapi.responses import StreamingResponse
 from domain.entities import MeetingRoom
 from domain.models import (
     RoomCreate,
@@ -11,10 +12,18 @@ from domain.exceptions import (
     RoomNotFoundException,
 )
 from infrastructure.repositories import RoomRepository
-from infrastructure.database import database
+from api.dependencies import get_room_repository, get_versions, get_response_cache
+from infrastructure.pagination import (
+    PaginatedResponse,
+    paginate_keyset,
+    decode_cursor,
+)
+from infrastructure.export import EXPORT_MEDIA_TYPES, EXPORT_STREAMERS
+from infrastructure.versions import VersionTable, conditional_response
+from infrastructure.response_cache import ResponseCache, dumps, json_response
 
 router = APIRouter()
-room_repository = RoomRepository(database=database)
+RESERVATION_EXPORT_FIELDS = ("id", "user_id", "start_time", "end_time")
 
 
 @router.post(
@@ -24,7 +33,10 @@ room_repository = RoomRepository(database=database)
     summary="Criar nova sala",
     response_description="Sala criada com sucesso",
 )
-async def create_room(room_data: RoomCreate) -> MeetingRoom:
+async def create_room(
+    room_data: RoomCreate,
+    room_repository: RoomRepository = Depends(get_room_repository),
+) -> MeetingRoom:
     """
     Cria uma nova sala de reunião com as seguintes informações:
     - **name**: Nome da sala
@@ -45,17 +57,114 @@ async def create_room(room_data: RoomCreate) -> MeetingRoom:
 
 @router.get(
     "/",
-    response_model=List[RoomResponse],
+    response_model=PaginatedResponse[RoomResponse],
     status_code=status.HTTP_200_OK,
     summary="Listar todas as salas",
     response_description="Lista de salas retornadas com sucesso",
 )
 async def list_rooms(
-    page: int = Query(1, description="Número da página"),
-    per_page: int = Query(10, description="Número de itens por página"),
-) -> MeetingRoom:
-    """Retorna a lista de todas as salas cadastradas"""
-    return await room_repository.get_all()
+    request: Request,
+    response: Response,
+    page: int = Query(1, ge=1, description="Número da página"),
+    per_page: int = Query(10, ge=1, le=100, description="Número de itens por página"),
+    cursor: str | None = Query(
+        None, description="Cursor retornado em next_cursor pela página anterior"
+    ),
+    include_total: bool = Query(True, description="Incluir a contagem total de salas"),
+    room_repository: RoomRepository = Depends(get_room_repository),
+    versions: VersionTable = Depends(get_versions),
+    response_cache: ResponseCache = Depends(get_response_cache),
+) -> PaginatedResponse:
+    """
+    Retorna as salas cadastradas de forma paginada
+    - **cursor**: quando informado, tem precedência sobre **page** e evita OFFSET
+    - **include_total**: desabilite para não executar a contagem de salas
+
+    Responde 304 sem consultar o banco quando o If-None-Match confere com o
+    ETag atual do catálogo
+    """
+    etag = versions.catalog_etag(request.url.query)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified is not None:
+        return not_modified
+
+    cache_key = f"rooms?{request.url.query}"
+    body = response_cache.get(cache_key, etag)
+    if body is not None:
+        return json_response(body, dict(response.headers))
+
+    try:
+        after = decode_cursor(cursor) if cursor is not None else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    rooms = await room_repository.get_page(
+        per_page + 1, after=after, offset=(page - 1) * per_page
+    )
+    total = await room_repository.count() if include_total else None
+    result = paginate_keyset(
+        [RoomResponse.model_validate(room) for room in rooms],
+        per_page,
+        key=lambda room: str(room.id),
+        page=page,
+        total=total,
+    )
+    body = dumps(result.model_dump(mode="json"))
+    response_cache.put(cache_key, etag, body)
+    return json_response(body, dict(response.headers))
+
+
+@router.get(
+    "/available",
+    response_model=PaginatedResponse[RoomResponse],
+    status_code=status.HTTP_200_OK,
+    summary="Buscar salas livres",
+    response_description="Salas livres no período informado",
+)
+async def search_available_rooms(
+    start_time: datetime = Query(
+        ..., description="Data/hora de início (YYYY-MM-DDTHH:MM:SS)"
+    ),
+    end_time: datetime = Query(
+        ..., description="Data/hora de término (YYYY-MM-DDTHH:MM:SS)"
+    ),
+    capacity: int | None = Query(None, ge=1, description="Capacidade mínima"),
+    location: str | None = Query(None, description="Localização da sala"),
+    per_page: int = Query(10, ge=1, le=100, description="Número de itens por página"),
+    cursor: str | None = Query(
+        None, description="Cursor retornado em next_cursor pela página anterior"
+    ),
+    room_repository: RoomRepository = Depends(get_room_repository),
+) -> PaginatedResponse:
+    """
+    Retorna as salas sem nenhuma reserva no período, com filtros opcionais de
+    capacidade mínima e localização, paginadas por cursor: enquanto houver
+    mais salas livres a resposta traz **next_cursor**
+    """
+    if end_time <= start_time:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Data de fim deve ser maior que a data de início",
+        )
+
+    try:
+        after = decode_cursor(cursor) if cursor is not None else None
+    except ValueError as e:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+    rooms = await room_repository.find_available(
+        start_time,
+        end_time,
+        min_capacity=capacity,
+        location=location,
+        limit=per_page + 1,
+        after=after,
+    )
+    return paginate_keyset(
+        [RoomResponse.model_validate(room) for room in rooms],
+        per_page,
+        key=lambda room: str(room.id),
+    )
 
 
 @router.get(
@@ -72,6 +181,7 @@ async def get_room_availability(
     end_time: datetime = Query(
         ..., description="Data/hora de término (YYYY-MM-DDTHH:MM:SS)"
     ),
+    room_repository: RoomRepository = Depends(get_room_repository),
 ) -> dict:
     """
     Verifica a disponibilidade de uma sala para um período específico
@@ -83,8 +193,9 @@ async def get_room_availability(
                 detail="Data de fim deve ser maior que a data de início",
             )
 
-        room = await room_repository.get(room_id)
-        is_available = room.check_availability(start_time, end_time)
+        is_available = await room_repository.is_period_available(
+            room_id, start_time, end_time
+        )
 
         return {
             "room_id": room_id,
@@ -99,6 +210,72 @@ async def get_room_availability(
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
 
 
+@router.get(
+    "/{room_id}/free-slots",
+    status_code=status.HTTP_200_OK,
+    summary="Listar horários livres da sala",
+    response_description="Intervalos livres da sala no período",
+)
+async def list_room_free_slots(
+    room_id: UUID,
+    start_time: datetime = Query(
+        ..., description="Data/hora de início (YYYY-MM-DDTHH:MM:SS)"
+    ),
+    end_time: datetime = Query(
+        ..., description="Data/hora de término (YYYY-MM-DDTHH:MM:SS)"
+    ),
+    min_minutes: int | None = Query(
+        None, ge=1, description="Duração mínima de cada intervalo em minutos"
+    ),
+    business_start: time | None = Query(
+        None, description="Início do horário comercial (HH:MM)"
+    ),
+    business_end: time | None = Query(
+        None, description="Fim do horário comercial (HH:MM)"
+    ),
+    room_repository: RoomRepository = Depends(get_room_repository),
+) -> dict:
+    """
+    Calcula os intervalos livres da sala no período, opcionalmente limitados
+    ao horário comercial de cada dia e a uma duração mínima
+    """
+    if end_time <= start_time:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Data de fim deve ser maior que a data de início",
+        )
+    if (business_start is None) != (business_end is None):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Informe o início e o fim do horário comercial",
+        )
+    if business_start is not None and business_end <= business_start:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Fim do horário comercial deve ser maior que o início",
+        )
+
+    try:
+        room = await room_repository.get_in_window(room_id, start_time, end_time)
+    except RoomNotFoundException as e:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    free_slots = room.get_free_slots(
+        start_time,
+        end_time,
+        min_duration=timedelta(minutes=min_minutes) if min_minutes else None,
+        business_hours=(
+            (business_start, business_end) if business_start is not None else None
+        ),
+    )
+    return {
+        "room_id": room_id,
+        "start_time": start_time,
+        "end_time": end_time,
+        "free_slots": free_slots,
+    }
+
+
 @router.get(
     "/{room_id}/reservations",
     status_code=status.HTTP_200_OK,
@@ -106,25 +283,84 @@ async def get_room_availability(
     response_description="Lista de reservas recuperada com sucesso",
 )
 async def list_room_reservations(
+    request: Request,
+    response: Response,
     room_id: UUID,
     date: datetime | None = Query(
         None, description="Data para filtrar as reservas (YYYY-MM-DD)"
     ),
+    start_time: datetime | None = Query(
+        None, alias="from", description="Início do período (inclusivo)"
+    ),
+    end_time: datetime | None = Query(
+        None, alias="to", description="Fim do período (exclusivo)"
+    ),
+    order: Literal["asc", "desc"] = Query(
+        "asc", description="Ordenação pelo horário de início"
+    ),
+    limit: int | None = Query(
+        None, ge=1, le=1000, description="Número máximo de reservas"
+    ),
+    format: Literal["json", "ndjson", "csv"] = Query(
+        "json",
+        description="Formato da resposta; ndjson e csv são enviados em streaming",
+    ),
+    room_repository: RoomRepository = Depends(get_room_repository),
+    versions: VersionTable = Depends(get_versions),
+    response_cache: ResponseCache = Depends(get_response_cache),
 ) -> List[dict]:
     """
-    Lista todas as reservas de uma sala, com opção de filtro por data
+    Lista as reservas de uma sala que se sobrepõem ao período **from**/**to**.
+    **date** é um atalho para o período de um dia inteiro.
+
+    Com **format** igual a *ndjson* ou *csv* o resultado é exportado em
+    streaming, lendo o cursor do banco aos poucos. Responde 304 sem consultar o
+    banco quando o If-None-Match confere com o ETag atual da sala
     """
-    try:
-        room = await room_repository.get(room_id)
-        reservations = room.get_reservations()
+    if date and (start_time or end_time):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Use date ou from/to, não ambos",
+        )
+    if date:
+        start_time = datetime.combine(date.date(), time.min)
+        end_time = start_time + timedelta(days=1)
+    if start_time and end_time and end_time <= start_time:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Data de fim deve ser maior que a data de início",
+        )
+
+    etag = versions.room_etag(room_id, request.url.query)
+    not_modified = conditional_response(request, response, etag)
+    if not_modified is not None:
+        return not_modified
 
-        if date:
-            reservations = [
-                reservation
-                for reservation in reservations
-                if reservation["start_time"].date() == date.date()
-            ]
+    cache_key = f"rooms/{room_id}/reservations?{request.url.query}"
+    if format == "json":
+        body = response_cache.get(cache_key, etag)
+        if body is not None:
+            return json_response(body, dict(response.headers))
 
-        return reservations
+    filters = {
+        "start_time": start_time,
+        "end_time": end_time,
+        "descending": order == "desc",
+        "limit": limit,
+    }
+    try:
+        if format in EXPORT_STREAMERS:
+            rows = await room_repository.stream_room_reservations(room_id, **filters)
+            return StreamingResponse(
+                EXPORT_STREAMERS[format](rows, RESERVATION_EXPORT_FIELDS),
+                media_type=EXPORT_MEDIA_TYPES[format],
+                headers=dict(response.headers),
+            )
+
+        reservations = await room_repository.list_room_reservations(room_id, **filters)
     except RoomNotFoundException as e:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail=str(e))
+
+    body = dumps(reservations)
+    response_cache.put(cache_key, etag, body)
+    return json_response(body, dict(response.headers))
@@ -1 +1,10 @@
 from .logging_config import setup_logging
+from .settings import (
+    Settings,
+    CacheSettings,
+    DatabaseSettings,
+    ObserverSettings,
+    SecuritySettings,
+    StartupSettings,
+    get_settings,
+)
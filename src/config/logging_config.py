@@ -18,6 +18,7 @@ LOGGING_CONFIG = {
         "file": {
             "class": "logging.FileHandler",
             "filename": "reservations.log",
+            "delay": True,
             "formatter": "detailed",
             "level": "DEBUG",
         },
@@ -25,7 +26,7 @@ LOGGING_CONFIG = {
     "loggers": {
         "": {
             "handlers": ["console", "file"],
-            "level": "DEBUG",
+            "level": "INFO",
             "propagate": True,
         },
         "LoggingObserver": {
@@ -0,0 +1,165 @@
+import os
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Optional
+
+
+@dataclass(frozen=True)
+class DatabaseSettings:
+    url: str = "sqlite:///myside.db"
+    read_url: Optional[str] = None
+    pool_size: int = 4
+    read_pool_size: int = 8
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    mmap_size: int = 256 * 1024 * 1024
+    cache_size: int = -64 * 1024
+    busy_timeout_ms: int = 5000
+    temp_store: str = "MEMORY"
+    slow_query_threshold_ms: float = 100.0
+    room_lock_shards: int = 64
+
+    @classmethod
+    def from_env(cls) -> "DatabaseSettings":
+        return cls(
+            url=os.getenv("DATABASE_URL", cls.url),
+            read_url=os.getenv("DATABASE_READ_URL") or None,
+            pool_size=int(os.getenv("DATABASE_POOL_SIZE", cls.pool_size)),
+            read_pool_size=int(
+                os.getenv("DATABASE_READ_POOL_SIZE", cls.read_pool_size)
+            ),
+            journal_mode=os.getenv("SQLITE_JOURNAL_MODE", cls.journal_mode),
+            synchronous=os.getenv("SQLITE_SYNCHRONOUS", cls.synchronous),
+            mmap_size=int(os.getenv("SQLITE_MMAP_SIZE", cls.mmap_size)),
+            cache_size=int(os.getenv("SQLITE_CACHE_SIZE", cls.cache_size)),
+            busy_timeout_ms=int(
+                os.getenv("SQLITE_BUSY_TIMEOUT_MS", cls.busy_timeout_ms)
+            ),
+            temp_store=os.getenv("SQLITE_TEMP_STORE", cls.temp_store),
+            slow_query_threshold_ms=float(
+                os.getenv("SLOW_QUERY_THRESHOLD_MS", cls.slow_query_threshold_ms)
+            ),
+            room_lock_shards=int(os.getenv("ROOM_LOCK_SHARDS", cls.room_lock_shards)),
+        )
+
+    def pragmas(self) -> Dict[str, object]:
+        return {
+            "journal_mode": self.journal_mode,
+            "synchronous": self.synchronous,
+            "mmap_size": self.mmap_size,
+            "cache_size": self.cache_size,
+            "busy_timeout": self.busy_timeout_ms,
+            "temp_store": self.temp_store,
+        }
+
+
+def _env_flag(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in ("1", "true", "yes", "on")
+
+
+@dataclass(frozen=True)
+class StartupSettings:
+    configure_logging: bool = True
+    warmup: bool = True
+    warmup_rooms: int = 32
+
+    @classmethod
+    def from_env(cls) -> "StartupSettings":
+        return cls(
+            configure_logging=_env_flag("LOG_CONFIGURE", cls.configure_logging),
+            warmup=_env_flag("STARTUP_WARMUP", cls.warmup),
+            warmup_rooms=int(os.getenv("STARTUP_WARMUP_ROOMS", cls.warmup_rooms)),
+        )
+
+
+@dataclass(frozen=True)
+class CacheSettings:
+    etag_max_age_seconds: float = 30.0
+    room_cache_size: int = 512
+    room_cache_ttl_seconds: Optional[float] = None
+    response_cache_size: int = 256
+    token_cache_size: int = 4096
+
+    @classmethod
+    def from_env(cls) -> "CacheSettings":
+        room_cache_ttl = os.getenv("ROOM_CACHE_TTL_SECONDS")
+        return cls(
+            etag_max_age_seconds=float(
+                os.getenv("ETAG_MAX_AGE_SECONDS", cls.etag_max_age_seconds)
+            ),
+            room_cache_size=int(os.getenv("ROOM_CACHE_SIZE", cls.room_cache_size)),
+            room_cache_ttl_seconds=float(room_cache_ttl) if room_cache_ttl else None,
+            response_cache_size=int(
+                os.getenv("RESPONSE_CACHE_SIZE", cls.response_cache_size)
+            ),
+            token_cache_size=int(os.getenv("TOKEN_CACHE_SIZE", cls.token_cache_size)),
+        )
+
+    @property
+    def room_cache_ttl(self) -> float:
+        # Escritas de outros workers só chegam ao cache quando a entrada expira: o
+        # TTL não passa da janela do ETag, o mesmo atraso máximo das respostas 304
+        if self.room_cache_ttl_seconds is None:
+            return self.etag_max_age_seconds
+        return min(self.room_cache_ttl_seconds, self.etag_max_age_seconds)
+
+
+@dataclass(frozen=True)
+class ObserverSettings:
+    dispatch_mode: str = "async"
+    queue_size: int = 1000
+    batch_size: int = 100
+
+    @classmethod
+    def from_env(cls) -> "ObserverSettings":
+        return cls(
+            dispatch_mode=os.getenv("OBSERVER_DISPATCH_MODE", cls.dispatch_mode),
+            queue_size=int(os.getenv("OBSERVER_QUEUE_SIZE", cls.queue_size)),
+            batch_size=int(os.getenv("OBSERVER_BATCH_SIZE", cls.batch_size)),
+        )
+
+
+@dataclass(frozen=True)
+class SecuritySettings:
+    bcrypt_rounds: int = 12
+    password_hash_workers: int = 2
+    password_hash_max_pending: int = 64
+
+    @classmethod
+    def from_env(cls) -> "SecuritySettings":
+        return cls(
+            bcrypt_rounds=int(os.getenv("BCRYPT_ROUNDS", cls.bcrypt_rounds)),
+            password_hash_workers=int(
+                os.getenv("PASSWORD_HASH_WORKERS", cls.password_hash_workers)
+            ),
+            password_hash_max_pending=int(
+                os.getenv("PASSWORD_HASH_MAX_PENDING", cls.password_hash_max_pending)
+            ),
+        )
+
+
+@dataclass(frozen=True)
+class Settings:
+    database: DatabaseSettings = field(default_factory=DatabaseSettings)
+    startup: StartupSettings = field(default_factory=StartupSettings)
+    cache: CacheSettings = field(default_factory=CacheSettings)
+    observers: ObserverSettings = field(default_factory=ObserverSettings)
+    security: SecuritySettings = field(default_factory=SecuritySettings)
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        return cls(
+            database=DatabaseSettings.from_env(),
+            startup=StartupSettings.from_env(),
+            cache=CacheSettings.from_env(),
+            observers=ObserverSettings.from_env(),
+            security=SecuritySettings.from_env(),
+        )
+
+
+@lru_cache
+def get_settings() -> Settings:
+    return Settings.from_env()
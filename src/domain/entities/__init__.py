@@ -1 +1,9 @@
 from .meeting_room import MeetingRoom
+from .reservation_index import ReservationIndex
+from .reservation_record import ReservationRecord
+from .recurrence import (
+    RECURRENCE_HORIZON,
+    FREQUENCY_MIN_PERIOD,
+    iter_occurrences,
+    sweep_conflicts,
+)
@@ -1,8 +1,10 @@
-from typing import List, Dict
+from typing import List, Dict, Iterator, Optional, Tuple
 from uuid import UUID, uuid4
-from datetime import datetime
-from ..states import AvailableState, PartiallyAvailableState, UnavailableState
+from datetime import datetime, time, timedelta
+from ..states import AVAILABLE, state_for
 from ..exceptions import ReservationNotFoundException
+from .reservation_index import ReservationIndex
+from .reservation_record import ReservationRecord
 
 
 class MeetingRoom:
@@ -11,8 +13,8 @@ class MeetingRoom:
         self.name = name
         self.capacity = capacity
         self.location = location
-        self.reservations: List[Dict] = []
-        self.state = AvailableState(self)
+        self.reservations = ReservationIndex()
+        self.state = AVAILABLE
 
     @staticmethod
     def from_db(room_db, reservations) -> "MeetingRoom":
@@ -22,56 +24,92 @@ class MeetingRoom:
             location=room_db.location,
         )
         room.id = room_db.id
-        room.reservations = [
-            {
-                "id": UUID(res["id"]),
-                "user_id": UUID(res["user_id"]),
-                "start_time": res["start_time"],
-                "end_time": res["end_time"],
-            }
+        room.reservations = ReservationIndex(
+            ReservationRecord(
+                res["id"], res["user_id"], res["start_time"], res["end_time"]
+            )
             for res in reservations
-        ]
-
-        if not reservations:
-            room.state = AvailableState(room)
-        elif len(reservations) == 1:
-            room.state = PartiallyAvailableState(room)
-        else:
-            room.state = UnavailableState(room)
+        )
+        room._update_state()
+        return room
 
+    def in_window(self, start_time: datetime, end_time: datetime) -> "MeetingRoom":
+        room = MeetingRoom(
+            name=self.name, capacity=self.capacity, location=self.location
+        )
+        room.id = self.id
+        room.reservations = ReservationIndex(
+            self.reservations.overlapping(start_time, end_time)
+        )
         room._update_state()
         return room
 
     def _update_state(self) -> None:
-        if len(self.reservations) == 0:
-            self.state = AvailableState(self)
-        elif len(self.reservations) == 1:
-            self.state = AvailableState(self)
-        elif len(self.reservations) >= 16:
-            self.state = UnavailableState(self)
-        else:
-            self.state = PartiallyAvailableState(self)
+        # A contagem vem do índice em O(1) e os estados são compartilhados:
+        # atualizar o estado não aloca nada
+        self.state = state_for(len(self.reservations))
 
     def is_period_available(self, start_time: datetime, end_time: datetime) -> bool:
+        return self.reservations.count_overlapping(start_time, end_time) == 0
+
+    def has_available_period(self, start_time: datetime, end_time: datetime) -> bool:
         if not self.reservations:
             return True
+        return self.reservations.count_overlapping(start_time, end_time) > 0
 
-        return any(
-            reservation["start_time"] > end_time or reservation["end_time"] < start_time
-            for reservation in self.reservations
-        )
-
-    def has_available_period(self, start_time: datetime, end_time: datetime) -> bool:
-        for reservation in self.reservations:
-            if (
-                reservation["start_time"] < end_time
-                and reservation["end_time"] > start_time
+    def get_free_slots(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        min_duration: Optional[timedelta] = None,
+        business_hours: Optional[Tuple[time, time]] = None,
+    ) -> List[Dict]:
+        slots = []
+        for segment_start, segment_end in self._bounded_segments(
+            start_time, end_time, business_hours
+        ):
+            cursor = segment_start
+            # As reservas já vêm ordenadas pelo início, então uma única
+            # varredura basta para encontrar os intervalos entre elas
+            for reservation in self.reservations.overlapping(
+                segment_start, segment_end
             ):
-                return True
-        return len(self.reservations) == 0
+                if reservation.start_time > cursor:
+                    slots.append((cursor, reservation.start_time))
+                cursor = max(cursor, reservation.end_time)
+            if cursor < segment_end:
+                slots.append((cursor, segment_end))
+
+        min_duration = min_duration or timedelta(0)
+        return [
+            {"start_time": slot_start, "end_time": slot_end}
+            for slot_start, slot_end in slots
+            if slot_end - slot_start >= min_duration
+        ]
+
+    @staticmethod
+    def _bounded_segments(
+        start_time: datetime,
+        end_time: datetime,
+        business_hours: Optional[Tuple[time, time]],
+    ) -> Iterator[Tuple[datetime, datetime]]:
+        if business_hours is None:
+            yield start_time, end_time
+            return
+
+        opening, closing = business_hours
+        day = start_time.date()
+        while day <= end_time.date():
+            segment_start = max(
+                start_time, datetime.combine(day, opening, start_time.tzinfo)
+            )
+            segment_end = min(end_time, datetime.combine(day, closing, end_time.tzinfo))
+            if segment_start < segment_end:
+                yield segment_start, segment_end
+            day += timedelta(days=1)
 
     def get_reservations(self) -> List[Dict]:
-        return self.reservations
+        return [reservation.to_dict() for reservation in self.reservations]
 
     def add_reservation(
         self,
@@ -80,36 +118,24 @@ class MeetingRoom:
         start_time: datetime,
         end_time: datetime,
     ) -> bool:
-        if not self.state.check_availability(start_time, end_time):
+        if not self.state.check_availability(self, start_time, end_time):
             return False
 
-        reservation = {
-            "id": reservation_id,
-            "user_id": user_id,
-            "start_time": start_time,
-            "end_time": end_time,
-        }
-        self.reservations.append(reservation)
+        self.reservations.add(
+            ReservationRecord(reservation_id, user_id, start_time, end_time)
+        )
         self._update_state()
         return True
 
     def cancel_reservation(self, reservation_id: UUID) -> bool:
-        reservation = next(
-            (
-                reservation
-                for reservation in self.reservations
-                if reservation["id"] == reservation_id
-            ),
-            None,
-        )
-        if not reservation:
+        if reservation_id not in self.reservations:
             raise ReservationNotFoundException(
                 f"Reserva com id {reservation_id} não encontrada"
             )
 
-        self.reservations.remove(reservation)
+        self.reservations.remove(reservation_id)
         self._update_state()
         return True
 
     def check_availability(self, start_time: datetime, end_time: datetime) -> bool:
-        return self.state.check_availability(start_time, end_time)
+        return self.state.check_availability(self, start_time, end_time)
@@ -0,0 +1,109 @@
+from calendar import monthrange
+from datetime import date, datetime, timedelta
+from itertools import count as counter
+from typing import Iterable, Iterator, Optional, Tuple
+
+# Alcance máximo de uma série, contado a partir da primeira ocorrência
+RECURRENCE_HORIZON = timedelta(days=366)
+
+# Menor distância entre duas ocorrências de cada frequência com intervalo 1
+FREQUENCY_MIN_PERIOD = {
+    "daily": timedelta(days=1),
+    "weekly": timedelta(weeks=1),
+    "monthly": timedelta(days=28),
+}
+
+
+def _shift_months(moment: datetime, months: int) -> Tuple[date, Optional[datetime]]:
+    """
+    Devolve o primeiro dia do mês deslocado e a data/hora no mesmo dia do
+    mês, ou None quando o mês não tem esse dia (ex.: 31 de abril)
+    """
+    year, month = divmod(moment.month - 1 + months, 12)
+    first_day = date(moment.year + year, month + 1, 1)
+    if moment.day > monthrange(first_day.year, first_day.month)[1]:
+        return first_day, None
+    return first_day, moment.replace(year=first_day.year, month=first_day.month)
+
+
+def iter_occurrences(
+    rule,
+    start_time: datetime,
+    end_time: datetime,
+    horizon: timedelta = RECURRENCE_HORIZON,
+) -> Iterator[Tuple[datetime, datetime]]:
+    """
+    Gera sob demanda os períodos (início, fim) da série descrita por rule, em
+    ordem e todos com a duração da primeira ocorrência.
+
+    Segue a RFC 5545: count conta as ocorrências antes de remover as exceções
+    e, na frequência mensal, meses sem o dia da primeira ocorrência são
+    ignorados. Regras que terminariam depois de start_time + horizon (ou que
+    não têm fim) levantam ValueError em vez de serem truncadas em silêncio
+    """
+    duration = end_time - start_time
+    horizon_day = (start_time + horizon).date()
+    last_day = horizon_day
+    if rule.until is not None:
+        last_day = min(last_day, rule.until)
+    skipped = set(rule.exceptions)
+
+    def past_horizon() -> ValueError:
+        return ValueError(
+            f"A recorrência deve terminar em até {horizon.days} dias após o início;"
+            " informe until ou count"
+        )
+
+    generated = 0
+    for step in counter():
+        if rule.count is not None and generated >= rule.count:
+            return
+
+        if rule.frequency == "monthly":
+            month_start, occurrence_start = _shift_months(
+                start_time, step * rule.interval
+            )
+            if month_start > last_day:
+                if last_day == horizon_day and rule.until != horizon_day:
+                    raise past_horizon()
+                return
+            if occurrence_start is None:
+                continue
+        else:
+            occurrence_start = (
+                start_time + FREQUENCY_MIN_PERIOD[rule.frequency] * step * rule.interval
+            )
+
+        if occurrence_start.date() > last_day:
+            if last_day == horizon_day and rule.until != horizon_day:
+                raise past_horizon()
+            return
+        generated += 1
+        if occurrence_start.date() not in skipped:
+            yield occurrence_start, occurrence_start + duration
+
+
+def sweep_conflicts(
+    periods: Iterable[Tuple[datetime, datetime]],
+    reservations: Iterable,
+) -> Iterator[int]:
+    """
+    Posições dos períodos que se sobrepõem a alguma reserva, em uma única
+    passada pelas duas sequências: O(períodos + reservas).
+
+    Os períodos devem estar ordenados pelo início com fins não decrescentes
+    (como as ocorrências de uma série) e as reservas ordenadas pelo início.
+    Guarda o maior fim entre as reservas que começam antes do fim do período
+    atual: há sobreposição quando ele passa do início do período
+    """
+    reservations = iter(reservations)
+    pending = next(reservations, None)
+    latest_end: Optional[datetime] = None
+
+    for index, (start_time, end_time) in enumerate(periods):
+        while pending is not None and pending.start_time < end_time:
+            if latest_end is None or pending.end_time > latest_end:
+                latest_end = pending.end_time
+            pending = next(reservations, None)
+        if latest_end is not None and latest_end > start_time:
+            yield index
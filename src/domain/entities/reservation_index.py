@@ -0,0 +1,93 @@
+from bisect import bisect_left, bisect_right, insort
+from datetime import datetime, timedelta
+from itertools import count
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+from .reservation_record import ReservationRecord
+
+
+class ReservationIndex:
+    """Índice ordenado das reservas de uma sala para consultas de sobreposição"""
+
+    def __init__(self, reservations: Optional[Iterable[ReservationRecord]] = None):
+        self._sequence = count()
+        # Construção em lote: uma ordenação só, em vez de um insort por reserva
+        self._entries: List[Tuple[datetime, int, ReservationRecord]] = sorted(
+            (reservation.start_time, next(self._sequence), reservation)
+            for reservation in reservations or ()
+        )
+        self._ends: List[datetime] = sorted(
+            entry[2].end_time for entry in self._entries
+        )
+        self._by_id: Dict[str, Tuple[datetime, int]] = {
+            entry[2].key: entry[:2] for entry in self._entries
+        }
+        self._max_duration = max(
+            (entry[2].end_time - entry[0] for entry in self._entries),
+            default=timedelta(0),
+        )
+
+        if len(self._by_id) != len(self._entries):
+            entries, self._entries, self._ends = self._entries, [], []
+            self._by_id.clear()
+            for entry in entries:
+                self.add(entry[2])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __bool__(self) -> bool:
+        return bool(self._entries)
+
+    def __iter__(self) -> Iterator[ReservationRecord]:
+        return (entry[2] for entry in self._entries)
+
+    def __contains__(self, reservation_id) -> bool:
+        return str(reservation_id) in self._by_id
+
+    def get(self, reservation_id) -> Optional[ReservationRecord]:
+        key = self._by_id.get(str(reservation_id))
+        if key is None:
+            return None
+        return self._entries[bisect_left(self._entries, key)][2]
+
+    def add(self, reservation: ReservationRecord) -> None:
+        if reservation.key in self._by_id:
+            self.remove(reservation.key)
+
+        start_time = reservation.start_time
+        end_time = reservation.end_time
+        key = (start_time, next(self._sequence))
+
+        insort(self._entries, (*key, reservation))
+        insort(self._ends, end_time)
+        self._by_id[reservation.key] = key
+        self._max_duration = max(self._max_duration, end_time - start_time)
+
+    def remove(self, reservation_id) -> ReservationRecord:
+        key = self._by_id.pop(str(reservation_id))
+        position = bisect_left(self._entries, key)
+        reservation = self._entries.pop(position)[2]
+        del self._ends[bisect_left(self._ends, reservation.end_time)]
+
+        if not self._entries:
+            self._max_duration = timedelta(0)
+        return reservation
+
+    def count_overlapping(self, start_time: datetime, end_time: datetime) -> int:
+        # Reservas que começam antes do fim do período, menos as que já
+        # terminaram antes do seu início: O(log n) mesmo com sobreposições
+        started = bisect_left(self._entries, (end_time,))
+        finished = bisect_right(self._ends, start_time)
+        return max(started - finished, 0)
+
+    def overlapping(
+        self, start_time: datetime, end_time: datetime
+    ) -> Iterator[ReservationRecord]:
+        if not self._entries:
+            return
+        low = bisect_left(self._entries, (start_time - self._max_duration,))
+        high = bisect_left(self._entries, (end_time,))
+        for position in range(low, high):
+            reservation = self._entries[position][2]
+            if reservation.end_time > start_time:
+                yield reservation
@@ -0,0 +1,38 @@
+from datetime import datetime
+from typing import Dict
+from uuid import UUID
+
+
+class ReservationRecord:
+    """
+    Representação compacta de uma reserva dentro da sala: o id é mantido como
+    texto e só vira UUID (ou dict) quando alguém precisa dele
+    """
+
+    __slots__ = ("key", "user_id", "start_time", "end_time")
+
+    def __init__(
+        self, reservation_id, user_id, start_time: datetime, end_time: datetime
+    ):
+        self.key = str(reservation_id)
+        self.user_id = user_id
+        self.start_time = start_time
+        self.end_time = end_time
+
+    @property
+    def id(self) -> UUID:
+        return UUID(self.key)
+
+    def to_dict(self) -> Dict:
+        return {
+            "id": self.id,
+            "user_id": self.user_id,
+            "start_time": self.start_time,
+            "end_time": self.end_time,
+        }
+
+    def __repr__(self) -> str:
+        return (
+            f"ReservationRecord(id={self.key}, start_time={self.start_time}, "
+            f"end_time={self.end_time})"
+        )
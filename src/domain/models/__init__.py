@@ -1,3 +1,8 @@
 from .room import RoomCreate, RoomResponse
-from .reservation import ReservationCreate, ReservationResponse
+from .reservation import (
+    ReservationCreate,
+    ReservationResponse,
+    ReservationBulkCreate,
+    RecurrenceRule,
+)
 from .user import UserCreate
@@ -1,12 +1,33 @@
 from uuid import UUID
-from datetime import datetime
-from pydantic import BaseModel, model_validator
+from typing import List, Literal, Optional
+from datetime import date, datetime
+from pydantic import BaseModel, Field, model_validator
+from domain.entities.recurrence import FREQUENCY_MIN_PERIOD
+
+RECURRENCE_MAX_COUNT = 366
+
+
+class RecurrenceRule(BaseModel):
+    frequency: Literal["daily", "weekly", "monthly"]
+    interval: int = Field(1, ge=1, le=52)
+    until: Optional[date] = None
+    count: Optional[int] = Field(None, ge=1, le=RECURRENCE_MAX_COUNT)
+    exceptions: List[date] = Field(
+        default_factory=list, max_length=RECURRENCE_MAX_COUNT
+    )
+
+    @model_validator(mode="after")
+    def validate_end(self) -> "RecurrenceRule":
+        if self.until is not None and self.count is not None:
+            raise ValueError("Informe until ou count, não ambos")
+        return self
 
 
 class ReservationCreate(BaseModel):
     room_id: UUID
     start_time: datetime
     end_time: datetime
+    recurrence: Optional[RecurrenceRule] = None
 
     @model_validator(mode="after")
     def validate_times(self) -> "ReservationCreate":
@@ -14,8 +35,30 @@ class ReservationCreate(BaseModel):
             raise ValueError("Data de início não pode ser menor que a data atual")
         if self.end_time <= self.start_time:
             raise ValueError("Data de fim deve ser maior que a data de início")
+        if self.recurrence is not None:
+            rule = self.recurrence
+            if rule.until is not None and rule.until < self.start_time.date():
+                raise ValueError("Fim da recorrência deve ser após o início da reserva")
+            # Ocorrências da mesma série nunca podem se sobrepor entre si
+            if (
+                self.end_time - self.start_time
+                > FREQUENCY_MIN_PERIOD[rule.frequency] * rule.interval
+            ):
+                raise ValueError(
+                    "Duração da reserva deve ser menor que o intervalo da recorrência"
+                )
         return self
 
 
 class ReservationResponse(ReservationCreate):
     id: UUID
+
+
+class ReservationBulkCreate(BaseModel):
+    reservations: List[ReservationCreate] = Field(..., min_length=1, max_length=1000)
+
+    @model_validator(mode="after")
+    def validate_single(self) -> "ReservationBulkCreate":
+        if any(reservation.recurrence for reservation in self.reservations):
+            raise ValueError("Reservas recorrentes não são aceitas em lote")
+        return self
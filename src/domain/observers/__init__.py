@@ -1 +1,8 @@
-from .observer import ReservationObserver, ReservationSubject
+from .observer import (
+    ReservationObserver,
+    AsyncReservationObserver,
+    ReservationSubject,
+    RESERVATION_CREATED,
+    RESERVATION_CANCELLED,
+    RESERVATION_CONFLICT,
+)
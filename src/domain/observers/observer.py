@@ -1,20 +1,26 @@
+import asyncio
+import inspect
 import logging
 from uuid import UUID
-from typing import List
+from typing import Any, List, Optional, Tuple
 from datetime import datetime
 from abc import ABC, abstractmethod
 
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    handlers=[
-        logging.FileHandler("reservations.log"),
-        logging.StreamHandler(),
-    ],
-)
+RESERVATION_CREATED = "created"
+RESERVATION_CANCELLED = "cancelled"
+RESERVATION_CONFLICT = "conflict"
+
+ReservationEvent = Tuple[str, Any]
 
 
 class ReservationObserver(ABC):
+    # Observers inline são notificados antes do retorno de publish, mesmo com
+    # o worker ativo (ex.: invalidação de cache que não pode atrasar)
+    inline = False
+    # Handlers síncronos podem bloquear (arquivo, email): rodam em uma thread
+    # para não travar o event loop. Desligue só para handlers em memória
+    blocking = True
+
     def __init__(self):
         self.logger = logging.getLogger(self.__class__.__name__)
 
@@ -23,9 +29,52 @@ class ReservationObserver(ABC):
         pass
 
     @abstractmethod
-    def notify_reservation_cancelled(self, reservation_id: str) -> None:
+    def notify_reservation_cancelled(self, reservation: dict) -> None:
+        pass
+
+    def notify_reservation_conflict(self, reservation: dict) -> None:
+        """Tentativa de reserva recusada por conflito de horário"""
+
+    def notify_batch(self, events: List[ReservationEvent]) -> None:
+        """Sobrescreva para tratar um lote de eventos de uma só vez"""
+        for event, payload in events:
+            try:
+                if event == RESERVATION_CREATED:
+                    self.notify_reservation_created(payload)
+                elif event == RESERVATION_CONFLICT:
+                    self.notify_reservation_conflict(payload)
+                else:
+                    self.notify_reservation_cancelled(payload)
+            except Exception as e:
+                self.logger.error(f"Erro ao processar evento {event}: {str(e)}")
+
+
+class AsyncReservationObserver(ReservationObserver):
+    """Observer com handlers assíncronos, aguardados pelo worker de eventos"""
+
+    @abstractmethod
+    async def notify_reservation_created(self, reservation: dict) -> None:
+        pass
+
+    @abstractmethod
+    async def notify_reservation_cancelled(self, reservation: dict) -> None:
         pass
 
+    async def notify_reservation_conflict(self, reservation: dict) -> None:
+        pass
+
+    async def notify_batch(self, events: List[ReservationEvent]) -> None:
+        for event, payload in events:
+            try:
+                if event == RESERVATION_CREATED:
+                    await self.notify_reservation_created(payload)
+                elif event == RESERVATION_CONFLICT:
+                    await self.notify_reservation_conflict(payload)
+                else:
+                    await self.notify_reservation_cancelled(payload)
+            except Exception as e:
+                self.logger.error(f"Erro ao processar evento {event}: {str(e)}")
+
 
 class LoggingObserver(ReservationObserver):
     def notify_reservation_created(self, reservation: dict) -> None:
@@ -37,8 +86,11 @@ class LoggingObserver(ReservationObserver):
             + f"Fim: {reservation['end_time']}"
         )
 
-    def notify_reservation_cancelled(self, reservation_id: str) -> None:
-        self.logger.info(f"Reserva cancelada | ID: {reservation_id}")
+    def notify_reservation_cancelled(self, reservation: dict) -> None:
+        self.logger.info(
+            f"Reserva cancelada | ID: {reservation['id']} | "
+            + f"Sala: {reservation['room_id']}"
+        )
 
 
 class EmailObserver(ReservationObserver):
@@ -49,10 +101,10 @@ class EmailObserver(ReservationObserver):
             + f"Sala {reservation['room_id']}"
         )
 
-    def notify_reservation_cancelled(self, reservation_id: str) -> None:
+    def notify_reservation_cancelled(self, reservation: dict) -> None:
         self.logger.info(
             f"Email enviado | "
-            + f"Notificação de cancelamento da reserva {reservation_id}"
+            + f"Notificação de cancelamento da reserva {reservation['id']}"
         )
 
 
@@ -64,9 +116,15 @@ class ConflictObserver(ReservationObserver):
             + f"Período: {reservation['start_time']} - {reservation['end_time']}"
         )
 
-    def notify_reservation_cancelled(self, reservation_id: str) -> None:
+    def notify_reservation_cancelled(self, reservation: dict) -> None:
         self.logger.info(
-            f"Verificando impactos do cancelamento | " + f"Reserva: {reservation_id}"
+            f"Verificando impactos do cancelamento | "
+            + f"Reserva: {reservation['id']} | Sala: {reservation['room_id']}"
+        )
+
+    def notify_reservation_conflict(self, reservation: dict) -> None:
+        self.notify_conflict_detected(
+            reservation["room_id"], reservation["start_time"], reservation["end_time"]
         )
 
     def notify_conflict_detected(
@@ -80,9 +138,26 @@ class ConflictObserver(ReservationObserver):
 
 
 class ReservationSubject:
-    def __init__(self):
+    """
+    Publica eventos de reserva para os observers registrados.
+
+    Enquanto o worker não é iniciado (start), os eventos publicados são
+    entregues imediatamente. Com o worker ativo, entram em uma fila limitada
+    e são entregues em lotes fora do caminho da requisição; publish aguarda
+    quando a fila está cheia
+    """
+
+    def __init__(self, max_queue_size: int = 1000, batch_size: int = 100):
         self._observers: List[ReservationObserver] = []
         self.logger = logging.getLogger(self.__class__.__name__)
+        self.max_queue_size = max_queue_size
+        self.batch_size = batch_size
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._worker is not None
 
     def attach(self, observer: ReservationObserver) -> None:
         self._observers.append(observer)
@@ -101,11 +176,89 @@ class ReservationSubject:
                     f"Erro ao notificar {observer.__class__.__name__}: {str(e)}"
                 )
 
-    def notify_cancellation(self, reservation_id: str) -> None:
+    def notify_cancellation(self, reservation: dict) -> None:
         for observer in self._observers:
             try:
-                observer.notify_reservation_cancelled(reservation_id)
+                observer.notify_reservation_cancelled(reservation)
+            except Exception as e:
+                self.logger.error(
+                    f"Erro ao notificar {observer.__class__.__name__}: {str(e)}"
+                )
+
+    async def publish_creation(self, reservation: dict) -> None:
+        await self._publish((RESERVATION_CREATED, reservation))
+
+    async def publish_cancellation(self, reservation: dict) -> None:
+        """reservation traz id e room_id da reserva cancelada"""
+        await self._publish((RESERVATION_CANCELLED, reservation))
+
+    async def publish_conflict(self, reservation: dict) -> None:
+        await self._publish((RESERVATION_CONFLICT, reservation))
+
+    async def _publish(self, event: ReservationEvent) -> None:
+        if self._queue is None:
+            await self._deliver([event], self._observers)
+            return
+        await self._deliver(
+            [event], [observer for observer in self._observers if observer.inline]
+        )
+        await self._queue.put(event)
+
+    async def _deliver(
+        self,
+        events: List[ReservationEvent],
+        observers: List[ReservationObserver],
+    ) -> None:
+        for observer in list(observers):
+            try:
+                if observer.blocking and not inspect.iscoroutinefunction(
+                    observer.notify_batch
+                ):
+                    await asyncio.to_thread(observer.notify_batch, events)
+                    continue
+                result = observer.notify_batch(events)
+                if inspect.isawaitable(result):
+                    await result
             except Exception as e:
                 self.logger.error(
                     f"Erro ao notificar {observer.__class__.__name__}: {str(e)}"
                 )
+
+    async def _run(self) -> None:
+        while True:
+            events = [await self._queue.get()]
+            while len(events) < self.batch_size and not self._queue.empty():
+                events.append(self._queue.get_nowait())
+            try:
+                await self._deliver(
+                    events,
+                    [observer for observer in self._observers if not observer.inline],
+                )
+            finally:
+                for _ in events:
+                    self._queue.task_done()
+
+    async def start(self) -> None:
+        if self.is_running:
+            return
+        self._queue = asyncio.Queue(maxsize=self.max_queue_size)
+        self._worker = asyncio.create_task(self._run())
+        self.logger.debug("Worker de eventos de reserva iniciado")
+
+    async def stop(self, timeout: Optional[float] = 10.0) -> None:
+        if not self.is_running:
+            return
+        try:
+            await asyncio.wait_for(self._queue.join(), timeout)
+        except asyncio.TimeoutError:
+            self.logger.error(
+                f"{self._queue.qsize()} eventos descartados ao encerrar o worker"
+            )
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+        self._queue = None
+        self.logger.debug("Worker de eventos de reserva encerrado")
@@ -1,4 +1,4 @@
 from .state import RoomState
 from .available import AvailableState
-from .unavailable import UnavailableState
 from .partially_available import PartiallyAvailableState
+from .flyweights import AVAILABLE, PARTIALLY_AVAILABLE, state_for
@@ -1,7 +1,15 @@
 from datetime import datetime
+from typing import TYPE_CHECKING
 from .state import RoomState
 
+if TYPE_CHECKING:
+    from ..entities import MeetingRoom
+
 
 class AvailableState(RoomState):
-    def check_availability(self, start_time: datetime, end_time: datetime) -> bool:
-        return self.room.is_period_available(start_time, end_time)
+    __slots__ = ()
+
+    def check_availability(
+        self, room: "MeetingRoom", start_time: datetime, end_time: datetime
+    ) -> bool:
+        return room.is_period_available(start_time, end_time)
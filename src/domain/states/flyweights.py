@@ -0,0 +1,15 @@
+from .state import RoomState
+from .available import AvailableState
+from .partially_available import PartiallyAvailableState
+
+PARTIALLY_AVAILABLE_FROM = 2
+
+AVAILABLE = AvailableState()
+PARTIALLY_AVAILABLE = PartiallyAvailableState()
+
+
+def state_for(reservation_count: int) -> RoomState:
+    # Nenhuma contagem torna a sala indisponível: só a sobreposição recusa
+    if reservation_count >= PARTIALLY_AVAILABLE_FROM:
+        return PARTIALLY_AVAILABLE
+    return AVAILABLE
@@ -7,9 +7,15 @@ if TYPE_CHECKING:
 
 
 class RoomState(ABC):
-    def __init__(self, room: "MeetingRoom"):
-        self.room = room
+    """
+    Estados são flyweights sem estado próprio, compartilhados por todas as
+    salas: a sala é recebida como argumento em cada chamada
+    """
+
+    __slots__ = ()
 
     @abstractmethod
-    def check_availability(self, start_time: datetime, end_time: datetime) -> bool:
+    def check_availability(
+        self, room: "MeetingRoom", start_time: datetime, end_time: datetime
+    ) -> bool:
         pass
@@ -1 +1,7 @@
-from .pagination import PaginatedResponse, paginate
+from .pagination import (
+    PaginatedResponse,
+    paginate,
+    paginate_keyset,
+    encode_cursor,
+    decode_cursor,
+)
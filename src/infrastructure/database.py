@@ -1,5 +1,34 @@
-from databases import Database
+from typing import Tuple
+from config import DatabaseSettings
+from infrastructure.sqlite_backend import TunedDatabase
+from infrastructure.metrics import record_query
+from infrastructure.query_profiler import QueryProfiler
 
-DATABASE_URL = "sqlite:///myside.db"
 
-database = Database(DATABASE_URL)
+def create_databases(settings: DatabaseSettings) -> Tuple[TunedDatabase, TunedDatabase]:
+    """
+    Monta os bancos de escrita e de leitura; nenhuma conexão é aberta até o
+    connect() feito na subida da aplicação
+    """
+    database = TunedDatabase(
+        settings.url,
+        pool_size=settings.pool_size,
+        pragmas=settings.pragmas(),
+        name="write",
+    )
+
+    # Conexões somente leitura em um pool separado: com WAL os leitores não
+    # esperam pelo escritor
+    read_database = TunedDatabase(
+        settings.read_url or settings.url,
+        pool_size=settings.read_pool_size,
+        pragmas={**settings.pragmas(), "query_only": 1},
+        name="read",
+    )
+
+    query_profiler = QueryProfiler(settings.slow_query_threshold_ms / 1000)
+    for instance in (database, read_database):
+        instance.add_query_listener(record_query)
+        instance.add_query_listener(query_profiler)
+
+    return database, read_database
@@ -0,0 +1,21 @@
+from config import ObserverSettings
+from domain.observers.observer import (
+    ReservationSubject,
+    LoggingObserver,
+    EmailObserver,
+)
+from infrastructure.room_cache import RoomCache, RoomCacheObserver
+from infrastructure.metrics import MetricsObserver
+
+
+def create_reservation_subject(
+    room_cache: RoomCache, settings: ObserverSettings
+) -> ReservationSubject:
+    reservation_subject = ReservationSubject(
+        max_queue_size=settings.queue_size, batch_size=settings.batch_size
+    )
+    reservation_subject.attach(RoomCacheObserver(room_cache))
+    reservation_subject.attach(MetricsObserver())
+    reservation_subject.attach(LoggingObserver())
+    reservation_subject.attach(EmailObserver())
+    return reservation_subject
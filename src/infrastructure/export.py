@@ -0,0 +1,60 @@
+import csv
+import io
+import json
+from datetime import datetime
+from typing import AsyncIterator, Dict, Mapping, Sequence
+from uuid import UUID
+
+EXPORT_CHUNK_SIZE = 500
+
+EXPORT_MEDIA_TYPES: Dict[str, str] = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def _serialize(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    if isinstance(value, UUID):
+        return str(value)
+    return value
+
+
+async def stream_ndjson(
+    rows: AsyncIterator[Mapping], fields: Sequence[str]
+) -> AsyncIterator[str]:
+    """Gera uma linha JSON por registro, agrupando EXPORT_CHUNK_SIZE por envio"""
+    lines = []
+    async for row in rows:
+        lines.append(
+            json.dumps({field: _serialize(row[field]) for field in fields}) + "\n"
+        )
+        if len(lines) >= EXPORT_CHUNK_SIZE:
+            yield "".join(lines)
+            lines.clear()
+    if lines:
+        yield "".join(lines)
+
+
+async def stream_csv(
+    rows: AsyncIterator[Mapping], fields: Sequence[str]
+) -> AsyncIterator[str]:
+    """Gera o CSV com cabeçalho, agrupando EXPORT_CHUNK_SIZE linhas por envio"""
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(fields)
+    pending = 0
+    async for row in rows:
+        writer.writerow([_serialize(row[field]) for field in fields])
+        pending += 1
+        if pending >= EXPORT_CHUNK_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            pending = 0
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+EXPORT_STREAMERS = {"ndjson": stream_ndjson, "csv": stream_csv}
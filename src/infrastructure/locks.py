@@ -0,0 +1,39 @@
+import asyncio
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Iterable, List
+
+
+class ShardedLockTable:
+    """
+    Tabela fixa de locks asyncio indexada pelo hash da chave: operações em
+    salas diferentes raramente disputam o mesmo lock, sem criar um lock por sala.
+
+    O write_lock enfileira no processo as transações de escrita, já que o
+    SQLite aceita um único escritor por vez; sem ele as conexões concorrentes
+    disputariam o lock do banco com espera ativa (busy timeout)
+    """
+
+    def __init__(self, shards: int = 64):
+        self.shards = max(shards, 1)
+        self._locks: List[asyncio.Lock] = [asyncio.Lock() for _ in range(self.shards)]
+        self.write_lock = asyncio.Lock()
+
+    def _shard(self, key) -> int:
+        return hash(str(key)) % self.shards
+
+    def lock_for(self, key) -> asyncio.Lock:
+        return self._locks[self._shard(key)]
+
+    @asynccontextmanager
+    async def acquire_many(self, keys: Iterable) -> AsyncIterator[None]:
+        # Ordem fixa de aquisição para evitar deadlock entre lotes
+        shards = sorted({self._shard(key) for key in keys})
+        acquired = []
+        try:
+            for shard in shards:
+                await self._locks[shard].acquire()
+                acquired.append(shard)
+            yield
+        finally:
+            for shard in reversed(acquired):
+                self._locks[shard].release()
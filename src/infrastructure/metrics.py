@@ -0,0 +1,283 @@
+import time
+from abc import ABC, abstractmethod
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from domain.observers import ReservationObserver
+
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+DB_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0)
+
+
+def _escape(value) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence, extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class Metric(ABC):
+    kind = "untyped"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def _key(self, labels: Dict) -> Tuple:
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    @abstractmethod
+    def samples(self) -> Iterable[str]:
+        pass
+
+    def render(self) -> List[str]:
+        return [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}",
+            *self.samples(),
+        ]
+
+
+class Counter(Metric):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._values: Dict[Tuple, float] = {}
+
+    def inc(self, amount: float = 1, **labels) -> None:
+        key = self._key(labels)
+        self._values[key] = self._values.get(key, 0) + amount
+
+    def value(self, **labels) -> float:
+        return self._values.get(self._key(labels), 0)
+
+    def samples(self) -> Iterable[str]:
+        for key, value in sorted(self._values.items()):
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}{labels} {_format_value(value)}"
+
+
+class Gauge(Counter):
+    kind = "gauge"
+
+    def dec(self, amount: float = 1, **labels) -> None:
+        self.inc(-amount, **labels)
+
+    def set(self, value: float, **labels) -> None:
+        self._values[self._key(labels)] = value
+
+
+class CallbackGauge(Metric):
+    """Gauge lido no momento da coleta a partir de uma função"""
+
+    kind = "gauge"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str],
+        callback: Callable[[], Iterable[Tuple[Sequence, float]]],
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.callback = callback
+
+    def samples(self) -> Iterable[str]:
+        for key, value in self.callback():
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}{labels} {_format_value(value)}"
+
+
+class Histogram(Metric):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Sequence[str] = (),
+        buckets: Sequence[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        self._series: Dict[Tuple, List] = {}
+
+    def observe(self, value: float, **labels) -> None:
+        key = self._key(labels)
+        series = self._series.get(key)
+        if series is None:
+            series = self._series[key] = [[0] * len(self.buckets), 0.0, 0]
+        counts = series[0]
+        for position, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[position] += 1
+                break
+        series[1] += value
+        series[2] += 1
+
+    def count(self, **labels) -> int:
+        series = self._series.get(self._key(labels))
+        return series[2] if series else 0
+
+    def samples(self) -> Iterable[str]:
+        for key, (counts, total, count) in sorted(self._series.items()):
+            cumulative = 0
+            for bound, amount in zip(self.buckets, counts):
+                cumulative += amount
+                labels = _format_labels(self.labelnames, key, f'le="{bound}"')
+                yield f"{self.name}_bucket{labels} {cumulative}"
+            labels = _format_labels(self.labelnames, key, 'le="+Inf"')
+            yield f"{self.name}_bucket{labels} {count}"
+            labels = _format_labels(self.labelnames, key)
+            yield f"{self.name}_sum{labels} {_format_value(total)}"
+            yield f"{self.name}_count{labels} {count}"
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._metrics: Dict[str, Metric] = {}
+
+    def register(self, metric: Metric) -> Metric:
+        self._metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames=()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def gauge(self, name: str, documentation: str, labelnames=()) -> Gauge:
+        return self.register(Gauge(name, documentation, labelnames))
+
+    def histogram(
+        self, name: str, documentation: str, labelnames=(), buckets=DEFAULT_BUCKETS
+    ) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def render(self, extra: Iterable[Metric] = ()) -> str:
+        lines = []
+        for metric in (*self._metrics.values(), *extra):
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+HTTP_REQUESTS = registry.counter(
+    "http_requests_total", "Requisições HTTP atendidas", ("method", "route", "status")
+)
+HTTP_REQUEST_DURATION = registry.histogram(
+    "http_request_duration_seconds",
+    "Latência das requisições HTTP por rota",
+    ("method", "route"),
+)
+HTTP_IN_FLIGHT = registry.gauge(
+    "http_requests_in_flight", "Requisições HTTP em andamento", ("method",)
+)
+DB_QUERIES = registry.counter(
+    "db_queries_total", "Consultas executadas no banco", ("database", "operation")
+)
+DB_QUERY_DURATION = registry.histogram(
+    "db_query_duration_seconds",
+    "Duração das consultas ao banco",
+    ("database", "operation"),
+    DB_BUCKETS,
+)
+RESERVATION_EVENTS = registry.counter(
+    "reservation_events_total",
+    "Eventos de reserva publicados (created, cancelled, conflict)",
+    ("event",),
+)
+
+
+class ComponentStats(CallbackGauge):
+    """
+    Estatísticas internas dos caches e pools de uma aplicação. Cada aplicação
+    tem a sua, renderizada junto do registry global em /metrics
+    """
+
+    def __init__(self):
+        super().__init__(
+            "component_stats",
+            "Estatísticas internas de caches e pools",
+            ("component", "stat"),
+            self._collect,
+        )
+        self._sources: Dict[str, Callable[[], Dict]] = {}
+
+    def register(self, component: str, stats: Callable[[], Dict]) -> None:
+        """Expõe os contadores numéricos de stats() como gauges do componente"""
+        self._sources[component] = stats
+
+    def _collect(self) -> Iterable[Tuple[Sequence, float]]:
+        for component, stats in self._sources.items():
+            for stat, value in stats().items():
+                if isinstance(value, (int, float)):
+                    yield (component, stat), value
+
+
+def query_operation(statement: str) -> str:
+    words = statement.split(None, 1)
+    return words[0].upper() if words else "UNKNOWN"
+
+
+def record_query(event) -> None:
+    labels = {"database": event.database, "operation": query_operation(event.statement)}
+    DB_QUERIES.inc(**labels)
+    DB_QUERY_DURATION.observe(event.duration, **labels)
+
+
+class MetricsMiddleware:
+    """Middleware ASGI que mede latência e requisições em andamento por rota"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        method = scope["method"]
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        HTTP_IN_FLIGHT.inc(method=method)
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            HTTP_IN_FLIGHT.dec(method=method)
+            # O template da rota (e não o caminho) mantém a cardinalidade baixa
+            route: Optional[object] = scope.get("route")
+            path = getattr(route, "path", "unmatched")
+            HTTP_REQUEST_DURATION.observe(elapsed, method=method, route=path)
+            HTTP_REQUESTS.inc(method=method, route=path, status=status_code)
+
+
+class MetricsObserver(ReservationObserver):
+    inline = True
+    blocking = False
+
+    def notify_reservation_created(self, reservation: dict) -> None:
+        RESERVATION_EVENTS.inc(event="created")
+
+    def notify_reservation_cancelled(self, reservation: dict) -> None:
+        RESERVATION_EVENTS.inc(event="cancelled")
+
+    def notify_reservation_conflict(self, reservation: dict) -> None:
+        RESERVATION_EVENTS.inc(event="conflict")
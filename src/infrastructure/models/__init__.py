@@ -1 +1 @@
-from .database_models import RoomDB, ReservationDB, Base, UserDB
+from .database_models import RoomDB, ReservationDB, ReservationSeriesDB, Base, UserDB
@@ -1,6 +1,6 @@
 from uuid import uuid4, UUID
 from sqlalchemy.ext.declarative import declarative_base
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey
+from sqlalchemy import Column, Integer, String, Date, DateTime, Text, ForeignKey, Index
 
 Base = declarative_base()
 
@@ -12,6 +12,10 @@ class RoomDB(Base):
     name = Column(String(50), nullable=False)
     capacity = Column(Integer, nullable=False)
     location = Column(String(100), nullable=False)
+    # Maior duração já gravada na sala: limita por baixo a busca por período
+    max_reservation_seconds = Column(
+        Integer, nullable=False, default=0, server_default="0"
+    )
 
 
 class UserDB(Base):
@@ -30,3 +34,24 @@ class ReservationDB(Base):
     user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
     start_time = Column(DateTime, nullable=False)
     end_time = Column(DateTime, nullable=False)
+    series_id = Column(String(36), ForeignKey("reservation_series.id"), nullable=True)
+
+    __table_args__ = (
+        Index("ix_reservations_room_period", "room_id", "start_time", "end_time"),
+        Index("ix_reservations_series", "series_id", "start_time"),
+    )
+
+
+class ReservationSeriesDB(Base):
+    __tablename__ = "reservation_series"
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    room_id = Column(String(36), ForeignKey("rooms.id"), nullable=False)
+    user_id = Column(String(36), ForeignKey("users.id"), nullable=False)
+    start_time = Column(DateTime, nullable=False)
+    end_time = Column(DateTime, nullable=False)
+    frequency = Column(String(10), nullable=False)
+    interval = Column(Integer, nullable=False, default=1)
+    until = Column(Date, nullable=True)
+    count = Column(Integer, nullable=True)
+    exceptions = Column(Text, nullable=False, default="[]")
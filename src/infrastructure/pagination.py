@@ -1,4 +1,7 @@
-from typing import List, TypeVar, Generic
+import base64
+import binascii
+from uuid import UUID
+from typing import Callable, List, Optional, TypeVar, Generic
 from pydantic import BaseModel
 
 T = TypeVar("T")
@@ -6,10 +9,11 @@ T = TypeVar("T")
 
 class PaginatedResponse(BaseModel, Generic[T]):
     items: List[T]
-    total: int
+    total: Optional[int] = None
     page: int
-    pages: int
+    pages: Optional[int] = None
     per_page: int
+    next_cursor: Optional[str] = None
 
 
 def paginate(items: List[T], page: int = 1, per_page: int = 10) -> PaginatedResponse[T]:
@@ -25,3 +29,42 @@ def paginate(items: List[T], page: int = 1, per_page: int = 10) -> PaginatedResp
         pages=total_pages,
         per_page=per_page,
     )
+
+
+def encode_cursor(key: str) -> str:
+    return base64.urlsafe_b64encode(key.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> str:
+    """Devolve o id da última sala da página anterior; ValueError se inválido"""
+    try:
+        padding = "=" * (-len(cursor) % 4)
+        key = base64.b64decode(cursor + padding, altchars=b"-_", validate=True)
+        return str(UUID(key.decode()))
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValueError("Cursor de paginação inválido")
+
+
+def paginate_keyset(
+    rows: List[T],
+    per_page: int,
+    key: Callable[[T], str],
+    page: int = 1,
+    total: Optional[int] = None,
+) -> PaginatedResponse[T]:
+    """
+    Monta a página a partir de até per_page + 1 linhas já limitadas no banco;
+    a linha excedente apenas indica que existe uma próxima página
+    """
+    items = rows[:per_page]
+    next_cursor = encode_cursor(key(items[-1])) if len(rows) > per_page else None
+    total_pages = (total + per_page - 1) // per_page if total is not None else None
+
+    return PaginatedResponse(
+        items=items,
+        total=total,
+        page=page,
+        pages=total_pages,
+        per_page=per_page,
+        next_cursor=next_cursor,
+    )
@@ -0,0 +1,86 @@
+import logging
+from contextvars import ContextVar
+from typing import List, Optional
+from infrastructure.sqlite_backend import QueryEvent
+
+PROFILE_REQUEST_HEADER = b"x-db-profile"
+PROFILE_RESPONSE_HEADER = b"x-db-summary"
+
+
+class QueryProfile:
+    """Consultas executadas durante uma requisição"""
+
+    def __init__(self):
+        self.queries: List[QueryEvent] = []
+        self.total_time = 0.0
+
+    def record(self, event: QueryEvent) -> None:
+        self.queries.append(event)
+        self.total_time += event.duration
+
+    def summary(self) -> str:
+        return f"queries={len(self.queries)}; db_ms={self.total_time * 1000:.2f}"
+
+
+_current_profile: ContextVar[Optional[QueryProfile]] = ContextVar(
+    "current_query_profile", default=None
+)
+
+
+class QueryProfiler:
+    """
+    Listener de consultas: registra no log de consultas lentas os comandos
+    acima do limite e acumula as consultas da requisição sendo perfilada
+    """
+
+    def __init__(self, slow_threshold: float):
+        self.slow_threshold = slow_threshold
+        self.logger = logging.getLogger("SlowQueryLog")
+
+    def __call__(self, event: QueryEvent) -> None:
+        if event.duration >= self.slow_threshold:
+            self.logger.warning(
+                f"Consulta lenta | {event.duration * 1000:.1f}ms | "
+                + f"Banco: {event.database} | "
+                + f"Parâmetros: {event.parameters} | "
+                + f"Linhas: {event.rows if event.rows is not None else '-'} | "
+                + " ".join(event.statement.split())
+            )
+
+        profile = _current_profile.get()
+        if profile is not None:
+            profile.record(event)
+
+
+class QueryProfileMiddleware:
+    """
+    Middleware ASGI opt-in: quando a requisição envia o cabeçalho
+    X-DB-Profile, a resposta traz X-DB-Summary com o número de consultas e o
+    tempo total gasto no banco
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not any(
+            name == PROFILE_REQUEST_HEADER for name, _ in scope["headers"]
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        profile = QueryProfile()
+
+        async def send_with_summary(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (PROFILE_RESPONSE_HEADER, profile.summary().encode()),
+                ]
+            await send(message)
+
+        token = _current_profile.set(profile)
+        try:
+            await self.app(scope, receive, send_with_summary)
+        finally:
+            _current_profile.reset(token)
@@ -1,28 +1,78 @@
+import asyncio
+import json
+import math
 from uuid import UUID, uuid4
+from datetime import datetime, timedelta
+from collections import defaultdict
 from databases import Database
-from sqlalchemy import select, and_
-from typing import List, Optional
-from domain.entities import MeetingRoom
+from sqlalchemy import select, and_, func, exists, text, bindparam, DateTime
+from typing import AsyncIterator, Callable, Dict, Iterable, List, Optional, Tuple
+from domain.entities import (
+    MeetingRoom,
+    ReservationRecord,
+    iter_occurrences,
+    sweep_conflicts,
+)
 from domain.models import ReservationCreate
 from domain.exceptions import (
     RoomNotFoundException,
     ReservationNotFoundException,
     ReservationConflictException,
 )
-from infrastructure.models import RoomDB, ReservationDB
+from infrastructure.models import RoomDB, ReservationDB, ReservationSeriesDB
+from infrastructure.room_cache import RoomCache, RoomCacheObserver
+from infrastructure.locks import ShardedLockTable
+from infrastructure.versions import VersionTable
 from domain.observers.observer import (
     ReservationSubject,
     LoggingObserver,
     EmailObserver,
 )
 
+# Mantém cada IN (...) bem abaixo do limite de parâmetros do SQLite
+IN_CLAUSE_BATCH_SIZE = 500
+
+# SQL fixo do INSERT condicional: compilar este text() custa uma fração da
+# montagem equivalente com select/exists, e ele roda dentro do write_lock
+CONDITIONAL_INSERT = text(
+    "INSERT INTO reservations (id, room_id, user_id, start_time, end_time) "
+    "SELECT :id, :room_id, :user_id, :start_time, :end_time "
+    "WHERE NOT EXISTS (SELECT 1 FROM reservations WHERE room_id = :room_id "
+    "AND start_time < :end_time AND end_time > :start_time)"
+).bindparams(
+    bindparam("start_time", type_=DateTime), bindparam("end_time", type_=DateTime)
+)
+
+# Mantém a maior duração da sala, que limita por baixo as buscas por período
+ROOM_MAX_DURATION_UPDATE = text(
+    "UPDATE rooms SET max_reservation_seconds = "
+    "MAX(max_reservation_seconds, :seconds) WHERE id = :room_id"
+)
+
 
 class RoomRepository:
-    def __init__(self, database: Database):
+    def __init__(
+        self,
+        database: Database,
+        reservation_subject: Optional[ReservationSubject] = None,
+        room_cache: Optional[RoomCache] = None,
+        room_locks: Optional[ShardedLockTable] = None,
+        read_database: Optional[Database] = None,
+        versions: Optional[VersionTable] = None,
+    ):
         self.db = database
-        self.reservation_subject = ReservationSubject()
-        self.reservation_subject.attach(LoggingObserver())
-        self.reservation_subject.attach(EmailObserver())
+        self.read_db = read_database or database
+        self.room_cache = room_cache
+        self.room_locks = room_locks or ShardedLockTable()
+        self.versions = versions
+        self._pending_inserts: List[Tuple[List, UUID, asyncio.Future]] = []
+        if reservation_subject is None:
+            reservation_subject = ReservationSubject()
+            if room_cache is not None:
+                reservation_subject.attach(RoomCacheObserver(room_cache))
+            reservation_subject.attach(LoggingObserver())
+            reservation_subject.attach(EmailObserver())
+        self.reservation_subject = reservation_subject
 
     async def add(self, room: MeetingRoom) -> None:
         query = RoomDB.__table__.insert().values(
@@ -30,92 +80,699 @@ class RoomRepository:
             name=room.name,
             capacity=room.capacity,
             location=room.location,
+            max_reservation_seconds=0,
         )
         await self.db.execute(query)
+        if self.room_cache is not None:
+            self.room_cache.put(room)
+        if self.versions is not None:
+            self.versions.bump_catalog()
+        self._bump_version(room.id)
 
-    async def get(self, room_id: UUID) -> MeetingRoom:
+    def _bump_version(self, room_id) -> None:
+        if self.versions is not None:
+            self.versions.bump(room_id)
+
+    async def _fetch_room(self, room_id: UUID):
         query = select(RoomDB).where(RoomDB.id == str(room_id))
-        room_db = await self.db.fetch_one(query)
+        room_db = await self.read_db.fetch_one(query)
 
         if not room_db:
             raise RoomNotFoundException(f"Sala com id {room_id} não encontrada")
+        return room_db
+
+    async def get(self, room_id: UUID) -> MeetingRoom:
+        if self.room_cache is not None:
+            room = self.room_cache.get(room_id)
+            if room is not None:
+                return room
+
+        room = await self._load(room_id)
+        if self.room_cache is not None:
+            self.room_cache.put(room)
+        return room
+
+    async def prime_cache(self, limit: int) -> int:
+        """Carrega até limit salas com todas as reservas para o cache"""
+        if self.room_cache is None or limit <= 0:
+            return 0
+
+        rooms = await self.get_page(
+            min(limit, self.room_cache.max_size), include_reservations=True
+        )
+        for room in rooms:
+            self.room_cache.put(room)
+        return len(rooms)
+
+    async def _load(self, room_id: UUID) -> MeetingRoom:
+        room_db = await self._fetch_room(room_id)
 
         reservations_query = select(ReservationDB).where(
             ReservationDB.room_id == str(room_id)
         )
-        reservations_db = await self.db.fetch_all(reservations_query)
+        reservations_db = await self.read_db.fetch_all(reservations_query)
 
-        reservations = [
-            {
-                "id": res.id,
-                "user_id": res.user_id,
-                "start_time": res.start_time,
-                "end_time": res.end_time,
-            }
-            for res in reservations_db
-        ]
+        return MeetingRoom.from_db(room_db, reservations_db)
+
+    async def get_in_window(
+        self, room_id: UUID, start_time: datetime, end_time: datetime
+    ) -> MeetingRoom:
+        """
+        Carrega a sala apenas com as reservas que se sobrepõem ao período.
+
+        A busca percorre o índice (room_id, start_time, end_time) apenas entre
+        início - maior duração da sala e o fim do período, então o custo
+        depende das reservas próximas e não do histórico. Não supõe que as
+        reservas da sala sejam disjuntas, já que bancos antigos podem ter
+        sobreposições. Com a sala inteira em cache o recorte é feito em
+        memória; na falta, responde a consulta limitada ao período e o cache
+        não é preenchido com o histórico da sala.
+        """
+        room = self._cached_window(room_id, start_time, end_time)
+        if room is not None:
+            return room
+        return await self._load_window(room_id, start_time, end_time)
+
+    def _cached_window(
+        self, room_id: UUID, start_time: datetime, end_time: datetime
+    ) -> Optional[MeetingRoom]:
+        if self.room_cache is None:
+            return None
+        room = self.room_cache.get(room_id)
+        return room.in_window(start_time, end_time) if room is not None else None
+
+    async def _load_window(
+        self, room_id: UUID, start_time: datetime, end_time: datetime
+    ) -> MeetingRoom:
+        room_db = await self._fetch_room(room_id)
+
+        reservations_query = self._range_query(
+            room_id, start_time, end_time, max_duration=self._max_duration(room_db)
+        )
+        reservations_db = await self.read_db.fetch_all(reservations_query)
+
+        return MeetingRoom.from_db(room_db, reservations_db)
+
+    async def _check_window(
+        self,
+        room_id: UUID,
+        start_time: datetime,
+        end_time: datetime,
+        check: Callable[[MeetingRoom], bool],
+    ) -> bool:
+        """
+        Aplica check à sala em cache e, se ela recusar, confirma no banco: o
+        cache só vê cancelamentos de outros workers quando expira. Se o banco
+        aceitar, a entrada defasada é descartada
+        """
+        room = self._cached_window(room_id, start_time, end_time)
+        if room is not None and check(room):
+            return True
 
-        return MeetingRoom.from_db(room_db, reservations)
+        if not check(await self._load_window(room_id, start_time, end_time)):
+            return False
+        if room is not None:
+            self.room_cache.invalidate(room_id)
+        return True
+
+    async def is_period_available(
+        self, room_id: UUID, start_time: datetime, end_time: datetime
+    ) -> bool:
+        return await self._check_window(
+            room_id,
+            start_time,
+            end_time,
+            lambda room: room.check_availability(start_time, end_time),
+        )
+
+    @staticmethod
+    def _max_duration(room_db) -> timedelta:
+        return timedelta(seconds=room_db["max_reservation_seconds"])
+
+    @staticmethod
+    def _range_query(
+        room_id: UUID,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+        max_duration: Optional[timedelta] = None,
+    ):
+        """
+        Reservas da sala que se sobrepõem a [start_time, end_time). Com
+        max_duration, quem termina depois de start_time começa depois de
+        start_time - max_duration: o intervalo do índice fica limitado dos
+        dois lados
+        """
+        query = select(ReservationDB).where(ReservationDB.room_id == str(room_id))
+
+        if start_time is not None:
+            query = query.where(ReservationDB.end_time > start_time)
+            if max_duration is not None:
+                query = query.where(
+                    ReservationDB.start_time > start_time - max_duration
+                )
+        if end_time is not None:
+            query = query.where(ReservationDB.start_time < end_time)
+
+        order = (
+            ReservationDB.start_time.desc() if descending else ReservationDB.start_time
+        )
+        query = query.order_by(order)
+        if limit is not None:
+            query = query.limit(limit)
+        return query
 
-    async def get_all(self) -> List[MeetingRoom]:
+    async def list_room_reservations(
+        self,
+        room_id: UUID,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+    ) -> List[dict]:
+        """
+        Lista as reservas da sala que se sobrepõem a [start_time, end_time),
+        filtrando no banco pelo índice (room_id, start_time, end_time)
+        """
+        room_db = await self._fetch_room(room_id)
+
+        query = self._range_query(
+            room_id,
+            start_time,
+            end_time,
+            descending,
+            limit,
+            max_duration=self._max_duration(room_db),
+        )
+        return [
+            ReservationRecord(
+                res.id, res.user_id, res.start_time, res.end_time
+            ).to_dict()
+            for res in await self.read_db.fetch_all(query)
+        ]
+
+    async def get_all(self, include_reservations: bool = True) -> List[MeetingRoom]:
         query = select(RoomDB)
-        rooms_db = await self.db.fetch_all(query)
+        rooms_db = await self.read_db.fetch_all(query)
+        return await self._hydrate(rooms_db, include_reservations)
 
-        rooms = []
-        for room_db in rooms_db:
-            reservations_query = select(ReservationDB).where(
-                ReservationDB.room_id == room_db.id
-            )
-            reservations_db = await self.db.fetch_all(reservations_query)
+    async def get_page(
+        self,
+        limit: int,
+        after: Optional[str] = None,
+        offset: int = 0,
+        include_reservations: bool = False,
+    ) -> List[MeetingRoom]:
+        query = select(RoomDB).order_by(RoomDB.id).limit(limit)
+        if after is not None:
+            query = query.where(RoomDB.id > after)
+        elif offset:
+            query = query.offset(offset)
 
-            reservations = [
-                {
-                    "id": res.id,
-                    "user_name": res.user_name,
-                    "start_time": res.start_time,
-                    "end_time": res.end_time,
-                }
-                for res in reservations_db
-            ]
+        rooms_db = await self.read_db.fetch_all(query)
+        return await self._hydrate(rooms_db, include_reservations)
 
-            rooms.append(MeetingRoom.from_db(room_db, reservations))
+    async def count(self) -> int:
+        query = select(func.count()).select_from(RoomDB)
+        return await self.read_db.fetch_val(query)
 
-        return rooms
+    async def find_available(
+        self,
+        start_time: datetime,
+        end_time: datetime,
+        min_capacity: Optional[int] = None,
+        location: Optional[str] = None,
+        limit: Optional[int] = None,
+        after: Optional[str] = None,
+    ) -> List[MeetingRoom]:
+        overlapping = exists().where(
+            ReservationDB.room_id == RoomDB.id,
+            ReservationDB.start_time < end_time,
+            ReservationDB.end_time > start_time,
+        )
+        query = select(RoomDB).where(~overlapping).order_by(RoomDB.id)
+        if min_capacity is not None:
+            query = query.where(RoomDB.capacity >= min_capacity)
+        if location is not None:
+            query = query.where(RoomDB.location == location)
+        if after is not None:
+            query = query.where(RoomDB.id > after)
+        if limit is not None:
+            query = query.limit(limit)
+
+        rooms_db = await self.read_db.fetch_all(query)
+        return await self._hydrate(rooms_db, include_reservations=False)
+
+    async def _hydrate(
+        self, rooms_db: List, include_reservations: bool = True
+    ) -> List[MeetingRoom]:
+        reservations_by_room: Dict[str, List] = defaultdict(list)
+        if include_reservations:
+            reservations_db = await self._fetch_reservations_by_room(
+                room_db.id for room_db in rooms_db
+            )
+            for res in reservations_db:
+                reservations_by_room[res.room_id].append(res)
+
+        return [
+            MeetingRoom.from_db(room_db, reservations_by_room.get(room_db.id, []))
+            for room_db in rooms_db
+        ]
+
+    async def _fetch_reservations_by_room(self, room_ids: Iterable[str]) -> List:
+        room_ids = list(room_ids)
+        reservations_db = []
+        for offset in range(0, len(room_ids), IN_CLAUSE_BATCH_SIZE):
+            batch = room_ids[offset : offset + IN_CLAUSE_BATCH_SIZE]
+            query = select(ReservationDB).where(ReservationDB.room_id.in_(batch))
+            reservations_db.extend(await self.read_db.fetch_all(query))
+        return reservations_db
 
     async def create_reservation(
         self, reservation: ReservationCreate, user_id: UUID
     ) -> UUID:
-        room = await self.get(reservation.room_id)
-        reservation_id = uuid4()
-
-        if not room.add_reservation(
-            reservation_id,
-            user_id,
-            reservation.start_time,
-            reservation.end_time,
-        ):
+        async with self.room_locks.lock_for(reservation.room_id):
+            reservation_id = uuid4()
+            accepted = await self._check_window(
+                reservation.room_id,
+                reservation.start_time,
+                reservation.end_time,
+                lambda room: room.add_reservation(
+                    reservation_id,
+                    user_id,
+                    reservation.start_time,
+                    reservation.end_time,
+                ),
+            )
+            if accepted:
+                [accepted] = await self._insert_if_free(
+                    [(reservation_id, reservation)], user_id
+                )
+
+        if not accepted:
+            await self.reservation_subject.publish_conflict(
+                self._reservation_event(None, reservation, user_id)
+            )
             raise ReservationConflictException("Conflito de horário detectado")
 
-        query = ReservationDB.__table__.insert().values(
+        self._bump_version(reservation.room_id)
+        await self.reservation_subject.publish_creation(
+            self._reservation_event(reservation_id, reservation, user_id)
+        )
+
+        return reservation_id
+
+    @staticmethod
+    def _reservation_event(
+        reservation_id: Optional[UUID], reservation: ReservationCreate, user_id: UUID
+    ) -> dict:
+        return {
+            "id": reservation_id,
+            "room_id": reservation.room_id,
+            "user_id": user_id,
+            "start_time": reservation.start_time,
+            "end_time": reservation.end_time,
+        }
+
+    async def _insert_if_free(
+        self, reservations: List[Tuple[UUID, ReservationCreate]], user_id: UUID
+    ) -> List[bool]:
+        """
+        Grava cada reserva somente se não houver sobreposição no banco.
+
+        O BEGIN IMMEDIATE reserva o lock de escrita do SQLite antes da checagem,
+        então a verificação e o INSERT são atômicos também entre processos.
+        As gravações pendentes de salas diferentes entram juntas na transação
+        de quem obtém o write_lock (commit em grupo), em vez de cada uma
+        esperar a sua vez pelo lock. Retorna, para cada reserva, se ela foi
+        gravada
+        """
+        future = asyncio.get_running_loop().create_future()
+        entry = (reservations, user_id, future)
+        self._pending_inserts.append(entry)
+        try:
+            async with self.room_locks.write_lock:
+                if not future.done():
+                    batch, self._pending_inserts = self._pending_inserts, []
+                    try:
+                        await self._commit_inserts(batch)
+                    except asyncio.CancelledError:
+                        # O lote foi desfeito: os demais voltam para a fila e
+                        # o próximo a obter o write_lock os grava
+                        self._pending_inserts[:0] = [
+                            pending for pending in batch if pending is not entry
+                        ]
+                        raise
+        except asyncio.CancelledError:
+            # Cancelada antes de entrar em algum lote: não grava mais nada
+            if entry in self._pending_inserts:
+                self._pending_inserts.remove(entry)
+            raise
+        inserted = future.result()
+
+        if self.room_cache is not None and not all(inserted):
+            # Outro processo gravou antes: a sala em cache está desatualizada
+            for (_, reservation), was_inserted in zip(reservations, inserted):
+                if not was_inserted:
+                    self.room_cache.invalidate(reservation.room_id)
+                    self._bump_version(reservation.room_id)
+        return inserted
+
+    async def _commit_inserts(
+        self, batch: List[Tuple[List, UUID, asyncio.Future]]
+    ) -> None:
+        """Grava um lote de _insert_if_free em uma transação e resolve os futures"""
+        results = []
+        try:
+            async with self.db.connection() as connection:
+                raw_connection = connection.raw_connection
+                await raw_connection.execute("BEGIN IMMEDIATE")
+                try:
+                    max_seconds: Dict[str, int] = {}
+                    for reservations, user_id, _ in batch:
+                        inserted = []
+                        for reservation_id, reservation in reservations:
+                            await connection.execute(
+                                self._conditional_insert(
+                                    reservation_id, reservation, user_id
+                                )
+                            )
+                            was_inserted = (
+                                await connection.fetch_val("SELECT changes()") == 1
+                            )
+                            inserted.append(was_inserted)
+                            if was_inserted:
+                                room_id = str(reservation.room_id)
+                                max_seconds[room_id] = max(
+                                    max_seconds.get(room_id, 0),
+                                    self._duration_seconds(reservation),
+                                )
+                        results.append(inserted)
+                    for room_id, seconds in max_seconds.items():
+                        await connection.execute(
+                            ROOM_MAX_DURATION_UPDATE.bindparams(
+                                room_id=room_id, seconds=seconds
+                            )
+                        )
+                    await raw_connection.execute("COMMIT")
+                except BaseException:
+                    await raw_connection.execute("ROLLBACK")
+                    raise
+        except Exception as e:
+            for _, _, future in batch:
+                future.set_exception(e)
+            return
+
+        for (_, _, future), inserted in zip(batch, results):
+            future.set_result(inserted)
+
+    @staticmethod
+    def _duration_seconds(reservation: ReservationCreate) -> int:
+        return math.ceil(
+            (reservation.end_time - reservation.start_time).total_seconds()
+        )
+
+    @staticmethod
+    def _conditional_insert(
+        reservation_id: UUID, reservation: ReservationCreate, user_id: UUID
+    ):
+        return CONDITIONAL_INSERT.bindparams(
             id=str(reservation_id),
             room_id=str(reservation.room_id),
             user_id=str(user_id),
             start_time=reservation.start_time,
             end_time=reservation.end_time,
         )
-        await self.db.execute(query)
 
-        self.reservation_subject.notify_creation(
+    async def create_reservations_bulk(
+        self, reservations: List[ReservationCreate], user_id: UUID
+    ) -> List[dict]:
+        """
+        Cria várias reservas carregando cada sala envolvida uma única vez.
+
+        Cada item é validado contra as reservas já gravadas e contra os itens
+        aceitos antes dele no mesmo lote; os aceitos são gravados juntos em uma
+        única transação. Retorna o resultado de cada item na ordem recebida
+        """
+        results: List[Optional[dict]] = [None] * len(reservations)
+        indexes_by_room: Dict[UUID, List[int]] = defaultdict(list)
+        for index, reservation in enumerate(reservations):
+            indexes_by_room[reservation.room_id].append(index)
+
+        async with self.room_locks.acquire_many(indexes_by_room):
+            accepted = []
+            for room_id, indexes in indexes_by_room.items():
+                placed: Dict[int, UUID] = {}
+
+                def place(room: MeetingRoom) -> bool:
+                    placed.clear()
+                    for index in indexes:
+                        reservation_id = uuid4()
+                        if room.add_reservation(
+                            reservation_id,
+                            user_id,
+                            reservations[index].start_time,
+                            reservations[index].end_time,
+                        ):
+                            placed[index] = reservation_id
+                    return len(placed) == len(indexes)
+
+                try:
+                    await self._check_window(
+                        room_id,
+                        min(reservations[index].start_time for index in indexes),
+                        max(reservations[index].end_time for index in indexes),
+                        place,
+                    )
+                except RoomNotFoundException as e:
+                    for index in indexes:
+                        results[index] = {
+                            "index": index,
+                            "status": 404,
+                            "detail": str(e),
+                        }
+                    continue
+
+                for index in indexes:
+                    if index not in placed:
+                        results[index] = self._bulk_conflict(index)
+                        continue
+                    accepted.append((index, placed[index], reservations[index]))
+
+            inserted = (
+                await self._insert_if_free(
+                    [
+                        (reservation_id, reservation)
+                        for _, reservation_id, reservation in accepted
+                    ],
+                    user_id,
+                )
+                if accepted
+                else []
+            )
+
+        for (index, reservation_id, reservation), was_inserted in zip(
+            accepted, inserted
+        ):
+            if not was_inserted:
+                results[index] = self._bulk_conflict(index)
+                continue
+
+            results[index] = {"index": index, "status": 201, "id": reservation_id}
+            self._bump_version(reservation.room_id)
+            await self.reservation_subject.publish_creation(
+                self._reservation_event(reservation_id, reservation, user_id)
+            )
+
+        for result in results:
+            if result["status"] == 409:
+                await self.reservation_subject.publish_conflict(
+                    self._reservation_event(
+                        None, reservations[result["index"]], user_id
+                    )
+                )
+
+        return results
+
+    @staticmethod
+    def _bulk_conflict(index: int) -> dict:
+        return {
+            "index": index,
+            "status": 409,
+            "detail": "Conflito de horário detectado",
+        }
+
+    async def create_reservation_series(
+        self, reservation: ReservationCreate, user_id: UUID
+    ) -> dict:
+        """
+        Cria uma reserva recorrente: todas as ocorrências ou nenhuma.
+
+        Regras que passam do horizonte da recorrência são recusadas com
+        ValueError; as ocorrências são expandidas e comparadas com as reservas da sala em uma única varredura ordenada;
+        a série e suas ocorrências são gravadas na mesma transação
+        """
+        occurrences = [
+            (
+                uuid4(),
+                reservation.model_copy(
+                    update={
+                        "start_time": start_time,
+                        "end_time": end_time,
+                        "recurrence": None,
+                    }
+                ),
+            )
+            for start_time, end_time in iter_occurrences(
+                reservation.recurrence, reservation.start_time, reservation.end_time
+            )
+        ]
+        if not occurrences:
+            raise ValueError("A recorrência não gera nenhuma ocorrência")
+
+        series_id = uuid4()
+        async with self.room_locks.lock_for(reservation.room_id):
+            window = (occurrences[0][1].start_time, occurrences[-1][1].end_time)
+            room = self._cached_window(reservation.room_id, *window)
+            from_cache = room is not None
+            if room is None:
+                room = await self._load_window(reservation.room_id, *window)
+            conflicts = list(
+                sweep_conflicts(
+                    (
+                        (occurrence.start_time, occurrence.end_time)
+                        for _, occurrence in occurrences
+                    ),
+                    room.reservations,
+                )
+            )
+            # Conflitos vistos no cache podem ser cancelamentos que ele ainda
+            # não recebeu: _insert_series confere de novo no banco e decide
+            if not conflicts or from_cache:
+                conflicts = await self._insert_series(
+                    series_id, reservation, user_id, occurrences
+                )
+                if conflicts and self.room_cache is not None:
+                    self.room_cache.invalidate(reservation.room_id)
+
+        if conflicts:
+            await self.reservation_subject.publish_conflict(
+                self._reservation_event(None, reservation, user_id)
+            )
+            dates = ", ".join(
+                occurrences[index][1].start_time.isoformat() for index in conflicts[:5]
+            )
+            raise ReservationConflictException(
+                f"Conflito de horário detectado em {len(conflicts)} "
+                f"ocorrência(s): {dates}"
+            )
+
+        self._bump_version(reservation.room_id)
+        for occurrence_id, occurrence in occurrences:
+            await self.reservation_subject.publish_creation(
+                self._reservation_event(occurrence_id, occurrence, user_id)
+            )
+
+        return {
+            "series_id": series_id,
+            "room_id": reservation.room_id,
+            "user_id": user_id,
+            "start_time": reservation.start_time,
+            "end_time": reservation.end_time,
+            "recurrence": reservation.recurrence.model_dump(),
+            "occurrences": len(occurrences),
+            "last_end_time": occurrences[-1][1].end_time,
+        }
+
+    async def _insert_series(
+        self,
+        series_id: UUID,
+        reservation: ReservationCreate,
+        user_id: UUID,
+        occurrences: List[Tuple[UUID, ReservationCreate]],
+    ) -> List[int]:
+        """
+        Grava a série e as ocorrências em uma transação BEGIN IMMEDIATE.
+
+        Com o lock de escrita do SQLite já reservado, as reservas da sala no
+        período da série são lidas de novo e varridas contra as ocorrências:
+        a checagem vale também entre processos e custa uma consulta, em vez de
+        um INSERT condicional por ocorrência. Se algum horário estiver
+        ocupado nada é gravado; retorna as posições das ocorrências ocupadas
+        """
+        rule = reservation.recurrence
+        periods = [
+            (occurrence.start_time, occurrence.end_time)
+            for _, occurrence in occurrences
+        ]
+        rows = [
             {
-                "id": reservation_id,
-                "room_id": reservation.room_id,
-                "user_id": user_id,
-                "start_time": reservation.start_time,
-                "end_time": reservation.end_time,
+                "id": str(occurrence_id),
+                "room_id": str(reservation.room_id),
+                "user_id": str(user_id),
+                "start_time": occurrence.start_time,
+                "end_time": occurrence.end_time,
+                "series_id": str(series_id),
             }
-        )
+            for occurrence_id, occurrence in occurrences
+        ]
+        # Cada linha usa 6 parâmetros: mantém o INSERT no mesmo limite do IN
+        rows_per_insert = IN_CLAUSE_BATCH_SIZE // len(rows[0])
 
-        return reservation_id
+        async with self.room_locks.write_lock, self.db.connection() as connection:
+            raw_connection = connection.raw_connection
+            await raw_connection.execute("BEGIN IMMEDIATE")
+            try:
+                room_db = await connection.fetch_one(
+                    select(RoomDB).where(RoomDB.id == str(reservation.room_id))
+                )
+                reservations_db = await connection.fetch_all(
+                    self._range_query(
+                        reservation.room_id,
+                        periods[0][0],
+                        periods[-1][1],
+                        max_duration=self._max_duration(room_db),
+                    )
+                )
+                conflicts = list(sweep_conflicts(periods, reservations_db))
+                if conflicts:
+                    await raw_connection.execute("ROLLBACK")
+                    return conflicts
+
+                await connection.execute(
+                    ReservationSeriesDB.__table__.insert().values(
+                        id=str(series_id),
+                        room_id=str(reservation.room_id),
+                        user_id=str(user_id),
+                        start_time=reservation.start_time,
+                        end_time=reservation.end_time,
+                        frequency=rule.frequency,
+                        interval=rule.interval,
+                        until=rule.until,
+                        count=rule.count,
+                        exceptions=json.dumps(
+                            [day.isoformat() for day in rule.exceptions]
+                        ),
+                    )
+                )
+                for offset in range(0, len(rows), rows_per_insert):
+                    await connection.execute(
+                        ReservationDB.__table__.insert().values(
+                            rows[offset : offset + rows_per_insert]
+                        )
+                    )
+                await connection.execute(
+                    ROOM_MAX_DURATION_UPDATE.bindparams(
+                        room_id=str(reservation.room_id),
+                        seconds=self._duration_seconds(reservation),
+                    )
+                )
+                await raw_connection.execute("COMMIT")
+            except BaseException:
+                await raw_connection.execute("ROLLBACK")
+                raise
+        return []
 
     async def delete_reservation(self, reservation_id: UUID) -> bool:
         query = select(ReservationDB).where(ReservationDB.id == str(reservation_id))
@@ -126,21 +783,128 @@ class RoomRepository:
                 f"Reserva com id {reservation_id} não encontrada"
             )
 
-        room = await self.get(UUID(reservation.room_id))
-        room.cancel_reservation(reservation_id)
-
         delete_query = ReservationDB.__table__.delete().where(
             ReservationDB.id == str(reservation_id)
         )
         await self.db.execute(delete_query)
+        self._bump_version(reservation.room_id)
 
-        self.reservation_subject.notify_cancellation(str(reservation_id))
+        if self.room_cache is not None:
+            cached_room = self.room_cache.peek(reservation.room_id)
+            if (
+                cached_room is not None
+                and reservation_id not in cached_room.reservations
+            ):
+                # Reserva gravada por outro worker: a sala em cache está defasada
+                self.room_cache.invalidate(reservation.room_id)
+        await self.reservation_subject.publish_cancellation(
+            {"id": str(reservation_id), "room_id": reservation.room_id}
+        )
 
         return True
 
+    async def get_series(
+        self, series_id: UUID, after: Optional[datetime] = None, limit: int = 100
+    ) -> dict:
+        """
+        Devolve a regra da série e uma página das ocorrências ainda ativas,
+        a partir de after; next_after indica onde começa a próxima página
+        """
+        query = select(ReservationSeriesDB).where(
+            ReservationSeriesDB.id == str(series_id)
+        )
+        series = await self.read_db.fetch_one(query)
+        if not series:
+            raise ReservationNotFoundException(
+                f"Série de reservas com id {series_id} não encontrada"
+            )
+
+        occurrences_query = (
+            select(ReservationDB)
+            .where(ReservationDB.series_id == str(series_id))
+            .order_by(ReservationDB.start_time)
+            .limit(limit + 1)
+        )
+        if after is not None:
+            occurrences_query = occurrences_query.where(
+                ReservationDB.start_time > after
+            )
+        rows = await self.read_db.fetch_all(occurrences_query)
+
+        return {
+            "id": UUID(series.id),
+            "room_id": UUID(series.room_id),
+            "user_id": UUID(series.user_id),
+            "start_time": series.start_time,
+            "end_time": series.end_time,
+            # Acesso por chave: count e index também são métodos do Record
+            "recurrence": {
+                "frequency": series["frequency"],
+                "interval": series["interval"],
+                "until": series["until"],
+                "count": series["count"],
+                "exceptions": json.loads(series["exceptions"]),
+            },
+            "occurrences": [
+                ReservationRecord(
+                    row["id"], row["user_id"], row["start_time"], row["end_time"]
+                ).to_dict()
+                for row in rows[:limit]
+            ],
+            "next_after": rows[limit - 1]["start_time"] if len(rows) > limit else None,
+        }
+
+    async def delete_series(self, series_id: UUID) -> int:
+        """
+        Cancela todas as ocorrências da série em uma transação BEGIN IMMEDIATE,
+        sob o mesmo lock de escrita das gravações; retorna quantas foram
+        removidas
+        """
+        query = select(ReservationSeriesDB).where(
+            ReservationSeriesDB.id == str(series_id)
+        )
+        series = await self.db.fetch_one(query)
+        if not series:
+            raise ReservationNotFoundException(
+                f"Série de reservas com id {series_id} não encontrada"
+            )
+
+        occurrences_query = select(ReservationDB.id).where(
+            ReservationDB.series_id == str(series_id)
+        )
+        async with self.room_locks.write_lock, self.db.connection() as connection:
+            raw_connection = connection.raw_connection
+            await raw_connection.execute("BEGIN IMMEDIATE")
+            try:
+                occurrence_ids = [
+                    row["id"] for row in await connection.fetch_all(occurrences_query)
+                ]
+                await connection.execute(
+                    ReservationDB.__table__.delete().where(
+                        ReservationDB.series_id == str(series_id)
+                    )
+                )
+                await connection.execute(
+                    ReservationSeriesDB.__table__.delete().where(
+                        ReservationSeriesDB.id == str(series_id)
+                    )
+                )
+                await raw_connection.execute("COMMIT")
+            except BaseException:
+                await raw_connection.execute("ROLLBACK")
+                raise
+        self._bump_version(series.room_id)
+
+        for occurrence_id in occurrence_ids:
+            await self.reservation_subject.publish_cancellation(
+                {"id": occurrence_id, "room_id": series.room_id}
+            )
+
+        return len(occurrence_ids)
+
     async def get_reservation_by_id(self, reservation_id: UUID) -> Optional[dict]:
         query = select(ReservationDB).where(ReservationDB.id == str(reservation_id))
-        reservation = await self.db.fetch_one(query)
+        reservation = await self.read_db.fetch_one(query)
 
         if not reservation:
             raise ReservationNotFoundException(
@@ -154,3 +918,27 @@ class RoomRepository:
             "start_time": reservation.start_time,
             "end_time": reservation.end_time,
         }
+
+    async def stream_room_reservations(
+        self,
+        room_id: UUID,
+        start_time: Optional[datetime] = None,
+        end_time: Optional[datetime] = None,
+        descending: bool = False,
+        limit: Optional[int] = None,
+    ) -> AsyncIterator:
+        """
+        Valida a sala e devolve um iterador sobre o cursor das reservas, sem
+        carregar o histórico inteiro em memória
+        """
+        room_db = await self._fetch_room(room_id)
+
+        query = self._range_query(
+            room_id,
+            start_time,
+            end_time,
+            descending,
+            limit,
+            max_duration=self._max_duration(room_db),
+        )
+        return self.read_db.iterate(query)
@@ -2,16 +2,23 @@ from typing import Optional
 from uuid import uuid4, UUID
 from databases import Database
 from infrastructure.models import UserDB
-from infrastructure.security import hash_password
+from infrastructure.security import PasswordHasher
 
 
 class UserRepository:
-    def __init__(self, database: Database):
+    def __init__(
+        self,
+        database: Database,
+        password_hasher: PasswordHasher,
+        read_database: Optional[Database] = None,
+    ):
         self.db = database
+        self.password_hasher = password_hasher
+        self.read_db = read_database or database
 
     async def get_user_by_id(self, user_id: UUID) -> Optional[dict]:
         query = UserDB.__table__.select().where(UserDB.id == str(user_id))
-        user_db = await self.db.fetch_one(query)
+        user_db = await self.read_db.fetch_one(query)
         if user_db:
             return {
                 "id": UUID(user_db["id"]),
@@ -21,11 +28,11 @@ class UserRepository:
 
     async def get_by_username(self, username: str) -> UserDB:
         query = UserDB.__table__.select().where(UserDB.username == username)
-        user = await self.db.fetch_one(query)
+        user = await self.read_db.fetch_one(query)
         return user
 
     async def create(self, username: str, password: str) -> int:
-        hashed_password = hash_password(password)
+        hashed_password = await self.password_hasher.hash(password)
         user_id = uuid4()
         query = UserDB.__table__.insert().values(
             id=str(user_id), username=username, password=hashed_password
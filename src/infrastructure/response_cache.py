@@ -0,0 +1,74 @@
+import json
+from uuid import UUID
+from datetime import date
+from collections import OrderedDict
+from typing import Optional, Tuple
+from fastapi import Response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _default(value):
+    if isinstance(value, UUID):
+        return str(value)
+    if isinstance(value, date):
+        return value.isoformat()
+    raise TypeError(f"Tipo não serializável: {type(value).__name__}")
+
+
+def dumps(document) -> bytes:
+    """Serializa com orjson quando instalado; senão com o json da biblioteca padrão"""
+    if orjson is not None:
+        return orjson.dumps(document)
+    return json.dumps(
+        document, default=_default, ensure_ascii=False, separators=(",", ":")
+    ).encode()
+
+
+class ResponseCache:
+    """
+    Cache LRU de corpos JSON já serializados, indexado pela chave do documento
+    (rota e parâmetros) e validado pelo ETag em vigor: uma entrada só é
+    reaproveitada enquanto a versão dos dados que a geraram não mudar
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, Tuple[str, bytes]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str, etag: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None or entry[0] != etag:
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return entry[1]
+
+    def put(self, key: str, etag: str, body: bytes) -> None:
+        if self.max_size <= 0:
+            return
+
+        self._entries[key] = (etag, body)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self), "hits": self.hits, "misses": self.misses}
+
+
+def json_response(body: bytes, headers: dict) -> Response:
+    return Response(content=body, media_type="application/json", headers=headers)
@@ -0,0 +1,118 @@
+import time
+from uuid import UUID
+from collections import OrderedDict
+from typing import Optional, Tuple
+from domain.entities import MeetingRoom, ReservationRecord
+from domain.observers import ReservationObserver
+from domain.states import state_for
+
+
+class RoomCache:
+    """
+    Cache LRU/TTL em memória das salas hidratadas com todas as reservas.
+    As salas em cache são compartilhadas e não devem ser alteradas por quem
+    as lê; as alterações chegam pelo RoomCacheObserver
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        self._entries: "OrderedDict[str, Tuple[float, MeetingRoom]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, room_id) -> Optional[MeetingRoom]:
+        key = str(room_id)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, room = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            self.evictions += 1
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return room
+
+    def peek(self, room_id) -> Optional[MeetingRoom]:
+        entry = self._entries.get(str(room_id))
+        return entry[1] if entry is not None else None
+
+    def put(self, room: MeetingRoom) -> None:
+        if self.max_size <= 0:
+            return
+
+        key = str(room.id)
+        self._entries[key] = (time.monotonic() + self.ttl_seconds, room)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def invalidate(self, room_id) -> None:
+        if self._entries.pop(str(room_id), None) is not None:
+            self.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def apply_created(self, reservation: dict) -> None:
+        room = self.peek(reservation["room_id"])
+        if room is None:
+            return
+        if room.reservations.count_overlapping(
+            reservation["start_time"], reservation["end_time"]
+        ):
+            # O banco aceitou a reserva: a sobreposição vem de uma sala defasada
+            self.invalidate(reservation["room_id"])
+            return
+
+        room.reservations.add(
+            ReservationRecord(
+                reservation["id"],
+                reservation["user_id"],
+                reservation["start_time"],
+                reservation["end_time"],
+            )
+        )
+        room.state = state_for(len(room.reservations))
+
+    def apply_cancelled(self, reservation: dict) -> None:
+        room = self.peek(reservation["room_id"])
+        reservation_id = UUID(str(reservation["id"]))
+        if room is not None and reservation_id in room.reservations:
+            room.cancel_reservation(reservation_id)
+
+    def stats(self) -> dict:
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "invalidations": self.invalidations,
+        }
+
+
+class RoomCacheObserver(ReservationObserver):
+    inline = True
+    blocking = False
+
+    def __init__(self, cache: RoomCache):
+        super().__init__()
+        self.cache = cache
+
+    def notify_reservation_created(self, reservation: dict) -> None:
+        self.cache.apply_created(reservation)
+
+    def notify_reservation_cancelled(self, reservation: dict) -> None:
+        self.cache.apply_cancelled(reservation)
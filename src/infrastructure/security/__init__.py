@@ -1,6 +1,9 @@
 from .auth import (
+    authenticate_token,
     create_access_token,
     get_current_user,
     hash_password,
     verify_password,
 )
+from .password_hasher import PasswordHasher
+from .token_cache import TokenCache
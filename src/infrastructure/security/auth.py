@@ -2,24 +2,24 @@ from uuid import UUID
 from datetime import datetime, timedelta
 from typing import Optional
 from jose import JWTError, jwt
-from passlib.context import CryptContext
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
+from .password_hasher import get_password_context
+from .token_cache import TokenCache
 
 SECRET_KEY = "CHAVE_SUPER_SECRETA"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRES_MINUTES = 60
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="token")
 
 
 def hash_password(password: str) -> str:
-    return pwd_context.hash(password)
+    return get_password_context().hash(password)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
-    return pwd_context.verify(plain_password, hashed_password)
+    return get_password_context().verify(plain_password, hashed_password)
 
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
@@ -33,12 +33,16 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     return encoded_jwt
 
 
-async def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
+def authenticate_token(token: str, token_cache: TokenCache) -> dict:
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Credenciais inválidas ou usuário não encontrado",
         headers={"WWW-Authenticate": "Bearer"},
     )
+    cached_user = token_cache.get(token)
+    if cached_user is not None:
+        return cached_user
+
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
         user_id: UUID = payload.get("user_id")
@@ -46,6 +50,15 @@ async def get_current_user(token: str = Depends(oauth2_scheme)) -> dict:
         if username is None or user_id is None:
             raise credentials_exception
 
-        return {"username": username, "user_id": user_id}
+        user = {"username": username, "user_id": user_id}
+        if payload.get("exp") is not None:
+            token_cache.put(token, user, float(payload["exp"]))
+        return user
     except (JWTError, ValueError):
         raise credentials_exception
+
+
+async def get_current_user(
+    request: Request, token: str = Depends(oauth2_scheme)
+) -> dict:
+    return authenticate_token(token, request.app.state.token_cache)
@@ -0,0 +1,100 @@
+import asyncio
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Optional
+from passlib.context import CryptContext
+
+DEFAULT_BCRYPT_ROUNDS = 12
+
+
+@lru_cache
+def get_password_context(rounds: int = DEFAULT_BCRYPT_ROUNDS) -> CryptContext:
+    return CryptContext(schemes=["bcrypt"], deprecated="auto", bcrypt__rounds=rounds)
+
+
+class PasswordHashingStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.completed = 0
+        self.total_queue_delay = 0.0
+        self.max_queue_delay = 0.0
+
+    def record_queue_delay(self, delay: float) -> None:
+        with self._lock:
+            self.completed += 1
+            self.total_queue_delay += delay
+            self.max_queue_delay = max(self.max_queue_delay, delay)
+
+    @property
+    def mean_queue_delay(self) -> float:
+        if not self.completed:
+            return 0.0
+        return self.total_queue_delay / self.completed
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "completed": self.completed,
+                "mean_queue_delay": self.mean_queue_delay,
+                "max_queue_delay": self.max_queue_delay,
+            }
+
+
+class PasswordHasher:
+    """
+    Executa o hash/verificação de senhas (bcrypt) em um pool de threads
+    dedicado, fora do event loop, limitando quantas operações ficam pendentes
+    """
+
+    def __init__(
+        self, max_workers: int, max_pending: int, rounds: int = DEFAULT_BCRYPT_ROUNDS
+    ):
+        self.max_workers = max_workers
+        self.max_pending = max(max_pending, max_workers)
+        self.rounds = rounds
+        self.stats = PasswordHashingStats()
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._slots = asyncio.Semaphore(self.max_pending)
+
+    @property
+    def context(self) -> CryptContext:
+        return get_password_context(self.rounds)
+
+    def load_backend(self) -> None:
+        """Carrega o backend do bcrypt, que o passlib só importa no primeiro hash"""
+        self.context.handler().get_backend()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers, thread_name_prefix="password-hasher"
+            )
+        return self._executor
+
+    async def run(self, func: Callable[..., Any], *args: Any) -> Any:
+        async with self._slots:
+            submitted_at = time.perf_counter()
+
+            def job() -> Any:
+                delay = time.perf_counter() - submitted_at
+                self.stats.record_queue_delay(delay)
+                self.logger.debug(f"Hash de senha na fila por {delay * 1000:.1f}ms")
+                return func(*args)
+
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), job)
+
+    async def hash(self, password: str) -> str:
+        return await self.run(self.context.hash, password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.run(self.context.verify, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
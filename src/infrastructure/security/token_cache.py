@@ -0,0 +1,57 @@
+import hashlib
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+
+class TokenCache:
+    """
+    Cache LRU de tokens JWT já verificados, indexado pelo SHA-256 do token.
+    Cada entrada expira junto com o claim exp do próprio token
+    """
+
+    def __init__(self, max_size: int):
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[bytes, Tuple[float, dict]]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> Optional[dict]:
+        key = self._key(token)
+        entry = self._entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+
+        expires_at, user = entry
+        if time.time() >= expires_at:
+            del self._entries[key]
+            self.misses += 1
+            return None
+
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return dict(user)
+
+    def put(self, token: str, user: dict, expires_at: float) -> None:
+        if self.max_size <= 0:
+            return
+
+        key = self._key(token)
+        self._entries[key] = (expires_at, dict(user))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        return {"size": len(self), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,173 @@
+import logging
+import time
+import typing
+import aiosqlite
+from databases import Database, DatabaseURL
+from databases.backends.sqlite import SQLiteBackend, SQLiteConnection, SQLitePool
+
+logger = logging.getLogger("databases")
+
+
+class PooledSQLitePool(SQLitePool):
+    """
+    Mantém até pool_size conexões aiosqlite abertas para reuso, aplicando os
+    PRAGMAs uma única vez na abertura de cada conexão
+    """
+
+    def __init__(
+        self,
+        url: DatabaseURL,
+        pool_size: int,
+        pragmas: typing.Dict[str, object],
+        **options: typing.Any,
+    ) -> None:
+        super().__init__(url, **options)
+        self.pool_size = pool_size
+        self.pragmas = pragmas
+        self._idle: typing.List[aiosqlite.Connection] = []
+        self._opened: typing.Set[aiosqlite.Connection] = set()
+
+    async def acquire(self) -> aiosqlite.Connection:
+        if self._idle:
+            return self._idle.pop()
+
+        connection = aiosqlite.connect(
+            database=self._database, isolation_level=None, **self._options
+        )
+        # Conexões esquecidas abertas não devem impedir o processo de encerrar
+        connection.daemon = True
+        await connection.__aenter__()
+        self._opened.add(connection)
+        for name, value in self.pragmas.items():
+            async with connection.execute(f"PRAGMA {name}={value}") as cursor:
+                await cursor.fetchall()
+        return connection
+
+    async def release(self, connection: aiosqlite.Connection) -> None:
+        if len(self._idle) < self.pool_size and not connection.in_transaction:
+            self._idle.append(connection)
+            return
+        self._opened.discard(connection)
+        await super().release(connection)
+
+    async def close(self) -> None:
+        self._idle.clear()
+        while self._opened:
+            await super().release(self._opened.pop())
+
+
+class QueryEvent(typing.NamedTuple):
+    database: str
+    statement: str
+    parameters: int
+    duration: float
+    rows: typing.Optional[int]
+
+
+QueryListener = typing.Callable[[QueryEvent], None]
+
+
+class InstrumentedSQLiteConnection(SQLiteConnection):
+    """
+    Mede cada comando executado na conexão e repassa o SQL compilado, o
+    número de parâmetros, a duração e as linhas lidas aos listeners
+    """
+
+    def __init__(self, pool, dialect, name: str, listeners: typing.List):
+        super().__init__(pool, dialect)
+        self._name = name
+        self._listeners = listeners
+        self._statement = ""
+        self._parameters = 0
+
+    def _compile(self, query):
+        compiled = super()._compile(query)
+        self._statement, self._parameters = compiled[0], len(compiled[1])
+        return compiled
+
+    def _emit(self, started: float, rows: typing.Optional[int]) -> None:
+        event = QueryEvent(
+            self._name,
+            self._statement,
+            self._parameters,
+            time.perf_counter() - started,
+            rows,
+        )
+        for listener in self._listeners:
+            try:
+                listener(event)
+            except Exception:
+                logger.exception("Erro em listener de consultas")
+
+    async def fetch_all(self, query):
+        started, rows = time.perf_counter(), None
+        try:
+            result = await super().fetch_all(query)
+            rows = len(result)
+            return result
+        finally:
+            self._emit(started, rows)
+
+    async def fetch_one(self, query):
+        started, rows = time.perf_counter(), None
+        try:
+            result = await super().fetch_one(query)
+            rows = 0 if result is None else 1
+            return result
+        finally:
+            self._emit(started, rows)
+
+    async def execute(self, query):
+        started = time.perf_counter()
+        try:
+            return await super().execute(query)
+        finally:
+            self._emit(started, None)
+
+    async def iterate(self, query):
+        started, rows = time.perf_counter(), 0
+        try:
+            async for record in super().iterate(query):
+                rows += 1
+                yield record
+        finally:
+            self._emit(started, rows)
+
+
+class TunedSQLiteBackend(SQLiteBackend):
+    def __init__(
+        self,
+        database_url: typing.Union[DatabaseURL, str],
+        pool_size: int = 0,
+        pragmas: typing.Optional[typing.Dict[str, object]] = None,
+        name: str = "default",
+        **options: typing.Any,
+    ) -> None:
+        super().__init__(database_url, **options)
+        self._pool = PooledSQLitePool(
+            self._database_url, pool_size, pragmas or {}, **options
+        )
+        self.name = name
+        self.query_listeners: typing.List[QueryListener] = []
+
+    def connection(self) -> SQLiteConnection:
+        if not self.query_listeners:
+            return super().connection()
+        return InstrumentedSQLiteConnection(
+            self._pool, self._dialect, self.name, self.query_listeners
+        )
+
+    async def disconnect(self) -> None:
+        await self._pool.close()
+        await super().disconnect()
+
+
+class TunedDatabase(Database):
+    SUPPORTED_BACKENDS = {
+        **Database.SUPPORTED_BACKENDS,
+        "sqlite": "infrastructure.sqlite_backend:TunedSQLiteBackend",
+    }
+
+    def add_query_listener(self, listener: QueryListener) -> None:
+        """Registra uma função chamada com um QueryEvent após cada comando"""
+        self._backend.query_listeners.append(listener)
@@ -0,0 +1,69 @@
+import secrets
+import time
+import zlib
+from typing import Dict, Optional
+from fastapi import Request, Response, status
+
+
+class VersionTable:
+    """
+    Contadores de versão monotônicos: o do catálogo sobe a cada sala criada e
+    o de cada sala a cada reserva criada ou cancelada nela.
+
+    Os contadores são do processo: o ETag leva uma marca do processo, para que
+    dois workers nunca gerem a mesma tag, e uma janela de tempo de
+    max_age_seconds, que limita por quanto tempo uma escrita feita em outro
+    worker pode passar despercebida
+    """
+
+    def __init__(self, max_age_seconds: float):
+        self.max_age_seconds = max_age_seconds
+        self.catalog_version = 0
+        self._rooms: Dict[str, int] = {}
+        self._epoch = secrets.token_hex(4)
+
+    def bump_catalog(self) -> None:
+        self.catalog_version += 1
+
+    def bump(self, room_id) -> None:
+        key = str(room_id)
+        self._rooms[key] = self._rooms.get(key, 0) + 1
+
+    def room_version(self, room_id) -> int:
+        return self._rooms.get(str(room_id), 0)
+
+    def _etag(self, version: str, variant: str) -> str:
+        window = (
+            int(time.time() // self.max_age_seconds) if self.max_age_seconds > 0 else 0
+        )
+        digest = zlib.crc32(variant.encode())
+        return f'"{self._epoch}.{window}.{version}.{digest:08x}"'
+
+    def catalog_etag(self, variant: str = "") -> str:
+        return self._etag(str(self.catalog_version), variant)
+
+    def room_etag(self, room_id, variant: str = "") -> str:
+        return self._etag(f"{self.room_version(room_id)}", f"{room_id}?{variant}")
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip() for tag in if_none_match.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in candidates)
+
+
+def conditional_response(
+    request: Request, response: Response, etag: str
+) -> Optional[Response]:
+    """
+    Devolve um 304 pronto quando o If-None-Match da requisição confere com a
+    tag atual; caso contrário anota o ETag na resposta e devolve None
+    """
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    response.headers.update(headers)
+    return None
@@ -0,0 +1,61 @@
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict
+from jose import jwt
+from config import Settings
+from infrastructure.repositories import RoomRepository
+from infrastructure.sqlite_backend import TunedDatabase
+from infrastructure.security import PasswordHasher
+from infrastructure.security.auth import ALGORITHM, SECRET_KEY, create_access_token
+
+logger = logging.getLogger("Startup")
+
+
+async def _open_connections(database: TunedDatabase, count: int) -> None:
+    # Consultas concorrentes abrem conexões distintas do pool, cada uma já
+    # com os PRAGMAs aplicados, que voltam ociosas para o pool ao terminar
+    await asyncio.gather(
+        *(database.fetch_val("SELECT 1") for _ in range(max(count, 1)))
+    )
+
+
+async def _warm_up_tokens() -> None:
+    token = create_access_token({"sub": "warm-up", "user_id": "warm-up"})
+    jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+
+
+async def warm_up(
+    settings: Settings,
+    database: TunedDatabase,
+    read_database: TunedDatabase,
+    room_repository: RoomRepository,
+    password_hasher: PasswordHasher,
+) -> Dict[str, float]:
+    """
+    Adianta para a subida o custo que a primeira requisição pagaria: conexões
+    do pool, backend do bcrypt, JWT e salas mais usadas no cache.
+    Uma etapa que falha é registrada no log sem impedir a subida.
+    Retorna a duração de cada etapa em segundos
+    """
+    steps: Dict[str, Callable[[], Awaitable]] = {
+        "database": lambda: _open_connections(database, settings.database.pool_size),
+        "read_database": lambda: _open_connections(
+            read_database, settings.database.read_pool_size
+        ),
+        "password_hashing": lambda: password_hasher.run(password_hasher.load_backend),
+        "tokens": _warm_up_tokens,
+        "room_cache": lambda: room_repository.prime_cache(
+            settings.startup.warmup_rooms
+        ),
+    }
+
+    durations = {}
+    for name, step in steps.items():
+        started = time.perf_counter()
+        try:
+            await step()
+        except Exception as e:
+            logger.warning(f"Aquecimento de {name} falhou: {str(e)}")
+        durations[name] = time.perf_counter() - started
+    return durations
@@ -1,65 +1,171 @@
+import time
+
+IMPORT_STARTED = time.perf_counter()
+
+import logging
+from contextlib import asynccontextmanager
+from typing import Optional
 from fastapi import FastAPI
-from api.routes import main_router, auth_router
+from api.routes import main_router, auth_router, metrics_router
 from fastapi import HTTPException, status
 from fastapi.openapi.utils import get_openapi
+from config import Settings, get_settings, setup_logging
 from domain.exceptions import DomainException
 from fastapi.middleware.cors import CORSMiddleware
-from infrastructure.database import database
+from infrastructure.database import create_databases
+from infrastructure.repositories import RoomRepository, UserRepository
+from infrastructure.security import PasswordHasher, TokenCache
+from infrastructure.events import create_reservation_subject
+from infrastructure.metrics import ComponentStats, MetricsMiddleware
+from infrastructure.query_profiler import QueryProfileMiddleware
+from infrastructure.room_cache import RoomCache
+from infrastructure.response_cache import ResponseCache
+from infrastructure.locks import ShardedLockTable
+from infrastructure.versions import VersionTable
+from infrastructure.warmup import warm_up
 
-app = FastAPI()
+IMPORT_SECONDS = time.perf_counter() - IMPORT_STARTED
 
+logger = logging.getLogger("Startup")
 
-def custom_openapi():
-    if app.openapi_schema:
-        return app.openapi_schema
 
-    openapi_schema = get_openapi(
-        title="Sistema de Gerenciamento de Salas de Reunião",
-        description="API para gerenciamento de salas de reunião e suas reservas",
-        version="1.0.0",
-        routes=app.routes,
+async def domain_exception_handler(request, exc: DomainException):
+    return HTTPException(
+        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+        detail=f"Erro interno: {str(exc)}",
     )
 
-    openapi_schema["components"]["securitySchemes"] = {
-        "BearerAuth": {
-            "type": "http",
-            "scheme": "bearer",
-            "bearerFormat": "JWT",
-            "description": "Insira seu token JWT aqui",
-        }
-    }
-
-    app.openapi_schema = openapi_schema
-    return app.openapi_schema
 
+def create_app(settings: Optional[Settings] = None) -> FastAPI:
+    """
+    Monta a aplicação sem abrir conexões nem arquivos: bancos, log, workers e
+    aquecimento ficam para o lifespan. Os repositórios, caches e tabelas de
+    versão, o pool de hash de senhas e as estatísticas de /metrics são criados
+    uma única vez aqui a partir de settings, pertencem só a esta aplicação e
+    chegam às rotas por injeção de dependência
+    """
+    settings = settings or get_settings()
+    database, read_database = create_databases(settings.database)
+    room_cache = RoomCache(
+        max_size=settings.cache.room_cache_size,
+        ttl_seconds=settings.cache.room_cache_ttl,
+    )
+    response_cache = ResponseCache(max_size=settings.cache.response_cache_size)
+    token_cache = TokenCache(max_size=settings.cache.token_cache_size)
+    room_locks = ShardedLockTable(shards=settings.database.room_lock_shards)
+    versions = VersionTable(max_age_seconds=settings.cache.etag_max_age_seconds)
+    reservation_subject = create_reservation_subject(room_cache, settings.observers)
+    password_hasher = PasswordHasher(
+        max_workers=settings.security.password_hash_workers,
+        max_pending=settings.security.password_hash_max_pending,
+        rounds=settings.security.bcrypt_rounds,
+    )
+    room_repository = RoomRepository(
+        database=database,
+        reservation_subject=reservation_subject,
+        room_cache=room_cache,
+        room_locks=room_locks,
+        read_database=read_database,
+        versions=versions,
+    )
+    user_repository = UserRepository(
+        database=database,
+        password_hasher=password_hasher,
+        read_database=read_database,
+    )
+    timings = {"import_seconds": IMPORT_SECONDS}
+    component_stats = ComponentStats()
+    component_stats.register("room_cache", room_cache.stats)
+    component_stats.register("response_cache", response_cache.stats)
+    component_stats.register("token_cache", token_cache.stats)
+    component_stats.register("password_hasher", password_hasher.stats.snapshot)
+    component_stats.register("startup", lambda: timings)
+
+    @asynccontextmanager
+    async def lifespan(app: FastAPI):
+        started = time.perf_counter()
+        if settings.startup.configure_logging:
+            setup_logging()
+        await database.connect()
+        await read_database.connect()
+        if settings.observers.dispatch_mode == "async":
+            await reservation_subject.start()
+        if settings.startup.warmup:
+            durations = await warm_up(
+                settings, database, read_database, room_repository, password_hasher
+            )
+            for step, duration in durations.items():
+                timings[f"warmup_{step}_seconds"] = duration
+        timings["startup_seconds"] = time.perf_counter() - started
+        logger.info(
+            f"Aplicação iniciada | Import: {timings['import_seconds'] * 1000:.0f}ms"
+            f" | Startup: {timings['startup_seconds'] * 1000:.0f}ms"
+        )
+
+        yield
+
+        await reservation_subject.stop()
+        await read_database.disconnect()
+        await database.disconnect()
+        password_hasher.shutdown()
+
+    app = FastAPI(lifespan=lifespan)
+    app.state.settings = settings
+    app.state.database = database
+    app.state.read_database = read_database
+    app.state.room_repository = room_repository
+    app.state.user_repository = user_repository
+    app.state.room_cache = room_cache
+    app.state.response_cache = response_cache
+    app.state.versions = versions
+    app.state.reservation_subject = reservation_subject
+    app.state.token_cache = token_cache
+    app.state.password_hasher = password_hasher
+    app.state.component_stats = component_stats
+    app.state.timings = timings
+
+    def custom_openapi():
+        if app.openapi_schema:
+            return app.openapi_schema
+
+        openapi_schema = get_openapi(
+            title="Sistema de Gerenciamento de Salas de Reunião",
+            description="API para gerenciamento de salas de reunião e suas reservas",
+            version="1.0.0",
+            routes=app.routes,
+        )
+
+        openapi_schema["components"]["securitySchemes"] = {
+            "BearerAuth": {
+                "type": "http",
+                "scheme": "bearer",
+                "bearerFormat": "JWT",
+                "description": "Insira seu token JWT aqui",
+            }
+        }
 
-app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],
-    allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
-)
-
-app.openapi = custom_openapi
+        app.openapi_schema = openapi_schema
+        return app.openapi_schema
 
-app.include_router(auth_router, prefix="/auth", tags=["auth"])
-app.include_router(main_router)
+    app.add_middleware(
+        CORSMiddleware,
+        allow_origins=["*"],
+        allow_credentials=True,
+        allow_methods=["*"],
+        allow_headers=["*"],
+    )
 
+    app.add_middleware(MetricsMiddleware)
+    app.add_middleware(QueryProfileMiddleware)
 
-@app.on_event("startup")
-async def startup():
-    await database.connect()
+    app.openapi = custom_openapi
 
+    app.include_router(auth_router, prefix="/auth", tags=["auth"])
+    app.include_router(main_router)
+    app.include_router(metrics_router)
+    app.add_exception_handler(DomainException, domain_exception_handler)
 
-@app.on_event("shutdown")
-async def shutdown():
-    await database.disconnect()
+    return app
 
 
-@app.exception_handler(DomainException)
-async def domain_exception_handler(request, exc: DomainException):
-    return HTTPException(
-        status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-        detail=f"Erro interno: {str(exc)}",
-    )
+app = create_app()
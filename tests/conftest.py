@@ -1,4 +1,5 @@
 import pytest
+import pytest_asyncio
 import asyncio
 import sys
 from pathlib import Path
@@ -35,6 +36,21 @@ async def database():
     await db.disconnect()
 
 
+@pytest_asyncio.fixture(scope="function")
+async def schema_database(tmp_path):
+    database_url = f"sqlite:///{tmp_path / 'test.db'}"
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+
+    db = Database(database_url)
+    await db.connect()
+
+    yield db
+
+    await db.disconnect()
+
+
 @pytest.fixture
 async def room_repository(database):
     from infrastructure.repositories import RoomRepository
@@ -0,0 +1,117 @@
+from dataclasses import replace
+from sqlalchemy import create_engine
+from fastapi.testclient import TestClient
+from config import Settings, CacheSettings, DatabaseSettings, StartupSettings
+from infrastructure.models import Base
+from main import create_app
+
+
+def _settings(tmp_path) -> Settings:
+    database_url = f"sqlite:///{tmp_path / 'app.db'}"
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    engine.dispose()
+
+    return Settings(
+        database=DatabaseSettings(url=database_url, pool_size=2, read_pool_size=2),
+        startup=StartupSettings(configure_logging=False, warmup_rooms=4),
+    )
+
+
+def test_create_app_wires_repositories_and_warms_up(tmp_path):
+    app = create_app(_settings(tmp_path))
+    assert "startup_seconds" not in app.state.timings
+
+    with TestClient(app) as client:
+        response = client.post(
+            "/rooms/", json={"name": "Sala 1", "capacity": 4, "location": "Andar 1"}
+        )
+        assert response.status_code == 201
+        assert client.get("/rooms/").json()["total"] == 1
+
+        timings = app.state.timings
+        assert timings["startup_seconds"] > 0
+        assert "warmup_password_hashing_seconds" in timings
+        assert app.state.room_repository.db is app.state.database
+        assert app.state.room_repository.room_cache is app.state.room_cache
+
+    other = create_app(_settings(tmp_path))
+    assert other.state.room_cache is not app.state.room_cache
+    assert other.state.versions is not app.state.versions
+    assert other.state.response_cache is not app.state.response_cache
+    assert other.state.token_cache is not app.state.token_cache
+    assert other.state.password_hasher is not app.state.password_hasher
+
+
+def test_each_app_reports_its_own_component_stats(tmp_path):
+    settings = _settings(tmp_path)
+    settings = replace(settings, cache=CacheSettings(room_cache_size=7))
+    app = create_app(settings)
+    other = create_app(_settings(tmp_path))
+    assert app.state.room_cache.max_size == 7
+
+    with TestClient(app) as client:
+        client.get("/rooms/")
+        client.get("/rooms/")
+        text = client.get("/metrics").text
+
+    assert 'component_stats{component="response_cache",stat="hits"} 1' in text
+    with TestClient(other) as client:
+        text = client.get("/metrics").text
+    assert 'component_stats{component="response_cache",stat="hits"} 0' in text
+
+
+def test_conditional_gets_answer_304_without_queries(tmp_path):
+    with TestClient(create_app(_settings(tmp_path))) as client:
+        room_id = client.post(
+            "/rooms/", json={"name": "Sala 1", "capacity": 4, "location": "Andar 1"}
+        ).json()["id"]
+
+        etags = {}
+        for path in ("/rooms/?per_page=5", f"/rooms/{room_id}/reservations"):
+            etag = etags[path] = client.get(path).headers["ETag"]
+
+            response = client.get(
+                path, headers={"If-None-Match": etag, "X-DB-Profile": "1"}
+            )
+            assert response.status_code == 304
+            assert response.headers["ETag"] == etag
+            assert response.headers["X-DB-Summary"].startswith("queries=0;")
+
+        client.post(
+            "/rooms/", json={"name": "Sala 2", "capacity": 4, "location": "Andar 1"}
+        )
+        response = client.get(
+            "/rooms/?per_page=5",
+            headers={"If-None-Match": etags["/rooms/?per_page=5"], "X-DB-Profile": "1"},
+        )
+        assert response.status_code == 200
+        assert response.json()["total"] == 2
+
+
+def test_available_rooms_are_paged_by_cursor(tmp_path):
+    with TestClient(create_app(_settings(tmp_path))) as client:
+        for number in range(3):
+            client.post(
+                "/rooms/",
+                json={"name": f"Sala {number}", "capacity": 4, "location": "Andar 1"},
+            )
+        params = {
+            "start_time": "2100-01-01T09:00:00",
+            "end_time": "2100-01-01T10:00:00",
+            "per_page": 2,
+        }
+
+        first = client.get("/rooms/available", params=params).json()
+        assert len(first["items"]) == 2
+        second = client.get(
+            "/rooms/available", params={**params, "cursor": first["next_cursor"]}
+        ).json()
+        assert len(second["items"]) == 1
+        assert second["next_cursor"] is None
+        names = {room["name"] for room in first["items"] + second["items"]}
+        assert names == {"Sala 0", "Sala 1", "Sala 2"}
+
+        for path in ("/rooms/", "/rooms/available"):
+            response = client.get(path, params={**params, "cursor": "!!!"})
+            assert response.status_code == 400
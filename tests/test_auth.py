@@ -2,10 +2,12 @@ import pytest
 from datetime import timedelta
 from fastapi import HTTPException
 from infrastructure.security import (
+    authenticate_token,
     create_access_token,
     verify_password,
     hash_password,
-    get_current_user,
+    PasswordHasher,
+    TokenCache,
 )
 
 
@@ -31,7 +33,48 @@ async def test_token_expiration():
     expired_token = create_access_token(data, expires)
 
     with pytest.raises(HTTPException) as exc_info:
-        await get_current_user(expired_token)
+        authenticate_token(expired_token, TokenCache(max_size=8))
 
     assert exc_info.value.status_code == 401
     assert "Credenciais inválidas" in str(exc_info.value.detail)
+
+
+@pytest.mark.asyncio
+async def test_password_hashing_runs_off_event_loop():
+    password_hasher = PasswordHasher(max_workers=1, max_pending=4, rounds=4)
+    password = "test_password123"
+    try:
+        hashed = await password_hasher.hash(password)
+        assert hashed.startswith("$2b$04$")
+        assert await password_hasher.verify(password, hashed) is True
+        assert await password_hasher.verify("wrong_password", hashed) is False
+    finally:
+        password_hasher.shutdown()
+
+    assert password_hasher.stats.completed == 3
+    assert password_hasher.stats.max_queue_delay >= 0
+
+
+@pytest.mark.asyncio
+async def test_verified_token_is_served_from_cache():
+    token = create_access_token({"sub": "cached_user", "user_id": "456"})
+    token_cache = TokenCache(max_size=8)
+
+    first = authenticate_token(token, token_cache)
+    second = authenticate_token(token, token_cache)
+
+    assert first == second == {"username": "cached_user", "user_id": "456"}
+    assert token_cache.hits == 1
+
+
+@pytest.mark.asyncio
+async def test_invalid_token_is_not_cached():
+    token = create_access_token({"sub": "test_user", "user_id": "123"}) + "x"
+    token_cache = TokenCache(max_size=8)
+
+    for _ in range(2):
+        with pytest.raises(HTTPException) as exc_info:
+            authenticate_token(token, token_cache)
+        assert exc_info.value.status_code == 401
+
+    assert len(token_cache) == 0
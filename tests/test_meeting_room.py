@@ -1,5 +1,5 @@
 import pytest
-from datetime import datetime, timedelta
+from datetime import datetime, time, timedelta
 from uuid import uuid4
 from src.domain.entities import MeetingRoom
 from src.domain.exceptions import ReservationNotFoundException
@@ -77,3 +77,41 @@ def test_cancel_nonexistent_reservation():
 
     with pytest.raises(ReservationNotFoundException):
         room.cancel_reservation(non_existent_id)
+
+
+def test_free_slots_between_reservations():
+    room = MeetingRoom(name="Free Slots Room", capacity=5, location="Building G")
+    day = datetime(2030, 3, 4)
+    room.add_reservation(uuid4(), "User 1", day.replace(hour=9), day.replace(hour=10))
+    room.add_reservation(uuid4(), "User 2", day.replace(hour=11), day.replace(hour=13))
+
+    slots = room.get_free_slots(day.replace(hour=8), day.replace(hour=14))
+
+    assert slots == [
+        {"start_time": day.replace(hour=8), "end_time": day.replace(hour=9)},
+        {"start_time": day.replace(hour=10), "end_time": day.replace(hour=11)},
+        {"start_time": day.replace(hour=13), "end_time": day.replace(hour=14)},
+    ]
+
+
+def test_free_slots_with_business_hours_and_min_duration():
+    room = MeetingRoom(name="Business Room", capacity=5, location="Building H")
+    day = datetime(2030, 3, 4)
+    room.add_reservation(
+        uuid4(), "User 1", day.replace(hour=9, minute=30), day.replace(hour=17)
+    )
+
+    slots = room.get_free_slots(
+        day,
+        day + timedelta(days=2),
+        min_duration=timedelta(hours=1),
+        business_hours=(time(9), time(18)),
+    )
+
+    assert slots == [
+        {"start_time": day.replace(hour=17), "end_time": day.replace(hour=18)},
+        {
+            "start_time": day.replace(day=5, hour=9),
+            "end_time": day.replace(day=5, hour=18),
+        },
+    ]
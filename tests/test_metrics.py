@@ -0,0 +1,78 @@
+import pytest
+from domain.observers import ReservationSubject
+from infrastructure.metrics import (
+    MetricsObserver,
+    MetricsRegistry,
+    RESERVATION_EVENTS,
+)
+from infrastructure.query_profiler import QueryProfile, QueryProfiler, _current_profile
+from infrastructure.sqlite_backend import QueryEvent, TunedDatabase
+
+
+def test_registry_renders_prometheus_text():
+    registry = MetricsRegistry()
+    requests = registry.counter("requests_total", "Requisições", ("route",))
+    latency = registry.histogram("latency_seconds", "Latência", buckets=(0.1, 1.0))
+
+    requests.inc(route="/rooms/")
+    requests.inc(route="/rooms/")
+    latency.observe(0.05)
+    latency.observe(0.5)
+
+    text = registry.render()
+    assert "# TYPE requests_total counter" in text
+    assert 'requests_total{route="/rooms/"} 2' in text
+    assert 'latency_seconds_bucket{le="0.1"} 1' in text
+    assert 'latency_seconds_bucket{le="1.0"} 2' in text
+    assert 'latency_seconds_bucket{le="+Inf"} 2' in text
+    assert "latency_seconds_count 2" in text
+
+
+@pytest.mark.asyncio
+async def test_metrics_observer_counts_reservation_events():
+    subject = ReservationSubject()
+    subject.attach(MetricsObserver())
+    before = RESERVATION_EVENTS.value(event="conflict")
+
+    await subject.publish_conflict({"room_id": "sala"})
+
+    assert RESERVATION_EVENTS.value(event="conflict") == before + 1
+
+
+@pytest.mark.asyncio
+async def test_query_listener_receives_each_statement(tmp_path):
+    db = TunedDatabase(f"sqlite:///{tmp_path / 'metrics.db'}", name="teste")
+    events = []
+    db.add_query_listener(events.append)
+    await db.connect()
+    try:
+        await db.execute("CREATE TABLE t (id INTEGER)")
+        await db.execute("INSERT INTO t VALUES (:id)", {"id": 1})
+        assert len(await db.fetch_all("SELECT * FROM t")) == 1
+    finally:
+        await db.disconnect()
+
+    assert [event.statement.split()[0] for event in events] == [
+        "CREATE",
+        "INSERT",
+        "SELECT",
+    ]
+    assert events[1].parameters == 1
+    assert events[2].rows == 1
+    assert all(event.database == "teste" for event in events)
+
+
+def test_query_profiler_logs_slow_queries_and_fills_request_profile(caplog):
+    profiler = QueryProfiler(slow_threshold=0.05)
+    profile = QueryProfile()
+    token = _current_profile.set(profile)
+    try:
+        profiler(QueryEvent("read", "SELECT 1", 0, 0.001, 1))
+        with caplog.at_level("WARNING", logger="SlowQueryLog"):
+            profiler(QueryEvent("read", "SELECT *\n FROM reservations", 1, 0.2, 10))
+    finally:
+        _current_profile.reset(token)
+
+    assert profile.summary() == "queries=2; db_ms=201.00"
+    assert len(caplog.records) == 1
+    assert "SELECT * FROM reservations" in caplog.records[0].getMessage()
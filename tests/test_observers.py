@@ -0,0 +1,114 @@
+import asyncio
+import threading
+import pytest
+from domain.observers import (
+    ReservationObserver,
+    AsyncReservationObserver,
+    ReservationSubject,
+    RESERVATION_CREATED,
+    RESERVATION_CANCELLED,
+)
+
+
+class RecordingObserver(ReservationObserver):
+    def __init__(self):
+        super().__init__()
+        self.batches = []
+
+    def notify_reservation_created(self, reservation: dict) -> None:
+        pass
+
+    def notify_reservation_cancelled(self, reservation: dict) -> None:
+        pass
+
+    def notify_batch(self, events) -> None:
+        self.batches.append(list(events))
+
+
+class FailingObserver(ReservationObserver):
+    def notify_reservation_created(self, reservation: dict) -> None:
+        raise RuntimeError("falha")
+
+    def notify_reservation_cancelled(self, reservation: dict) -> None:
+        raise RuntimeError("falha")
+
+
+class SlowAsyncObserver(AsyncReservationObserver):
+    def __init__(self):
+        super().__init__()
+        self.cancelled = []
+
+    async def notify_reservation_created(self, reservation: dict) -> None:
+        pass
+
+    async def notify_reservation_cancelled(self, reservation: dict) -> None:
+        await asyncio.sleep(0.01)
+        self.cancelled.append(reservation["id"])
+
+
+@pytest.mark.asyncio
+async def test_publish_without_worker_delivers_immediately():
+    subject = ReservationSubject()
+    observer = RecordingObserver()
+    subject.attach(observer)
+
+    await subject.publish_cancellation({"id": "abc", "room_id": "sala"})
+
+    assert observer.batches == [
+        [(RESERVATION_CANCELLED, {"id": "abc", "room_id": "sala"})]
+    ]
+
+
+@pytest.mark.asyncio
+async def test_worker_delivers_in_batches_and_isolates_failures():
+    subject = ReservationSubject(max_queue_size=10, batch_size=3)
+    subject.attach(FailingObserver())
+    observer = RecordingObserver()
+    subject.attach(observer)
+
+    await subject.start()
+    for index in range(5):
+        await subject.publish_creation({"id": index})
+    await subject.stop()
+
+    delivered = [payload for batch in observer.batches for _, payload in batch]
+    assert delivered == [{"id": index} for index in range(5)]
+    assert all(len(batch) <= 3 for batch in observer.batches)
+    assert observer.batches[0][0][0] == RESERVATION_CREATED
+
+
+@pytest.mark.asyncio
+async def test_stop_drains_async_observers():
+    subject = ReservationSubject(max_queue_size=2)
+    observer = SlowAsyncObserver()
+    subject.attach(observer)
+
+    await subject.start()
+    for index in range(4):
+        await subject.publish_cancellation({"id": str(index), "room_id": "sala"})
+    await subject.stop()
+
+    assert observer.cancelled == ["0", "1", "2", "3"]
+    assert not subject.is_running
+
+
+class ThreadRecordingObserver(RecordingObserver):
+    def notify_batch(self, events) -> None:
+        self.batches.append(threading.get_ident())
+
+
+class InMemoryObserver(ThreadRecordingObserver):
+    blocking = False
+
+
+@pytest.mark.asyncio
+async def test_blocking_observers_run_off_the_event_loop():
+    subject = ReservationSubject()
+    blocking, in_memory = ThreadRecordingObserver(), InMemoryObserver()
+    subject.attach(blocking)
+    subject.attach(in_memory)
+
+    await subject.publish_creation({"id": 1})
+
+    assert blocking.batches != [threading.get_ident()]
+    assert in_memory.batches == [threading.get_ident()]
@@ -0,0 +1,62 @@
+import random
+import pytest
+from datetime import date, datetime, timedelta
+from uuid import uuid4
+from domain.entities import ReservationRecord, iter_occurrences, sweep_conflicts
+from domain.models import RecurrenceRule
+
+
+def _occurrences(rule: RecurrenceRule, start_time: datetime, hours: int = 1):
+    return list(iter_occurrences(rule, start_time, start_time + timedelta(hours=hours)))
+
+
+def test_monthly_skips_missing_days_and_counts_exceptions():
+    rule = RecurrenceRule(frequency="monthly", count=5, exceptions=[date(2100, 5, 31)])
+
+    starts = [start for start, _ in _occurrences(rule, datetime(2100, 1, 31, 10))]
+
+    assert starts == [
+        datetime(2100, 1, 31, 10),
+        datetime(2100, 3, 31, 10),
+        datetime(2100, 7, 31, 10),
+        datetime(2100, 8, 31, 10),
+    ]
+
+
+def test_series_stops_at_until_and_rejects_rules_past_horizon():
+    weekly = RecurrenceRule(frequency="weekly", interval=2, until=date(2100, 2, 12))
+    daily = RecurrenceRule(frequency="daily", until=date(2101, 1, 2))
+
+    assert len(_occurrences(weekly, datetime(2100, 1, 1, 9))) == 4
+    assert len(_occurrences(daily, datetime(2100, 1, 1, 9))) == 367
+
+    for rule in (
+        RecurrenceRule(frequency="daily"),
+        RecurrenceRule(frequency="daily", until=date(2101, 1, 3)),
+        RecurrenceRule(frequency="weekly", count=60),
+        RecurrenceRule(frequency="monthly", count=14),
+    ):
+        with pytest.raises(ValueError):
+            _occurrences(rule, datetime(2100, 1, 1, 9))
+
+
+def test_sweep_matches_pairwise_overlap():
+    rng = random.Random(7)
+    base = datetime(2100, 1, 1)
+    reservations = sorted(
+        (
+            ReservationRecord(uuid4(), uuid4(), start, start + timedelta(minutes=45))
+            for start in (
+                base + timedelta(minutes=15 * rng.randrange(4000)) for _ in range(300)
+            )
+        ),
+        key=lambda reservation: reservation.start_time,
+    )
+    periods = _occurrences(RecurrenceRule(frequency="daily", count=40), base, 2)
+
+    expected = [
+        index
+        for index, (start, end) in enumerate(periods)
+        if any(r.start_time < end and r.end_time > start for r in reservations)
+    ]
+    assert list(sweep_conflicts(periods, reservations)) == expected
@@ -0,0 +1,114 @@
+from datetime import datetime, timedelta
+from uuid import uuid4
+from src.domain.entities import MeetingRoom, ReservationIndex, ReservationRecord
+
+
+def _reservation(start: datetime, end: datetime) -> ReservationRecord:
+    return ReservationRecord(uuid4(), uuid4(), start, end)
+
+
+def test_index_orders_reservations_by_start():
+    base = datetime(2030, 1, 1, 8)
+    late = _reservation(base + timedelta(hours=5), base + timedelta(hours=6))
+    early = _reservation(base, base + timedelta(hours=1))
+    index = ReservationIndex([late, early])
+
+    assert list(index) == [early, late]
+    assert len(index) == 2
+    assert early.id in index
+    assert index.get(early.key) is early
+
+
+def test_index_overlap_queries():
+    base = datetime(2030, 1, 1, 8)
+    first = _reservation(base, base + timedelta(hours=1))
+    second = _reservation(base + timedelta(hours=2), base + timedelta(hours=3))
+    index = ReservationIndex([first, second])
+
+    assert (
+        index.count_overlapping(
+            base + timedelta(minutes=30), base + timedelta(hours=2, minutes=30)
+        )
+        == 2
+    )
+    assert list(
+        index.overlapping(
+            base + timedelta(minutes=30), base + timedelta(hours=2, minutes=30)
+        )
+    ) == [first, second]
+    assert (
+        index.count_overlapping(base + timedelta(hours=1), base + timedelta(hours=2))
+        == 0
+    )
+    assert (
+        list(index.overlapping(base + timedelta(hours=1), base + timedelta(hours=2)))
+        == []
+    )
+
+
+def test_index_handles_nested_intervals():
+    base = datetime(2030, 1, 1, 8)
+    long = _reservation(base, base + timedelta(hours=10))
+    short = _reservation(base + timedelta(hours=1), base + timedelta(hours=2))
+    index = ReservationIndex([long, short])
+
+    assert (
+        index.count_overlapping(base + timedelta(hours=5), base + timedelta(hours=6))
+        == 1
+    )
+    assert list(
+        index.overlapping(base + timedelta(hours=5), base + timedelta(hours=6))
+    ) == [long]
+
+
+def test_index_remove():
+    base = datetime(2030, 1, 1, 8)
+    reservation = _reservation(base, base + timedelta(hours=1))
+    index = ReservationIndex([reservation])
+
+    assert index.remove(reservation.id) is reservation
+    assert len(index) == 0
+    assert index.count_overlapping(base, base + timedelta(hours=1)) == 0
+
+
+def test_room_rejects_reservation_overlapping_any_existing():
+    room = MeetingRoom(name="Index Room", capacity=5, location="Building G")
+    base = datetime.now() + timedelta(days=1)
+
+    assert room.add_reservation(uuid4(), "user1", base, base + timedelta(hours=1))
+    assert room.add_reservation(
+        uuid4(), "user2", base + timedelta(hours=3), base + timedelta(hours=4)
+    )
+    assert not room.add_reservation(
+        uuid4(), "user3", base + timedelta(minutes=30), base + timedelta(minutes=45)
+    )
+
+
+def test_index_bulk_load_keeps_last_duplicate():
+    base = datetime(2030, 1, 1, 8)
+    original = _reservation(base, base + timedelta(hours=1))
+    moved = ReservationRecord(
+        original.id,
+        original.user_id,
+        base + timedelta(hours=2),
+        base + timedelta(hours=3),
+    )
+    index = ReservationIndex([original, moved])
+
+    assert list(index) == [moved]
+    assert index.count_overlapping(base, base + timedelta(hours=1)) == 0
+
+
+def test_record_materializes_dict():
+    base = datetime(2030, 1, 1, 8)
+    reservation_id = uuid4()
+    record = ReservationRecord(
+        str(reservation_id), "user", base, base + timedelta(hours=1)
+    )
+
+    assert record.to_dict() == {
+        "id": reservation_id,
+        "user_id": "user",
+        "start_time": base,
+        "end_time": base + timedelta(hours=1),
+    }
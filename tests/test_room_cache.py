@@ -0,0 +1,189 @@
+import json
+import pytest
+from datetime import datetime, timedelta
+from uuid import uuid4
+from domain.entities import MeetingRoom
+from domain.models import ReservationCreate
+from domain.exceptions import ReservationConflictException
+from domain.observers import ReservationSubject
+from infrastructure.repositories import RoomRepository
+from infrastructure.room_cache import RoomCache, RoomCacheObserver
+from infrastructure.response_cache import ResponseCache, dumps
+
+BASE_TIME = datetime.now().replace(minute=0, second=0, microsecond=0) + timedelta(
+    days=1
+)
+
+
+@pytest.fixture
+def room_cache():
+    return RoomCache(max_size=2, ttl_seconds=60)
+
+
+@pytest.fixture
+def cached_repository(schema_database, room_cache):
+    subject = ReservationSubject()
+    subject.attach(RoomCacheObserver(room_cache))
+    return RoomRepository(
+        schema_database, reservation_subject=subject, room_cache=room_cache
+    )
+
+
+def _reservation(room: MeetingRoom, hours: int) -> ReservationCreate:
+    start_time = BASE_TIME + timedelta(hours=hours)
+    return ReservationCreate(
+        room_id=room.id, start_time=start_time, end_time=start_time + timedelta(hours=1)
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_is_served_from_cache(cached_repository, room_cache):
+    room = MeetingRoom(name="Sala 1", capacity=4, location="Andar 1")
+    await cached_repository.add(room)
+    room_cache.clear()
+
+    first = await cached_repository.get(room.id)
+    second = await cached_repository.get(room.id)
+
+    assert first is second
+    assert room_cache.stats()["misses"] == 1
+    assert room_cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_cache_follows_reservation_events(cached_repository):
+    room = MeetingRoom(name="Sala 1", capacity=4, location="Andar 1")
+    await cached_repository.add(room)
+
+    reservation_id = await cached_repository.create_reservation(
+        _reservation(room, 1), uuid4()
+    )
+    cached = await cached_repository.get(room.id)
+    assert len(cached.reservations) == 1
+
+    with pytest.raises(ReservationConflictException):
+        await cached_repository.create_reservation(_reservation(room, 1), uuid4())
+
+    await cached_repository.delete_reservation(reservation_id)
+    assert len((await cached_repository.get(room.id)).reservations) == 0
+
+
+def test_cache_evicts_least_recently_used(room_cache):
+    rooms = [MeetingRoom(name=f"Sala {i}", capacity=4, location="-") for i in range(3)]
+    for room in rooms:
+        room_cache.put(room)
+
+    assert room_cache.get(rooms[0].id) is None
+    assert room_cache.get(rooms[2].id) is rooms[2]
+    assert room_cache.stats()["evictions"] == 1
+
+
+def test_cache_expires_entries():
+    cache = RoomCache(max_size=2, ttl_seconds=0)
+    room = MeetingRoom(name="Sala", capacity=4, location="-")
+    cache.put(room)
+
+    assert cache.get(room.id) is None
+    assert len(cache) == 0
+
+
+def test_response_cache_serves_bytes_until_etag_changes():
+    cache = ResponseCache(max_size=2)
+    reservation_id = uuid4()
+    body = dumps([{"id": reservation_id, "start_time": datetime(2100, 1, 1, 10)}])
+
+    assert json.loads(body) == [
+        {"id": str(reservation_id), "start_time": "2100-01-01T10:00:00"}
+    ]
+
+    cache.put("rooms?page=1", '"v1"', body)
+    assert cache.get("rooms?page=1", '"v1"') is body
+    assert cache.get("rooms?page=1", '"v2"') is None
+
+    cache.put("rooms?page=2", '"v1"', b"[]")
+    cache.put("rooms?page=3", '"v1"', b"[]")
+    assert len(cache) == 2
+    assert cache.stats()["hits"] == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_reservation_booked_by_another_worker(
+    schema_database, cached_repository, room_cache
+):
+    other_cache = RoomCache(max_size=2, ttl_seconds=60)
+    other_worker = RoomRepository(schema_database, room_cache=other_cache)
+    room = MeetingRoom(name="Sala 1", capacity=4, location="Andar 1")
+    await cached_repository.add(room)
+    await cached_repository.get(room.id)
+    await other_worker.get(room.id)
+
+    reservation = _reservation(room, 1)
+    reservation_id = await other_worker.create_reservation(reservation, uuid4())
+    assert reservation_id in other_cache.peek(room.id).reservations
+    assert reservation_id not in room_cache.peek(room.id).reservations
+
+    assert await cached_repository.delete_reservation(reservation_id)
+    assert room_cache.peek(room.id) is None
+    assert len((await cached_repository.get(room.id)).reservations) == 0
+
+    await other_worker.create_reservation(reservation, uuid4())
+    assert other_cache.peek(room.id) is None
+
+
+@pytest.mark.asyncio
+async def test_cancellation_by_another_worker_is_confirmed_in_the_database(
+    schema_database, cached_repository, room_cache
+):
+    other_cache = RoomCache(max_size=2, ttl_seconds=60)
+    other_subject = ReservationSubject()
+    other_subject.attach(RoomCacheObserver(other_cache))
+    other_worker = RoomRepository(
+        schema_database, reservation_subject=other_subject, room_cache=other_cache
+    )
+    room = MeetingRoom(name="Sala 1", capacity=4, location="Andar 1")
+    await cached_repository.add(room)
+    reservation = _reservation(room, 1)
+    reservation_id = await cached_repository.create_reservation(reservation, uuid4())
+    await cached_repository.get(room.id)
+
+    await other_worker.delete_reservation(reservation_id)
+
+    assert reservation_id in room_cache.peek(room.id).reservations
+    assert await cached_repository.is_period_available(
+        room.id, reservation.start_time, reservation.end_time
+    )
+    assert room_cache.peek(room.id) is None
+
+    await cached_repository.get(room.id)
+    reservation_id = await cached_repository.create_reservation(reservation, uuid4())
+    await other_worker.delete_reservation(reservation_id)
+
+    await cached_repository.create_reservation(reservation, uuid4())
+    with pytest.raises(ReservationConflictException):
+        await other_worker.create_reservation(reservation, uuid4())
+
+
+@pytest.mark.asyncio
+async def test_window_miss_reads_only_the_window_and_busy_rooms_stay_cached(
+    cached_repository, room_cache
+):
+    room = MeetingRoom(name="Sala 1", capacity=4, location="Andar 1")
+    await cached_repository.add(room)
+    for hours in range(4):
+        await cached_repository.create_reservation(_reservation(room, hours), uuid4())
+    room_cache.clear()
+
+    window = _reservation(room, 1)
+    windowed = await cached_repository.get_in_window(
+        room.id, window.start_time, window.end_time
+    )
+    assert len(windowed.reservations) == 1
+    assert room_cache.peek(room.id) is None
+
+    await cached_repository.get(room.id)
+    for hours in range(4, 24):
+        await cached_repository.create_reservation(_reservation(room, hours), uuid4())
+
+    cached = room_cache.peek(room.id)
+    assert cached is not None and len(cached.reservations) == 24
+    assert room_cache.stats()["invalidations"] == 0
@@ -0,0 +1,414 @@
+import asyncio
+import csv
+import json
+import pytest
+from datetime import datetime, timedelta
+from uuid import UUID, uuid4
+from domain.entities import MeetingRoom
+from domain.models import ReservationCreate, RecurrenceRule
+from domain.exceptions import ReservationConflictException
+from infrastructure.models import ReservationDB, RoomDB
+from infrastructure.repositories import RoomRepository
+from infrastructure.pagination import paginate_keyset, decode_cursor, encode_cursor
+from infrastructure.export import stream_csv, stream_ndjson
+from infrastructure.versions import VersionTable, etag_matches
+
+
+async def _create_room(repository: RoomRepository, name: str) -> MeetingRoom:
+    room = MeetingRoom(name=name, capacity=8, location="Andar 1")
+    await repository.add(room)
+    return room
+
+
+BASE_TIME = datetime.now().replace(minute=0, second=0, microsecond=0) + timedelta(
+    days=1
+)
+
+
+def _reservation(room: MeetingRoom, hours: int) -> ReservationCreate:
+    start_time = BASE_TIME + timedelta(hours=hours)
+    return ReservationCreate(
+        room_id=room.id, start_time=start_time, end_time=start_time + timedelta(hours=1)
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_all_groups_reservations_by_room(schema_database):
+    repository = RoomRepository(schema_database)
+    first = await _create_room(repository, "Sala 1")
+    second = await _create_room(repository, "Sala 2")
+    user_id = uuid4()
+
+    await repository.create_reservation(_reservation(first, 1), user_id)
+    await repository.create_reservation(_reservation(first, 3), user_id)
+    await repository.create_reservation(_reservation(second, 1), user_id)
+
+    rooms = {str(room.id): room for room in await repository.get_all()}
+
+    assert len(rooms[str(first.id)].reservations) == 2
+    assert len(rooms[str(second.id)].reservations) == 1
+
+
+@pytest.mark.asyncio
+async def test_get_all_without_reservations(schema_database):
+    repository = RoomRepository(schema_database)
+    room = await _create_room(repository, "Sala 1")
+    await repository.create_reservation(_reservation(room, 1), uuid4())
+
+    rooms = await repository.get_all(include_reservations=False)
+
+    assert [room.name for room in rooms] == ["Sala 1"]
+    assert len(rooms[0].reservations) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_page_walks_rooms_with_keyset_cursor(schema_database):
+    repository = RoomRepository(schema_database)
+    for index in range(5):
+        await _create_room(repository, f"Sala {index}")
+
+    first_page = paginate_keyset(
+        await repository.get_page(3), 2, key=lambda room: str(room.id)
+    )
+    after = decode_cursor(first_page.next_cursor)
+    second_page = paginate_keyset(
+        await repository.get_page(3, after=after), 2, key=lambda room: str(room.id)
+    )
+    last_page = paginate_keyset(
+        await repository.get_page(3, after=decode_cursor(second_page.next_cursor)),
+        2,
+        key=lambda room: str(room.id),
+    )
+
+    ids = [str(room.id) for room in first_page.items + second_page.items]
+    assert ids == sorted(ids)
+    assert len(last_page.items) == 1
+    assert last_page.next_cursor is None
+    assert await repository.count() == 5
+
+
+@pytest.mark.parametrize(
+    "cursor", ["", "!!!", "c2FsYQ", encode_cursor(""), encode_cursor("sala 1")]
+)
+def test_decode_cursor_rejects_garbage(cursor):
+    with pytest.raises(ValueError):
+        decode_cursor(cursor)
+
+
+@pytest.mark.asyncio
+async def test_get_in_window_loads_only_overlapping_reservations(schema_database):
+    repository = RoomRepository(schema_database)
+    room = await _create_room(repository, "Sala 1")
+    user_id = uuid4()
+    for hours in (1, 3, 5, 7):
+        await repository.create_reservation(_reservation(room, hours), user_id)
+
+    window = _reservation(room, 3)
+    windowed = await repository.get_in_window(
+        room.id, window.start_time - timedelta(minutes=30), window.end_time
+    )
+    starts = [res["start_time"] for res in windowed.get_reservations()]
+
+    assert starts == [window.start_time]
+    assert not windowed.check_availability(window.start_time, window.end_time)
+    assert windowed.check_availability(
+        window.end_time, window.end_time + timedelta(hours=1)
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_in_window_includes_reservation_started_before_window(
+    schema_database,
+):
+    repository = RoomRepository(schema_database)
+    room = await _create_room(repository, "Sala 1")
+    reservation = _reservation(room, 1)
+    await repository.create_reservation(reservation, uuid4())
+
+    windowed = await repository.get_in_window(
+        room.id,
+        reservation.start_time + timedelta(minutes=15),
+        reservation.start_time + timedelta(minutes=30),
+    )
+
+    assert len(windowed.reservations) == 1
+
+
+@pytest.mark.asyncio
+async def test_room_with_long_history_keeps_accepting_bookings(schema_database):
+    repository = RoomRepository(schema_database)
+    room = await _create_room(repository, "Sala 1")
+    user_id = uuid4()
+
+    for hours in range(0, 40, 2):
+        await repository.create_reservation(_reservation(room, hours), user_id)
+
+    assert len((await repository.get(room.id)).reservations) == 20
+    with pytest.raises(ReservationConflictException):
+        await repository.create_reservation(_reservation(room, 38), user_id)
+
+
+@pytest.mark.asyncio
+async def test_window_query_is_bounded_by_the_longest_reservation(schema_database):
+    repository = RoomRepository(schema_database)
+    room = await _create_room(repository, "Sala 1")
+    start_time = BASE_TIME + timedelta(hours=1)
+    await repository.create_reservation(
+        ReservationCreate(
+            room_id=room.id,
+            start_time=start_time,
+            end_time=start_time + timedelta(days=3),
+        ),
+        uuid4(),
+    )
+    window_start = start_time + timedelta(days=2)
+
+    windowed = await repository.get_in_window(
+        room.id, window_start, window_start + timedelta(hours=1)
+    )
+    query = repository._range_query(
+        room.id,
+        window_start,
+        window_start + timedelta(hours=1),
+        max_duration=timedelta(days=3),
+    ).compile(compile_kwargs={"literal_binds": True})
+    plan = await schema_database.fetch_all(f"EXPLAIN QUERY PLAN {query}")
+
+    assert len(windowed.reservations) == 1
+    assert "start_time>? AND start_time<?" in " ".join(row["detail"] for row in plan)
+
+
+@pytest.mark.asyncio
+async def test_get_in_window_with_legacy_overlapping_reservations(schema_database):
+    # O baseline aceitava reservas sobrepostas: o recorte não pode supor o contrário
+    repository = RoomRepository(schema_database)
+    room = await _create_room(repository, "Sala 1")
+    for start, end in ((8, 12), (9, 10)):
+        await schema_database.execute(
+            ReservationDB.__table__.insert().values(
+                id=str(uuid4()),
+                room_id=str(room.id),
+                user_id=str(uuid4()),
+                start_time=BASE_TIME + timedelta(hours=start),
+                end_time=BASE_TIME + timedelta(hours=end),
+            )
+        )
+    # Valor preenchido pela migração para salas com histórico
+    await schema_database.execute(
+        RoomDB.__table__.update()
+        .where(RoomDB.id == str(room.id))
+        .values(max_reservation_seconds=4 * 3600)
+    )
+    start_time = BASE_TIME + timedelta(hours=11)
+    end_time = start_time + timedelta(minutes=30)
+
+    windowed = await repository.get_in_window(room.id, start_time, end_time)
+
+    assert len(windowed.reservations) == 1
+    assert not windowed.check_availability(start_time, end_time)
+    assert len(await repository.list_room_reservations(room.id, start_time)) == 1
+
+
+@pytest.mark.asyncio
+async def test_create_reservations_bulk_reports_each_item(schema_database):
+    repository = RoomRepository(schema_database)
+    room = await _create_room(repository, "Sala 1")
+    user_id = uuid4()
+    await repository.create_reservation(_reservation(room, 1), user_id)
+    missing_room = MeetingRoom(name="Inexistente", capacity=1, location="-")
+
+    results = await repository.create_reservations_bulk(
+        [
+            _reservation(room, 1),
+            _reservation(room, 2),
+            _reservation(room, 2),
+            _reservation(missing_room, 1),
+            _reservation(room, 4),
+        ],
+        user_id,
+    )
+
+    assert [result["status"] for result in results] == [409, 201, 409, 404, 201]
+    stored = await repository.get(room.id)
+    assert len(stored.reservations) == 3
+
+
+@pytest.mark.asyncio
+async def test_find_available_excludes_booked_rooms(schema_database):
+    repository = RoomRepository(schema_database)
+    booked = await _create_room(repository, "Sala 1")
+    free = await _create_room(repository, "Sala 2")
+    small = MeetingRoom(name="Sala 3", capacity=2, location="Andar 1")
+    await repository.add(small)
+    reservation = _reservation(booked, 1)
+    await repository.create_reservation(reservation, uuid4())
+
+    rooms = await repository.find_available(
+        reservation.start_time, reservation.end_time, min_capacity=4
+    )
+    assert [str(room.id) for room in rooms] == [str(free.id)]
+
+    rooms = await repository.find_available(
+        reservation.end_time, reservation.end_time + timedelta(hours=1)
+    )
+    assert len(rooms) == 3
+    assert (
+        await repository.find_available(
+            reservation.start_time, reservation.end_time, location="Andar 2"
+        )
+        == []
+    )
+
+
+@pytest.mark.asyncio
+async def test_stream_room_reservations_exports_in_start_order(schema_database):
+    repository = RoomRepository(schema_database)
+    room = await _create_room(repository, "Sala Export")
+    user_id = uuid4()
+    for hours in (5, 1, 3):
+        await repository.create_reservation(_reservation(room, hours), user_id)
+
+    fields = ("id", "start_time")
+    rows = await repository.stream_room_reservations(room.id)
+    ndjson = "".join([chunk async for chunk in stream_ndjson(rows, fields)])
+    starts = [json.loads(line)["start_time"] for line in ndjson.splitlines()]
+    assert starts == [
+        (BASE_TIME + timedelta(hours=hours)).isoformat() for hours in (1, 3, 5)
+    ]
+
+    rows = await repository.stream_room_reservations(room.id)
+    exported = "".join([chunk async for chunk in stream_csv(rows, fields)])
+    lines = list(csv.reader(exported.splitlines()))
+    assert lines[0] == list(fields)
+    assert len(lines) == 4
+
+
+@pytest.mark.asyncio
+async def test_list_room_reservations_filters_range_in_sql(schema_database):
+    repository = RoomRepository(schema_database)
+    room = await _create_room(repository, "Sala Intervalo")
+    user_id = uuid4()
+    for hours in (1, 3, 5, 26):
+        await repository.create_reservation(_reservation(room, hours), user_id)
+
+    def starts(reservations):
+        return [
+            (res["start_time"] - BASE_TIME).total_seconds() / 3600
+            for res in reservations
+        ]
+
+    in_range = await repository.list_room_reservations(
+        room.id,
+        BASE_TIME + timedelta(hours=1, minutes=30),
+        BASE_TIME + timedelta(hours=5),
+    )
+    assert starts(in_range) == [1, 3]
+
+    latest = await repository.list_room_reservations(
+        room.id, start_time=BASE_TIME, descending=True, limit=2
+    )
+    assert starts(latest) == [26, 5]
+    assert isinstance(latest[0]["id"], UUID)
+
+
+@pytest.mark.asyncio
+async def test_concurrent_bookings_of_same_slot_across_workers(schema_database):
+    # Repositórios independentes simulam workers sem locks compartilhados
+    workers = [RoomRepository(schema_database) for _ in range(4)]
+    room = await _create_room(workers[0], "Sala 1")
+    reservation = _reservation(room, 1)
+
+    results = await asyncio.gather(
+        *(worker.create_reservation(reservation, uuid4()) for worker in workers),
+        return_exceptions=True,
+    )
+
+    created = [result for result in results if isinstance(result, UUID)]
+    conflicts = [
+        result for result in results if isinstance(result, ReservationConflictException)
+    ]
+    assert len(created) == 1
+    assert len(conflicts) == 3
+    assert len((await workers[0].get(room.id)).reservations) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_bookings_of_distinct_rooms_share_commits(schema_database):
+    repository = RoomRepository(schema_database)
+    rooms = [await _create_room(repository, f"Sala {index}") for index in range(8)]
+    batches = []
+    commit_inserts = repository._commit_inserts
+
+    async def record_batch(batch):
+        batches.append(len(batch))
+        await commit_inserts(batch)
+
+    repository._commit_inserts = record_batch
+    results = await asyncio.gather(
+        *(
+            repository.create_reservation(_reservation(room, 1), uuid4())
+            for room in rooms + rooms
+        ),
+        return_exceptions=True,
+    )
+
+    assert sum(isinstance(result, UUID) for result in results) == 8
+    assert sum(batches) == 8 and len(batches) < 8
+    for room in rooms:
+        assert len(await repository.list_room_reservations(room.id)) == 1
+
+
+@pytest.mark.asyncio
+async def test_writes_bump_room_and_catalog_versions(schema_database):
+    versions = VersionTable(max_age_seconds=0)
+    repository = RoomRepository(schema_database, versions=versions)
+    room = await _create_room(repository, "Sala 1")
+    catalog_etag = versions.catalog_etag()
+    other = await _create_room(repository, "Sala 2")
+    assert versions.catalog_etag() != catalog_etag
+    catalog_etag = versions.catalog_etag()
+    room_etag = versions.room_etag(room.id)
+
+    reservation_id = await repository.create_reservation(_reservation(room, 1), uuid4())
+    assert versions.room_etag(room.id) != room_etag
+    assert versions.catalog_etag() == catalog_etag
+    assert versions.room_version(other.id) == 1
+
+    room_etag = versions.room_etag(room.id)
+    await repository.delete_reservation(reservation_id)
+    assert versions.room_etag(room.id) != room_etag
+    assert versions.room_etag(room.id, "order=desc") != versions.room_etag(room.id)
+
+    assert not etag_matches(room_etag, versions.room_etag(room.id))
+    assert etag_matches(
+        f'"x", W/{versions.room_etag(room.id)}', versions.room_etag(room.id)
+    )
+    assert etag_matches("*", room_etag)
+
+
+@pytest.mark.asyncio
+async def test_reservation_series_is_stored_all_or_nothing(schema_database):
+    repository = RoomRepository(schema_database)
+    room = await _create_room(repository, "Sala 1")
+    user_id = uuid4()
+    await repository.create_reservation(_reservation(room, 24 * 14), user_id)
+
+    weekly = _reservation(room, 0).model_copy(
+        update={"recurrence": RecurrenceRule(frequency="weekly", count=10)}
+    )
+    with pytest.raises(ReservationConflictException):
+        await repository.create_reservation_series(weekly, user_id)
+    assert len(await repository.list_room_reservations(room.id)) == 1
+
+    weekly.recurrence.exceptions.append((BASE_TIME + timedelta(days=14)).date())
+    series = await repository.create_reservation_series(weekly, user_id)
+    assert series["occurrences"] == 9
+
+    page = await repository.get_series(series["series_id"], limit=4)
+    assert len(page["occurrences"]) == 4
+    assert page["recurrence"]["count"] == 10
+    rest = await repository.get_series(series["series_id"], after=page["next_after"])
+    assert len(rest["occurrences"]) == 5 and rest["next_after"] is None
+
+    assert await repository.delete_series(series["series_id"]) == 9
+    assert len(await repository.list_room_reservations(room.id)) == 1
@@ -0,0 +1,51 @@
+import pytest
+from config import DatabaseSettings
+from infrastructure.sqlite_backend import TunedDatabase
+
+
+def test_database_settings_from_env(monkeypatch):
+    monkeypatch.setenv("DATABASE_URL", "sqlite:///outro.db")
+    monkeypatch.setenv("DATABASE_POOL_SIZE", "2")
+    monkeypatch.setenv("SQLITE_SYNCHRONOUS", "FULL")
+
+    settings = DatabaseSettings.from_env()
+
+    assert settings.url == "sqlite:///outro.db"
+    assert settings.pool_size == 2
+    assert settings.pragmas()["synchronous"] == "FULL"
+    assert settings.pragmas()["journal_mode"] == "WAL"
+
+
+@pytest.mark.asyncio
+async def test_pooled_connection_applies_pragmas_and_is_reused(tmp_path):
+    db = TunedDatabase(
+        f"sqlite:///{tmp_path / 'pool.db'}",
+        pool_size=1,
+        pragmas=DatabaseSettings().pragmas(),
+    )
+    await db.connect()
+    try:
+        assert (await db.fetch_val("PRAGMA journal_mode")).lower() == "wal"
+        assert await db.fetch_val("PRAGMA synchronous") == 1
+
+        pool = db._backend._pool
+        first = pool._idle[0]
+        await db.fetch_val("SELECT 1")
+        assert pool._idle == [first]
+    finally:
+        await db.disconnect()
+
+    assert not pool._idle and not pool._opened
+
+
+@pytest.mark.asyncio
+async def test_read_only_pool_rejects_writes(tmp_path):
+    db = TunedDatabase(
+        f"sqlite:///{tmp_path / 'read.db'}", pool_size=1, pragmas={"query_only": 1}
+    )
+    await db.connect()
+    try:
+        with pytest.raises(Exception):
+            await db.execute("CREATE TABLE t (id INTEGER)")
+    finally:
+        await db.disconnect()
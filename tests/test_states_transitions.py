@@ -1,7 +1,7 @@
 from datetime import datetime, timedelta
 from uuid import uuid4
 from src.domain.entities import MeetingRoom
-from src.domain.states import AvailableState, PartiallyAvailableState, UnavailableState
+from src.domain.states import AvailableState, PartiallyAvailableState
 
 
 def test_initial_state():
@@ -27,11 +27,11 @@ def test_transition_to_partially_available():
     assert len(room.reservations) == 2
 
 
-def test_transition_to_unavailable():
+def test_busy_room_keeps_accepting_free_periods():
     room = MeetingRoom(name="Full Room", capacity=5, location="Test")
     now = datetime.now()
 
-    for i in range(16):
+    for i in range(40):
         success = room.add_reservation(
             uuid4(),
             f"user{i}",
@@ -40,8 +40,11 @@ def test_transition_to_unavailable():
         )
         assert success is True
 
-    assert isinstance(room.state, UnavailableState)
-    assert len(room.reservations) == 16
+    assert isinstance(room.state, PartiallyAvailableState)
+    assert len(room.reservations) == 40
+    assert not room.add_reservation(
+        uuid4(), "user", now + timedelta(minutes=30), now + timedelta(hours=1)
+    )
 
 
 def test_state_recovery_after_cancellation():
@@ -66,3 +69,23 @@ def test_state_recovery_after_cancellation():
     room.cancel_reservation(reservation_ids[0])
     assert isinstance(room.state, AvailableState)
     assert len(room.reservations) == 1
+
+
+def test_states_are_shared_between_rooms():
+    first = MeetingRoom(name="First", capacity=5, location="Test")
+    second = MeetingRoom(name="Second", capacity=5, location="Test")
+    now = datetime.now()
+
+    assert first.state is second.state
+    for room in (first, second):
+        for i in range(2):
+            room.add_reservation(
+                uuid4(),
+                f"user{i}",
+                now + timedelta(hours=i * 2),
+                now + timedelta(hours=(i * 2) + 1),
+            )
+
+    assert first.state is second.state
+    assert first.check_availability(now + timedelta(hours=5), now + timedelta(hours=6))
+    assert not first.check_availability(now, now + timedelta(hours=1))